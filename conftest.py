@@ -0,0 +1 @@
+"""pytest configuration: makes the `scraper` package importable from tests/."""
@@ -0,0 +1,165 @@
+"""
+SQLite-backed canonical event store.
+
+Every scraper's output is upserted here by event id, with indexed columns
+(start time, community, location, source URL) for looking events up with the
+sqlite3 shell. Rows whose content hash is unchanged are left alone, so an
+incremental run only writes the events that actually changed, and the
+per-source counts show what changed since the last run. The store only
+tracks changes: combined_events.json is built from the scraper files
+themselves, and no stage reads events back from here.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Set, Tuple
+
+from scraper.scrapers import json_io
+from scraper.scrapers.event_model import Event, EventValidationError, decode_event, encode_event
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+EVENT_DB_FILE = os.path.join(PROJECT_ROOT, 'data', 'scrapers', 'events.sqlite3')
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS events ('
+    ' id TEXT PRIMARY KEY,'
+    ' source TEXT NOT NULL,'
+    ' start_date TEXT,'
+    ' start_ts REAL,'
+    ' end_ts REAL,'
+    ' community_id TEXT,'
+    ' location_id TEXT,'
+    ' source_url TEXT,'
+    ' content_hash TEXT NOT NULL,'
+    ' data TEXT NOT NULL,'
+    ' updated_at TEXT NOT NULL'
+    ')',
+    'CREATE INDEX IF NOT EXISTS idx_events_start ON events (start_ts)',
+    'CREATE INDEX IF NOT EXISTS idx_events_community ON events (community_id)',
+    'CREATE INDEX IF NOT EXISTS idx_events_location ON events (location_id)',
+    'CREATE INDEX IF NOT EXISTS idx_events_source_url ON events (source_url)',
+    'CREATE INDEX IF NOT EXISTS idx_events_source ON events (source)',
+)
+
+_UPSERT = (
+    'INSERT INTO events (id, source, start_date, start_ts, end_ts, community_id, location_id,'
+    ' source_url, content_hash, data, updated_at)'
+    ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    ' ON CONFLICT(id) DO UPDATE SET'
+    ' source = excluded.source, start_date = excluded.start_date, start_ts = excluded.start_ts,'
+    ' end_ts = excluded.end_ts, community_id = excluded.community_id,'
+    ' location_id = excluded.location_id, source_url = excluded.source_url,'
+    ' content_hash = excluded.content_hash, data = excluded.data, updated_at = excluded.updated_at'
+    ' WHERE events.content_hash != excluded.content_hash OR events.source != excluded.source'
+)
+
+
+def _row(event: Event, source: str, now: str) -> Tuple:
+    data = json_io.dumps(encode_event(event), sort_keys=True)
+    return (
+        event.id,
+        source,
+        event.start_date,
+        event.start_ts,
+        event.end_ts,
+        event.community_id or None,
+        event.location_id or None,
+        event.metadata.source_url or None,
+        hashlib.sha256(data.encode('utf-8')).hexdigest(),
+        data,
+        now,
+    )
+
+
+class EventStore:
+    """Events table keyed by event id, with per-source snapshot replacement."""
+
+    def __init__(self, path: str = EVENT_DB_FILE):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> 'EventStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM events').fetchone()[0]
+
+    def _write(self, events: Iterable[Dict], source: str, seen: Set[str]) -> Dict[str, int]:
+        """
+        Upsert events inside the caller's transaction, recording their ids in
+        seen. An id listed more than once counts once: written if any of its
+        rows changed the table, else unchanged.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        counts = {'written': 0, 'unchanged': 0, 'skipped': 0}
+        changed: Set[str] = set()
+        for item in events:
+            try:
+                event = decode_event(item)
+            except EventValidationError as e:
+                logging.warning(f"Event store: skipping invalid event from {source}: {e}")
+                counts['skipped'] += 1
+                continue
+            seen.add(event.id)
+            if self._conn.execute(_UPSERT, _row(event, source, now)).rowcount:
+                changed.add(event.id)
+        counts['written'] = len(changed)
+        counts['unchanged'] = len(seen) - len(changed)
+        return counts
+
+    def upsert(self, events: Iterable[Dict], source: str) -> Dict[str, int]:
+        """Insert or update events by id. Rows whose content is unchanged are not rewritten."""
+        with self._conn:
+            return self._write(events, source, set())
+
+    def replace_source(self, source: str, events: Iterable[Dict]) -> Dict[str, int]:
+        """
+        Upsert a scraper's full snapshot and delete its rows that are no longer
+        listed. events may be a lazy iterator; only the ids are kept in memory.
+        If iterating fails, the whole snapshot is rolled back.
+        """
+        current_ids: Set[str] = set()
+        with self._conn:
+            counts = self._write(events, source, current_ids)
+            stale = [
+                event_id for (event_id,) in self._conn.execute('SELECT id FROM events WHERE source = ?', (source,))
+                if event_id not in current_ids
+            ]
+            self._conn.executemany('DELETE FROM events WHERE id = ?', ((event_id,) for event_id in stale))
+        counts['deleted'] = len(stale)
+        return counts
+
+    def expire_sources(self, current_sources: Iterable[str]) -> int:
+        """
+        Delete the rows of every source not in current_sources, such as a
+        scraper that produced no output this run. Returns the rows deleted.
+        """
+        keep = set(current_sources)
+        deleted = 0
+        with self._conn:
+            stale = [source for (source,) in self._conn.execute('SELECT DISTINCT source FROM events') if source not in keep]
+            for source in stale:
+                deleted += self._conn.execute('DELETE FROM events WHERE source = ?', (source,)).rowcount
+        return deleted
+
+
+def source_name(file_path: str) -> str:
+    """Store source label for a scraper output file (its file name without extension)."""
+    return os.path.splitext(os.path.basename(file_path))[0]
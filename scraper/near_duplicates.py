@@ -0,0 +1,181 @@
+"""
+Near-duplicate event detection with MinHash signatures and LSH banding.
+
+The same meetup scraped from several sources (Gary's Guide, a Google
+Calendar, a Luma ICS feed) often differs slightly in title or start time, so
+exact signatures miss it. Each event gets a MinHash signature over character
+shingles of its normalized title. Descriptions are left out: one source
+carries a one-line summary and another the full page text, so including them
+pulls the similarity of real duplicates far below any usable threshold.
+Signatures are split into bands, and
+events sharing a band on the same or the next New York calendar day become
+candidate pairs, so only likely matches are ever compared instead of every
+pair. Candidates are confirmed by estimated Jaccard similarity, start-time
+proximity and a shared community or venue (generic titles like "Fall
+Orientation" recur across organizers on the same evening). Confirmed pairs
+are grouped with union-find, most similar first. Two different pages on the
+same site are separate listings, so two groups are never joined if that
+would put different URLs from one site in the same group.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from scraper.scrapers import event_time
+
+# Signature length = BANDS * ROWS_PER_BAND. With 16 bands of 4 rows, pairs
+# with Jaccard ~0.5 become candidates about half the time, and pairs at 0.8 almost always do.
+BANDS = 16
+ROWS_PER_BAND = 4
+NUM_PERMUTATIONS = BANDS * ROWS_PER_BAND
+# Estimated title Jaccard similarity needed to treat a candidate pair as one event
+SIMILARITY_THRESHOLD = 0.6
+# Listings of one event rarely disagree on the start by more than this
+MAX_START_GAP = timedelta(hours=3)
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(20240611)
+_HASH_A = _rng.integers(1, _MERSENNE_PRIME, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_HASH_B = _rng.integers(0, _MERSENNE_PRIME, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def title_shingles(name: str) -> Set[str]:
+    """Character shingles of a title, ignoring case, punctuation and spacing differences."""
+    normalized = re.sub(r'[^a-z0-9]+', ' ', (name or '').lower()).strip()
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(shingles: Set[str]) -> np.ndarray:
+    """NUM_PERMUTATIONS minimum hash values under random universal hashes."""
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode('utf-8')) % _MERSENNE_PRIME for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    return ((_HASH_A[:, None] * hashes[None, :] + _HASH_B[:, None]) % _MERSENNE_PRIME).min(axis=1)
+
+
+# (aware start, or None for a date-only value; New York calendar date)
+Start = Tuple[Optional[datetime], date]
+
+
+def _parse_start(value: str) -> Optional[Start]:
+    if not value:
+        return None
+    parsed = event_time.parse_datetime(value)
+    if parsed is None:
+        return None
+    if len(value.strip()) == 10:
+        # Date-only: no time of day, and no zone to convert from
+        return None, parsed.date()
+    return parsed, parsed.astimezone(event_time.NY_TZ).date()
+
+
+def _starts_close(first: Start, second: Start) -> bool:
+    if first[0] is None or second[0] is None:
+        # A date-only value: the same calendar day is all we can check
+        return first[1] == second[1]
+    return abs(first[0] - second[0]) <= MAX_START_GAP
+
+
+def _same_host_or_venue(first: Dict, second: Dict) -> bool:
+    """Listings of one event share the organizing community or the resolved venue."""
+    community = first.get('communityId')
+    if community and community == second.get('communityId'):
+        return True
+    location = first.get('locationId')
+    return bool(location) and location == second.get('locationId')
+
+
+def _source_pages(event: Dict) -> Dict[str, str]:
+    """{site: page URL} for an event's source URL (empty when it has none)."""
+    url = (event.get('metadata') or {}).get('source_url') or ''
+    host = urlsplit(url).netloc.lower()
+    return {host: url} if host else {}
+
+
+def _distinct_listings(first: Dict[str, str], second: Dict[str, str]) -> bool:
+    """Whether two groups hold different pages on one site, which are different events however alike their titles."""
+    return any(second.get(host, url) != url for host, url in first.items())
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_near_duplicate_groups(events: List[Dict]) -> List[List[int]]:
+    """
+    Return groups (lists of indexes into events, each of size > 1) of events
+    that are probably the same listing. Groups and their members are ordered
+    by first appearance.
+    """
+    signatures: Dict[int, np.ndarray] = {}
+    starts: Dict[int, Start] = {}
+    buckets: Dict[Tuple[date, int, bytes], List[int]] = defaultdict(list)
+
+    for i, event in enumerate(events):
+        shingles = title_shingles(event.get('name') or '')
+        start = _parse_start(event.get('startDate') or '')
+        if not shingles or start is None:
+            continue
+        signature = minhash_signature(shingles)
+        signatures[i] = signature
+        starts[i] = start
+        for band in range(BANDS):
+            band_key = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes()
+            buckets[(start[1], band, band_key)].append(i)
+
+    candidate_pairs: Set[Tuple[int, int]] = set()
+    for (day, band, band_key), members in buckets.items():
+        # Listings a few hours apart can straddle midnight, so also pair with the next day
+        next_day = buckets.get((day + timedelta(days=1), band, band_key), [])
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                candidate_pairs.add((members[a], members[b]))
+            for other in next_day:
+                candidate_pairs.add((min(members[a], other), max(members[a], other)))
+
+    confirmed = []
+    for i, j in candidate_pairs:
+        similarity = float(np.mean(signatures[i] == signatures[j]))
+        if (
+            similarity >= SIMILARITY_THRESHOLD
+            and _starts_close(starts[i], starts[j])
+            and _same_host_or_venue(events[i], events[j])
+        ):
+            confirmed.append((-similarity, i, j))
+
+    parent = list(range(len(events)))
+    # Source pages of each group, keyed by its root
+    pages: Dict[int, Dict[str, str]] = {}
+    for _, i, j in sorted(confirmed):
+        root_i, root_j = _find(parent, i), _find(parent, j)
+        if root_i == root_j:
+            continue
+        pages_i = pages.get(root_i) or _source_pages(events[root_i])
+        pages_j = pages.get(root_j) or _source_pages(events[root_j])
+        if _distinct_listings(pages_i, pages_j):
+            continue
+        root, child = min(root_i, root_j), max(root_i, root_j)
+        parent[child] = root
+        pages[root] = {**pages_i, **pages_j}
+        pages.pop(child, None)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i in signatures:
+        groups[_find(parent, i)].append(i)
+    return sorted((sorted(members) for members in groups.values() if len(members) > 1), key=lambda g: g[0])
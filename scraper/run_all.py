@@ -10,15 +10,21 @@ from datetime import datetime, timedelta, timezone
 import argparse
 import traceback
 import importlib
-from typing import List, Dict, Any
+import multiprocessing
+import multiprocessing.connection
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 import atexit
 import signal
+import sqlite3
+import tempfile
 
 # Add the parent directory (project root) to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import scrapers list
 from scraper.scrapers.calendar_configs import SCRAPERS
+from scraper.scrapers import event_io, image_pipeline, json_io
+from scraper.event_store import EventStore, source_name
 
 # Setup paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__)) # Will be scraper/
@@ -33,6 +39,9 @@ os.makedirs(DATA_DIR, exist_ok=True)
 log_file_handler = None
 cleanup_registered = False
 
+# Scraper processes started by this process (see _run_scrapers_concurrently)
+_active_scrapers: Dict[int, multiprocessing.Process] = {}
+
 def setup_logging():
     global log_file_handler, cleanup_registered
     
@@ -104,6 +113,10 @@ def shutdown_cleanly():
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
+        # Scraper processes are not daemonic, so stop them before exiting
+        for process in list(_active_scrapers.values()):
+            _terminate_scraper(process)
+
         # Make sure no buffered data is left
         sys.stdout.flush()
         sys.stderr.flush()
@@ -121,21 +134,165 @@ signal.signal(signal.SIGINT, lambda signum, frame: shutdown_cleanly())
 # Initialize logging
 setup_logging()
 
-def run_scrapers() -> List[str]:
-    """Run all scrapers and return list of output files."""
+def _run_single_scraper(scraper_name: str):
+    """Import a scraper module from scraper.scrapers and run its main()."""
+    scraper_module = importlib.import_module(f'scraper.scrapers.{scraper_name}')
+    logging.info(f"Running scraper: {scraper_name}")
+    return scraper_module.main()
+
+def _scraper_process_entry(scraper_name: str, conn) -> None:
+    """Child-process entry point: run one scraper and send its result back over a pipe."""
+    # The copy of the parent's process table is not ours to manage
+    _active_scrapers.clear()
+    # Own process group, so a timeout also stops the worker processes the scraper starts
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+    try:
+        conn.send(('ok', _run_single_scraper(scraper_name)))
+    except ImportError as e:
+        conn.send(('import_error', str(e)))
+    except BaseException as e:
+        conn.send(('error', f"{e}\n{traceback.format_exc()}"))
+    finally:
+        conn.close()
+
+def _signal_scraper(process: multiprocessing.Process, sig: int) -> None:
+    """Send sig to a scraper process and everything in its process group."""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, sig)
+            return
+    except ProcessLookupError:
+        # The child has not called setpgrp yet (or already exited)
+        pass
+    if sig == signal.SIGTERM:
+        process.terminate()
+    else:
+        process.kill()
+
+def _terminate_scraper(process: multiprocessing.Process) -> None:
+    """Stop a scraper process and its worker processes, escalating to SIGKILL after 5s."""
+    _active_scrapers.pop(process.pid, None)
+    if not process.is_alive():
+        process.join()
+        return
+    _signal_scraper(process, signal.SIGTERM)
+    process.join(5)
+    if process.is_alive():
+        _signal_scraper(process, signal.SIGKILL)
+        process.join()
+
+def _run_scrapers_concurrently(scraper_names: List[str], workers: int, timeout: Optional[float]) -> List[Any]:
+    """
+    Run each scraper in its own process, at most `workers` at a time.
+    A scraper still running after `timeout` seconds is terminated.
+    The processes are not daemonic, so scrapers can start process pools of
+    their own (image derivatives, category shards); every process still
+    running when this returns or raises is terminated explicitly.
+    Returns one result per scraper in the same order as `scraper_names`
+    (None for scrapers that failed, timed out or produced no output).
+    """
+    results: List[Any] = [None] * len(scraper_names)
+    pending = list(enumerate(scraper_names))
+    running = {}  # process sentinel -> (index, name, process, parent_conn, started_at)
+
+    try:
+        _wait_for_scrapers(pending, running, results, workers, timeout)
+    finally:
+        for _, _, process, parent_conn, _ in running.values():
+            _terminate_scraper(process)
+            parent_conn.close()
+
+    return results
+
+def _wait_for_scrapers(pending: List, running: Dict, results: List[Any], workers: int, timeout: Optional[float]) -> None:
+    """Launch and reap scraper processes until none are pending or running."""
+    while pending or running:
+        # Launch scrapers until the pool is full
+        while pending and len(running) < workers:
+            index, scraper_name = pending.pop(0)
+            logging.info(f"Attempting to run scraper: {scraper_name}")
+            parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_scraper_process_entry,
+                args=(scraper_name, child_conn),
+                name=f"scraper-{scraper_name}",
+                daemon=False,
+            )
+            process.start()
+            _active_scrapers[process.pid] = process
+            child_conn.close()
+            running[process.sentinel] = (index, scraper_name, process, parent_conn, time.monotonic())
+
+        # Wait for a scraper to finish, waking up in time for the nearest deadline
+        wait_for = 1.0
+        if timeout is not None:
+            now = time.monotonic()
+            nearest = min(started + timeout for _, _, _, _, started in running.values())
+            wait_for = max(0.0, min(wait_for, nearest - now))
+        finished = multiprocessing.connection.wait(list(running.keys()), timeout=wait_for)
+
+        now = time.monotonic()
+        for sentinel in list(running.keys()):
+            index, scraper_name, process, parent_conn, started = running[sentinel]
+            if sentinel not in finished:
+                if timeout is not None and now - started >= timeout:
+                    logging.error(f"Scraper {scraper_name} timed out after {timeout:.0f}s, terminating")
+                    _terminate_scraper(process)
+                    parent_conn.close()
+                    del running[sentinel]
+                continue
+
+            status, payload = 'error', f"exited with code {process.exitcode} without reporting a result"
+            try:
+                if parent_conn.poll():
+                    status, payload = parent_conn.recv()
+            except (EOFError, OSError):
+                pass
+            process.join()
+            _active_scrapers.pop(process.pid, None)
+            parent_conn.close()
+            del running[sentinel]
+
+            if status == 'ok':
+                results[index] = payload
+            elif status == 'import_error':
+                logging.error(f"Import error for scraper {scraper_name}: {payload}")
+            else:
+                logging.error(f"Error running scraper {scraper_name}: {payload}")
+
+def run_scrapers(workers: int = 1, timeout: Optional[float] = None) -> List[str]:
+    """
+    Run all scrapers and return list of output files.
+
+    With workers > 1 (or a timeout set) each scraper runs in its own process so a
+    slow site cannot stall the rest of the run; output files are still returned
+    in SCRAPERS order.
+    """
     output_files = []
     successful_scrapers = 0
     failed_scrapers = 0
+
+    if workers > 1 or timeout is not None:
+        logging.info(f"Running {len(SCRAPERS)} scrapers with {max(workers, 1)} workers"
+                     + (f" and a {timeout:.0f}s per-scraper timeout" if timeout is not None else ""))
+        results = _run_scrapers_concurrently(SCRAPERS, max(workers, 1), timeout)
+        for scraper_name, output_file in zip(SCRAPERS, results):
+            if output_file:
+                output_files.append(output_file)
+                successful_scrapers += 1
+                logging.info(f"Scraper {scraper_name} completed successfully")
+            else:
+                logging.error(f"Scraper {scraper_name} failed to produce output")
+                failed_scrapers += 1
+        logging.info(f"Completed running {successful_scrapers} scrapers successfully, {failed_scrapers} failed")
+        return output_files
     
     for scraper_name in SCRAPERS:
         try:
             logging.info(f"Attempting to run scraper: {scraper_name}")
-            # Import the scraper module from scraper.scrapers
-            scraper_module = importlib.import_module(f'scraper.scrapers.{scraper_name}')
-            logging.info(f"Running scraper: {scraper_name}")
-            
-            # Run the scraper
-            output_file = scraper_module.main()
+            # Import the scraper module from scraper.scrapers and run it
+            output_file = _run_single_scraper(scraper_name)
             if output_file:
                 output_files.append(output_file)
                 successful_scrapers += 1
@@ -157,8 +314,117 @@ def run_scrapers() -> List[str]:
     logging.info(f"Completed running {successful_scrapers} scrapers successfully, {failed_scrapers} failed")
     return output_files
 
+def _open_event_store() -> Optional[EventStore]:
+    """The event store, or None (change tracking skipped) when it cannot be opened."""
+    try:
+        return EventStore()
+    except sqlite3.Error as e:
+        logging.error(f"Error opening event store, skipping change tracking: {e}")
+        return None
+
+def _write_combined(f, input_files: List[str]) -> int:
+    """
+    Stream every readable input file's events, in file order, as the "events"
+    array of an indent=2 document, followed by their image manifest. Returns
+    the number of events written.
+
+    Each file is read once: its events go to the output as the event store
+    replaces that source's snapshot. A corrupt or truncated file is left out
+    whole, as when each file was loaded with json.load: the output is
+    truncated back to where the file started. Sources with no output this run
+    are expired from the store. The store only tracks changes; the combined
+    output never depends on it. Image references go to a temporary NDJSON
+    file instead of memory and are read back for the manifest.
+    """
+    store = _open_event_store()
+    readable = []
+    count = 0
+
+    def write_events(events: Iterable[Dict]) -> Iterator[Dict]:
+        nonlocal count
+        for event in events:
+            f.write(',\n' if count else '\n')
+            f.write(event_io.indent_json(json_io.dumps(event, pretty=True), '    '))
+            count += 1
+            image = event.get('image') if isinstance(event, dict) else None
+            if image and event.get('id'):
+                image_refs.write(json_io.dumps({'id': event['id'], 'image': image}) + '\n')
+            yield event
+
+    def rewind(position):
+        """Drop everything written since position, a (output, image refs, count) triple."""
+        nonlocal count
+        output_pos, refs_pos, count = position
+        f.seek(output_pos)
+        f.truncate()
+        image_refs.seek(refs_pos)
+        image_refs.truncate()
+
+    f.write('{\n  "last_updated": ' + json_io.dumps(datetime.now(timezone.utc).isoformat()) + ',\n  "events": [')
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as image_refs:
+        try:
+            for file_path in input_files:
+                # Skip non-string file paths (like True/False values)
+                if not isinstance(file_path, str):
+                    logging.warning(f"Skipping non-string file path: {file_path}")
+                    continue
+                file_start = (f.tell(), image_refs.tell(), count)
+                try:
+                    if store is not None:
+                        try:
+                            counts = store.replace_source(source_name(file_path), write_events(event_io.iter_events(file_path)))
+                            logging.info(
+                                f"Event store: {source_name(file_path)} - {counts['written']} written, "
+                                f"{counts['unchanged']} unchanged, {counts['deleted']} removed"
+                            )
+                        except sqlite3.Error as e:
+                            logging.error(f"Error updating event store, skipping change tracking: {e}")
+                            store.close()
+                            store = None
+                            rewind(file_start)
+                    if store is None:
+                        for _ in write_events(event_io.iter_events(file_path)):
+                            pass
+                except FileNotFoundError:
+                    logging.error(f"File not found: {file_path}")
+                    rewind(file_start)
+                except (json.JSONDecodeError, ValueError):
+                    logging.error(f"Invalid JSON in file: {file_path}")
+                    rewind(file_start)
+                except Exception as e:
+                    logging.error(f"Error reading file {file_path}: {e}")
+                    rewind(file_start)
+                else:
+                    readable.append(file_path)
+
+            if store is not None:
+                try:
+                    expired = store.expire_sources(source_name(file_path) for file_path in readable)
+                    if expired:
+                        logging.info(f"Event store: removed {expired} events from sources with no output this run")
+                except sqlite3.Error as e:
+                    logging.error(f"Error expiring event store sources: {e}")
+        finally:
+            if store is not None:
+                store.close()
+        f.write('\n  ]' if count else ']')
+
+        # Resized WebP variants of downloaded event images, keyed by event id
+        image_refs.seek(0)
+        try:
+            image_manifest = image_pipeline.build_image_manifest(json_io.loads(line) for line in image_refs)
+        except Exception as e:
+            logging.error(f"Error building image manifest: {e}")
+            image_manifest = {}
+    manifest_json = event_io.indent_json(json_io.dumps(image_manifest, pretty=True), '  ')[2:]
+    f.write(',\n  "imageManifest": ' + manifest_json + '\n}')
+    return count
+
 def combine_event_files(input_files: List[str], output_file: str = None) -> str:
-    """Combine multiple event files into one."""
+    """
+    Combine multiple event files into one. Events are streamed from the inputs
+    to the output, so memory use does not grow with the size of the corpus.
+    """
     if not input_files:
         logging.warning("No event files to combine")
         return None
@@ -166,52 +432,28 @@ def combine_event_files(input_files: List[str], output_file: str = None) -> str:
     if not output_file:
         output_file = os.path.join(DATA_DIR, "combined_events.json")
     
-    all_events = []
-    
-    for file_path in input_files:
-        try:
-            # Skip non-string file paths (like True/False values)
-            if not isinstance(file_path, str):
-                logging.warning(f"Skipping non-string file path: {file_path}")
-                continue
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict) and 'events' in data:
-                    all_events.extend(data['events'])
-                elif isinstance(data, list):
-                    all_events.extend(data)
-        except FileNotFoundError:
-            logging.error(f"File not found: {file_path}")
-            continue
-        except json.JSONDecodeError:
-            logging.error(f"Invalid JSON in file: {file_path}")
-            continue
-        except Exception as e:
-            logging.error(f"Error reading file {file_path}: {e}")
-            continue
-    
-    if not all_events:
-        logging.warning("No events collected. Exiting.")
-        return None
-    
     # Create data directory if it doesn't exist (DATA_DIR is scraper/data)
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     
-    # Save combined events
+    # Save combined events; the previous output is only replaced once the new one is complete
+    temp_file = f"{output_file}.tmp"
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "last_updated": datetime.now(timezone.utc).isoformat(),
-                "events": all_events
-            }, f, indent=2, ensure_ascii=False)
-        logging.info(f"Saved {len(all_events)} combined events to {output_file}")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            count = _write_combined(f, input_files)
+        if not count:
+            os.remove(temp_file)
+            logging.warning("No events collected. Exiting.")
+            return None
+        os.replace(temp_file, output_file)
+        logging.info(f"Saved {count} combined events to {output_file}")
         return output_file
     except Exception as e:
         logging.error(f"Error saving combined events: {e}")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
         return None
 
-def run_categorization(input_file: str, output_file: str) -> None:
+def run_categorization(input_file: str, output_file: str, workers: int = 1) -> None:
     """Run event categorization"""
     try:
         # Load auxiliary data from public/data directory
@@ -219,7 +461,7 @@ def run_categorization(input_file: str, output_file: str) -> None:
         
         # Import categorize_main from scraper.categorize_events
         from scraper.categorize_events import main as categorize_main
-        categorize_main(input_file, output_file)
+        categorize_main(input_file, output_file, workers=workers)
         return True
     except Exception as e:
         logging.error(f"Error running categorization: {e}")
@@ -235,15 +477,22 @@ def main():
         parser.add_argument('--append', action='store_true', help='Append to existing events')
         parser.add_argument('--output', help='Output file path')
         parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose logging')
+        parser.add_argument('--workers', type=int, default=1, help='Number of scrapers (and categorization processes) to run in parallel (1 = sequential)')
+        parser.add_argument('--scraper-timeout', type=float, default=None, help='Terminate any scraper running longer than this many seconds')
+        parser.add_argument('--output-format', choices=event_io.OUTPUT_FORMATS, default=None, help='Format of per-scraper output files (default: json, or $SCRAPER_OUTPUT_FORMAT)')
         args = parser.parse_args()
         
+        # Scrapers (including ones run in child processes) read the format from the environment
+        if args.output_format:
+            os.environ[event_io.OUTPUT_FORMAT_ENV] = args.output_format
+        
         # Set logging level based on verbose flag
         if args.verbose:
             logging.getLogger().setLevel(logging.DEBUG)
             logging.debug("Verbose logging enabled")
         
         # Run scrapers
-        event_files = run_scrapers()
+        event_files = run_scrapers(workers=args.workers, timeout=args.scraper_timeout)
         
         if not event_files:
             logging.error("No event files were generated. Exiting.")
@@ -258,7 +507,7 @@ def main():
             else:
                 # Run categorization
                 final_output_file = os.path.join(TECH_DIR, 'public', 'data', 'events.json')
-                if run_categorization(combined_file, final_output_file):
+                if run_categorization(combined_file, final_output_file, workers=args.workers):
                     success = True
                 else:
                     logging.error("Categorization failed. Exiting.")
@@ -1,15 +1,15 @@
 import os
-import json
-import requests
 import hashlib
 import logging
-import pytz
 import re
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 from datetime import datetime
 from urllib.parse import urljoin
 
+from . import event_io, event_time, http_cache, http_client
+from .event_model import Event, EventMetadata, Price, Venue
+
 # Setup paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 TECH_DIR = os.path.dirname(os.path.dirname(os.path.dirname(SCRIPT_DIR)))
@@ -24,6 +24,8 @@ logging.basicConfig(
 # Betaworks community ID
 BETAWORKS_COMMUNITY_ID = "com_betaworks"
 BETAWORKS_URL = "https://www.betaworks.com/events"
+# Bump when _parse_event_cards changes so cached card lists are discarded
+CARDS_PARSE_VERSION = "1"
 
 # Browser headers to mimic a real browser request
 HEADERS = {
@@ -65,9 +67,9 @@ def parse_date_time(date_str: str, time_str: str = "") -> tuple:
             logging.warning(f"Could not parse date: {date_str}")
             return None, None
         
-        # If no year provided, assume current year
+        # If no year provided, assume the current year in New York
         if parsed_date.year == 1900:
-            parsed_date = parsed_date.replace(year=datetime.now().year)
+            parsed_date = parsed_date.replace(year=datetime.now(event_time.NY_TZ).year)
         
         # Parse time if provided and not already in the date string
         start_time = parsed_date
@@ -99,9 +101,8 @@ def parse_date_time(date_str: str, time_str: str = "") -> tuple:
                 end_time = start_time.replace(hour=(start_time.hour + 2) % 24)
         
         # Make timezone-aware (Eastern Time)
-        et = pytz.timezone('America/New_York')
-        start_time = et.localize(start_time)
-        end_time = et.localize(end_time)
+        start_time = event_time.NY_TZ.localize(start_time)
+        end_time = event_time.NY_TZ.localize(end_time)
         
         return start_time.isoformat(), end_time.isoformat()
         
@@ -113,7 +114,7 @@ def extract_event_details(event_url: str) -> Optional[Dict]:
     """Extract detailed event information from individual event page"""
     try:
         logging.info(f"Fetching event details from: {event_url}")
-        response = requests.get(event_url, headers=HEADERS, timeout=10)
+        response = http_client.get(event_url, headers=HEADERS, timeout=10)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
         
@@ -204,55 +205,65 @@ def extract_event_details(event_url: str) -> Optional[Dict]:
         logging.error(f"Error extracting event details from {event_url}: {e}")
         return None
 
+def _parse_event_cards(response) -> List[Dict]:
+    """Event cards in the feed grid: URL, title and label of each event."""
+    soup = BeautifulSoup(response.text, 'html.parser')
+    
+    # Find all event links in the feed grid
+    event_links = soup.find_all('a', class_='feed-div')
+    logging.info(f"Found {len(event_links)} event links")
+    
+    cards = []
+    for link in event_links:
+        # Extract basic info from the event card
+        event_url = link.get('href')
+        if not event_url:
+            continue
+        
+        # Make URL absolute if it's relative
+        if not event_url.startswith('http'):
+            event_url = urljoin(BETAWORKS_URL, event_url)
+        
+        # Skip non-event links (like Vimeo, external sites, etc.)
+        if not event_url.startswith('https://www.betaworks.com/event/'):
+            logging.info(f"Skipping non-event link: {event_url}")
+            continue
+        
+        # Extract title from the card
+        title_elem = link.find('h3', class_='calendar-event-title')
+        if not title_elem:
+            title_elem = link.find('h3')
+        title = safe_extract_text(title_elem, "Untitled Event")
+        
+        # Skip events without proper titles
+        if not title or title == "Untitled Event":
+            logging.info(f"Skipping event without proper title: {event_url}")
+            continue
+        
+        # Extract event type/label
+        label_elem = link.find('h4', class_='label')
+        
+        cards.append({
+            'url': event_url,
+            'title': title,
+            'event_label': safe_extract_text(label_elem, ""),
+        })
+    return cards
+
 def scrape_betaworks_events() -> List[Dict]:
     """Scrape all events from Betaworks events page"""
     events = []
     
     try:
         logging.info(f"Fetching Betaworks events from {BETAWORKS_URL}")
-        response = requests.get(BETAWORKS_URL, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find all event links in the feed grid
-        event_links = soup.find_all('a', class_='feed-div')
-        logging.info(f"Found {len(event_links)} event links")
+        # An unchanged events page (304) reuses the cards parsed on a previous run
+        cards = http_cache.fetch_parsed(BETAWORKS_URL, _parse_event_cards, CARDS_PARSE_VERSION, headers=HEADERS, timeout=10)
         
-        for link in event_links:
+        for card in cards:
             try:
-                # Extract basic info from the event card
-                event_url = link.get('href')
-                if not event_url:
-                    continue
-                
-                # Make URL absolute if it's relative
-                if not event_url.startswith('http'):
-                    event_url = urljoin(BETAWORKS_URL, event_url)
-                
-                # Skip non-event links (like Vimeo, external sites, etc.)
-                if not event_url.startswith('https://www.betaworks.com/event/'):
-                    logging.info(f"Skipping non-event link: {event_url}")
-                    continue
-                
-                # Extract title from the card
-                title_elem = link.find('h3', class_='calendar-event-title')
-                if not title_elem:
-                    title_elem = link.find('h3')
-                title = safe_extract_text(title_elem, "Untitled Event")
-                
-                # Skip events without proper titles
-                if not title or title == "Untitled Event":
-                    logging.info(f"Skipping event without proper title: {event_url}")
-                    continue
-                
-                # Extract date from the card
-                date_elem = link.find('div', string=re.compile(r'\w+, \w+ \d+, \d{4}'))
-                date_str = safe_extract_text(date_elem, "")
-                
-                # Extract event type/label
-                label_elem = link.find('h4', class_='label')
-                event_label = safe_extract_text(label_elem, "")
+                event_url = card['url']
+                title = card['title']
+                event_label = card['event_label']
                 
                 # Get detailed event information
                 event_details = extract_event_details(event_url)
@@ -274,44 +285,40 @@ def scrape_betaworks_events() -> List[Dict]:
                     event_id = f"evt_betaworks_{event_id_hash}"
                     
                     # Create event object
-                    event = {
-                        "id": event_id,
-                        "name": event_title,
-                        "type": event_type,
-                        "locationId": "loc_betaworks",
-                        "communityId": BETAWORKS_COMMUNITY_ID,
-                        "description": event_description,
-                        "startDate": start_date,
-                        "endDate": end_date,
-                        "category": ["Tech", "Innovation", "Startup"],
-                        "price": {
-                            "amount": 0,
-                            "type": "Free",
-                            "currency": "USD",
-                            "details": "Most Betaworks events are free"
-                        },
-                        "capacity": 100,
-                        "registrationRequired": True,
-                        "tags": ["betaworks", "innovation", "tech"],
-                        "image": "betaworks-event.jpg",
-                        "status": "upcoming",
-                        "metadata": {
-                            "source_url": event_url,
-                            "registration_url": registration_url,
-                            "event_label": event_label,
-                            "organizer": {
-                                "name": "Betaworks",
-                                "email": "hello@betaworks.com"
-                            },
-                            "venue": {
-                                "name": "Betaworks",
-                                "address": "29 Little West 12th Street, New York, NY 10014",
-                                "type": "Tech Space"
+                    event = Event(
+                        id=event_id,
+                        name=event_title,
+                        type=event_type,
+                        location_id="loc_betaworks",
+                        community_id=BETAWORKS_COMMUNITY_ID,
+                        description=event_description,
+                        start_date=start_date,
+                        end_date=end_date,
+                        category=["Tech", "Innovation", "Startup"],
+                        price=Price(details="Most Betaworks events are free"),
+                        capacity=100,
+                        registration_required=True,
+                        tags=["betaworks", "innovation", "tech"],
+                        image="betaworks-event.jpg",
+                        metadata=EventMetadata(
+                            source_url=event_url,
+                            extra={
+                                "registration_url": registration_url,
+                                "event_label": event_label,
+                                "organizer": {
+                                    "name": "Betaworks",
+                                    "email": "hello@betaworks.com"
+                                },
+                                "featured": False,
+                                "image_url": image_url
                             },
-                            "featured": False,
-                            "image_url": image_url
-                        }
-                    }
+                            venue=Venue(
+                                name="Betaworks",
+                                address="29 Little West 12th Street, New York, NY 10014",
+                                type="Tech Space"
+                            ),
+                        ),
+                    ).to_dict()
                     
                     events.append(event)
                     logging.info(f"Processed event: {event_title}")
@@ -341,8 +348,7 @@ def main():
         # Save to file
         output_file = os.path.join(DATA_DIR, 'betaworks_events.json')
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump({"events": events}, f, indent=2, ensure_ascii=False)
+            output_file = event_io.write_events(output_file, events)
             logging.info(f"Saved {len(events)} events to {output_file}")
             return output_file
         except Exception as e:
@@ -3,18 +3,19 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import os
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urljoin
 
 import pytz
-import requests
 from bs4 import BeautifulSoup
 
+from . import event_io, event_time, http_cache
+from .event_model import Event, EventMetadata, Price, Venue
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
 DATA_DIR = os.path.join(PROJECT_ROOT, 'data', 'scrapers')
@@ -29,12 +30,13 @@ NY_TZ = pytz.timezone('America/New_York')
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
 }
+# Bump when scrape_upcoming_cards or _parse_detail output changes so cached parses are discarded
+PARSE_VERSION = '1'
 
 
-def _fetch(url: str) -> str:
-    response = requests.get(url, headers=HEADERS, timeout=30)
-    response.raise_for_status()
-    return response.text
+def _fetch_parsed(url: str, parse: Callable[[str], Any]) -> Any:
+    """parse(page HTML), reusing the previous run's result when the page is unchanged (304)."""
+    return http_cache.fetch_parsed(url, lambda response: parse(response.text), PARSE_VERSION, headers=HEADERS, timeout=30)
 
 
 def _parse_detail_datetime(text: str) -> Optional[str]:
@@ -71,7 +73,7 @@ def _parse_list_date(date_text: str, poster_alt: str = '') -> Optional[str]:
     alt = poster_alt or ''
     match = re.search(r'(\d{1,2}(?::\d{2})?\s*(?:am|pm))\s*to\s*(\d{1,2}(?::\d{2})?\s*(?:am|pm))', alt, re.I)
     if match:
-        day = datetime.fromisoformat(start_iso).astimezone(NY_TZ).strftime('%Y-%m-%d')
+        day = event_time.parse_datetime(start_iso).astimezone(NY_TZ).strftime('%Y-%m-%d')
         start_local = _parse_detail_datetime(f"{day} {match.group(1).upper().replace(' ', '')}")
         # above may fail; try with space
         if not start_local:
@@ -79,7 +81,7 @@ def _parse_list_date(date_text: str, poster_alt: str = '') -> Optional[str]:
             raw = re.sub(r'(\d)([ap]m)', r'\1 \2', raw)
             try:
                 t = datetime.strptime(raw, '%I:%M %p' if ':' in raw else '%I %p')
-                base = datetime.fromisoformat(start_iso).astimezone(NY_TZ).replace(
+                base = event_time.parse_datetime(start_iso).astimezone(NY_TZ).replace(
                     hour=t.hour, minute=t.minute, second=0, microsecond=0
                 )
                 start_local = base.astimezone(pytz.utc).isoformat()
@@ -92,11 +94,15 @@ def _parse_list_date(date_text: str, poster_alt: str = '') -> Optional[str]:
 def _enrich_from_detail(path: str) -> Dict:
     url = urljoin(BASE_URL, path)
     try:
-        soup = BeautifulSoup(_fetch(url), 'html.parser')
+        detail = _fetch_parsed(url, _parse_detail)
     except Exception as exc:
         logging.warning(f'Could not fetch Boshi detail {url}: {exc}')
         return {'url': url}
+    return {'url': url, **detail}
+
 
+def _parse_detail(html: str) -> Dict:
+    soup = BeautifulSoup(html, 'html.parser')
     date_el = None
     for sel in ['[class*=date]', 'time', 'h2', 'h3']:
         for el in soup.select(sel):
@@ -117,7 +123,6 @@ def _enrich_from_detail(path: str) -> Dict:
                 break
 
     return {
-        'url': url,
         'datetime_text': date_el or '',
         'description': desc,
         'startDate': _parse_detail_datetime(date_el or ''),
@@ -168,64 +173,57 @@ def convert_card(card: Dict) -> Optional[Dict]:
         return None
 
     # Default 2-hour duration when end unknown
-    try:
-        end = (datetime.fromisoformat(start) + timedelta(hours=2)).isoformat()
-    except Exception:
-        end = start
+    start_dt = event_time.parse_datetime(start)
+    end = (start_dt + timedelta(hours=2)).isoformat() if start_dt is not None else start
 
     # Poster alt often has "free/donation"
     alt = (card.get('poster_alt') or '').lower()
-    price = {
-        'amount': 0,
-        'type': 'Free',
-        'currency': 'USD',
-        'details': 'Free / donation' if 'donation' in alt or 'free' in alt else 'See event page',
-    }
+    price = Price(details='Free / donation' if 'donation' in alt or 'free' in alt else 'See event page')
 
     title = card['name']
     event_id = f"evt_boshis_{hashlib.md5(f'{title}{start}'.encode()).hexdigest()[:8]}"
     description = detail.get('description') or card.get('description') or ''
 
-    return {
-        'id': event_id,
-        'name': title,
-        'type': 'Creative',
-        'locationId': LOCATION_ID,
-        'communityId': COMMUNITY_ID,
-        'description': description,
-        'startDate': start,
-        'endDate': end,
-        'category': ['Arts', 'Community', 'Games'],
-        'price': price,
-        'capacity': None,
-        'registrationRequired': False,
-        'tags': ['boshi', 'brooklyn'],
-        'image': card.get('image') or '',
-        'status': 'upcoming',
-        'metadata': {
-            'source': "Boshi's Place",
-            'source_url': detail.get('url') or urljoin(BASE_URL, card.get('href') or '/events/'),
-            'organizer': {
-                'name': "Boshi's Place",
-                'website': BASE_URL,
-                'instagram': '@boshisplace',
-                'email': 'hello@boshis.place',
+    return Event(
+        id=event_id,
+        name=title,
+        type='Creative',
+        location_id=LOCATION_ID,
+        community_id=COMMUNITY_ID,
+        description=description,
+        start_date=start,
+        end_date=end,
+        category=['Arts', 'Community', 'Games'],
+        price=price,
+        capacity=None,
+        registration_required=False,
+        tags=['boshi', 'brooklyn'],
+        image=card.get('image') or '',
+        metadata=EventMetadata(
+            source_url=detail.get('url') or urljoin(BASE_URL, card.get('href') or '/events/'),
+            extra={
+                'source': "Boshi's Place",
+                'organizer': {
+                    'name': "Boshi's Place",
+                    'website': BASE_URL,
+                    'instagram': '@boshisplace',
+                    'email': 'hello@boshis.place',
+                },
+                'featured': False,
             },
-            'venue': {
-                'name': "Boshi's Place",
-                'address': '1002 Metropolitan Ave, Brooklyn, NY 11211',
-                'type': 'Community Space',
-            },
-            'featured': False,
-        },
-    }
+            venue=Venue(
+                name="Boshi's Place",
+                address='1002 Metropolitan Ave, Brooklyn, NY 11211',
+                type='Community Space',
+            ),
+        ),
+    ).to_dict()
 
 
 def main() -> Optional[str]:
     os.makedirs(DATA_DIR, exist_ok=True)
     logging.info(f'Fetching Boshi events from {EVENTS_URL}')
-    html = _fetch(EVENTS_URL)
-    cards = scrape_upcoming_cards(html)
+    cards = _fetch_parsed(EVENTS_URL, scrape_upcoming_cards)
     logging.info(f'Found {len(cards)} upcoming Boshi event cards')
 
     events = []
@@ -235,8 +233,7 @@ def main() -> Optional[str]:
             events.append(converted)
 
     output_file = os.path.join(DATA_DIR, 'boshis_events.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({'events': events}, f, indent=2, ensure_ascii=False)
+    output_file = event_io.write_events(output_file, events)
     logging.info(f'Saved {len(events)} Boshi events to {output_file}')
     return output_file
 
@@ -0,0 +1,184 @@
+"""Shared reader/writer for scraper event files.
+
+Scrapers write their output through EventWriter. In the default 'json' format
+that is a {"events": [...]} document: compact, one event per line, or the
+indent=2 layout with pretty=True. In 'ndjson' format
+(SCRAPER_OUTPUT_FORMAT=ndjson, or run_all --output-format ndjson) it is one
+event per line in a .ndjson file next to where the .json would be. Either
+way events are written as they arrive, to a temp file that replaces the
+previous output only once it is complete.
+
+iter_events() reads any of these lazily: NDJSON line by line, JSON documents
+incrementally with ijson when it is installed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+from . import json_io
+from .event_model import Event, EventValidationError, encode_event, normalize_event
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; JSON documents are then parsed whole
+    ijson = None
+
+OUTPUT_FORMAT_ENV = 'SCRAPER_OUTPUT_FORMAT'
+OUTPUT_FORMATS = ('json', 'ndjson')
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+
+def output_format() -> str:
+    """Configured scraper output format ('json' unless SCRAPER_OUTPUT_FORMAT says otherwise)."""
+    fmt = os.environ.get(OUTPUT_FORMAT_ENV, 'json').strip().lower()
+    return fmt if fmt in OUTPUT_FORMATS else 'json'
+
+
+def output_path(path: str, fmt: Optional[str] = None) -> str:
+    """The file a scraper should write for path (a .json name) in the given format."""
+    if (fmt or output_format()) == 'ndjson':
+        return f"{os.path.splitext(path)[0]}.ndjson"
+    return path
+
+
+def is_ndjson(path: str) -> bool:
+    return path.lower().endswith(NDJSON_EXTENSIONS)
+
+
+def indent_json(text: str, prefix: str) -> str:
+    """Prefix every line of a JSON dump. Splits on '\\n' only: textwrap.indent would also break at U+2028."""
+    return '\n'.join(prefix + line for line in text.split('\n'))
+
+
+class EventWriter:
+    """
+    Write events one at a time to a scraper output file. extra holds top-level
+    keys written before "events" in JSON format (ignored for NDJSON).
+    Events are validated against the shared schema and written in canonical
+    form; invalid ones are logged and skipped.
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None, extra: Optional[Dict] = None, pretty: bool = False):
+        self.path = output_path(path, fmt)
+        self.ndjson = is_ndjson(self.path)
+        self.pretty = pretty and not self.ndjson
+        self.count = 0
+        self.skipped = 0
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._temp_path = f"{self.path}.tmp"
+        self._file = open(self._temp_path, 'w', encoding='utf-8')
+        if self.pretty:
+            self._file.write('{')
+            for key, value in (extra or {}).items():
+                value_json = indent_json(json_io.dumps(value, pretty=True), '  ')[2:]
+                self._file.write(f'\n  {json_io.dumps(key)}: {value_json},')
+            self._file.write('\n  "events": [')
+        elif not self.ndjson:
+            self._file.write('{')
+            for key, value in (extra or {}).items():
+                self._file.write(f'{json_io.dumps(key)}:{json_io.dumps(value)},')
+            self._file.write('"events":[')
+
+    def write(self, event: Union[Event, Dict]) -> None:
+        if isinstance(event, Event):
+            event = encode_event(event)
+        else:
+            try:
+                event = normalize_event(event)
+            except EventValidationError as e:
+                event_id = event.get('id') if isinstance(event, dict) else None
+                logging.warning(f"Skipping invalid event {event_id or '?'} in {self.path}: {e}")
+                self.skipped += 1
+                return
+        if self.ndjson:
+            self._file.write(json_io.dumps(event) + '\n')
+        elif self.pretty:
+            self._file.write(',\n' if self.count else '\n')
+            self._file.write(indent_json(json_io.dumps(event, pretty=True), '    '))
+        else:
+            self._file.write(',\n' if self.count else '\n')
+            self._file.write(json_io.dumps(event))
+        self.count += 1
+
+    def write_many(self, events: Iterable[Union[Event, Dict]]) -> None:
+        for event in events:
+            self.write(event)
+
+    def close(self) -> None:
+        """Finish the file and move it into place."""
+        if self._file.closed:
+            return
+        if self.pretty:
+            self._file.write('\n  ]\n}' if self.count else ']\n}')
+        elif not self.ndjson:
+            self._file.write('\n]}' if self.count else ']}')
+        self._file.close()
+        os.replace(self._temp_path, self.path)
+        if self.skipped:
+            logging.warning(f"Wrote {self.count} events to {self.path}, skipped {self.skipped} invalid")
+
+    def abort(self) -> None:
+        """Discard what was written, leaving any previous output untouched."""
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def __enter__(self) -> 'EventWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_events(
+    path: str,
+    events: Iterable[Union[Event, Dict]],
+    fmt: Optional[str] = None,
+    extra: Optional[Dict] = None,
+    pretty: bool = False,
+) -> str:
+    """Write events to a scraper output file and return the path actually written."""
+    with EventWriter(path, fmt, extra, pretty) as writer:
+        writer.write_many(events)
+    return writer.path
+
+
+def iter_events(path: str) -> Iterator[Dict]:
+    """
+    Yield the events in an event file one at a time: NDJSON (one event per
+    line), a {"events": [...]} document or a bare list.
+    """
+    if is_ndjson(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json_io.loads(line)
+        return
+    with open(path, 'rb') as f:
+        if ijson is None:
+            data = json_io.loads(f.read())
+            if isinstance(data, dict):
+                yield from data.get('events', [])
+            elif isinstance(data, list):
+                yield from data
+            return
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        yield from ijson.items(f, 'item' if first == b'[' else 'events.item', use_float=True)
+
+
+def find_output(path: str) -> Optional[str]:
+    """An existing output for path (a .json name) in the configured format, else in either format."""
+    for candidate in (output_path(path), path, output_path(path, 'ndjson')):
+        if os.path.exists(candidate):
+            return candidate
+    return None
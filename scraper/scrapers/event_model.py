@@ -0,0 +1,292 @@
+"""Typed model of the shared event schema every scraper produces.
+
+Events are plain dicts on disk and in JSON ({"id", "name", ..., "metadata":
+{"source_url", "venue": {...}, ...}}). decode_event() validates such a dict
+and turns it into slotted dataclasses; encode_event() turns it back into the
+same JSON shape, including key order. After decoding, every field has its
+documented type (strings are never None, venue is always a Venue, tags is
+always a list of strings), so consumers can use attribute access without
+re-checking shapes.
+
+Metadata keys beyond source_url and venue vary by source and stay in
+EventMetadata.extra in their original order. Decoding also parses the dates
+once into UTC epoch seconds (Event.start_ts / end_ts, see event_time); those
+are not part of the JSON.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from . import event_time
+
+Category = Union[List[str], Dict[str, str]]
+
+
+class EventValidationError(ValueError):
+    """An event dict does not match the shared schema."""
+
+
+@dataclass(slots=True)
+class Price:
+    amount: Union[int, float] = 0
+    type: str = 'Free'
+    currency: str = 'USD'
+    details: str = ''
+
+
+@dataclass(slots=True)
+class Venue:
+    name: str = ''
+    address: str = ''
+    type: str = 'Other'
+
+
+@dataclass(slots=True)
+class EventMetadata:
+    source_url: str = ''
+    venue: Venue = field(default_factory=Venue)
+    # Every other metadata key (organizer, speakers, source, luma_host, ...), in source order
+    extra: Dict[str, Any] = field(default_factory=dict)
+    # Key order of the decoded dict, so encoding reproduces it
+    key_order: Tuple[str, ...] = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == 'source_url':
+            return self.source_url
+        if key == 'venue':
+            return self.venue
+        return self.extra.get(key, default)
+
+
+@dataclass(slots=True)
+class Event:
+    id: str
+    name: str
+    start_date: str
+    end_date: str = ''
+    type: str = ''
+    location_id: str = ''
+    community_id: str = ''
+    description: str = ''
+    category: Category = field(default_factory=list)
+    price: Price = field(default_factory=Price)
+    capacity: Optional[int] = None
+    registration_required: Optional[bool] = None
+    tags: List[str] = field(default_factory=list)
+    image: str = ''
+    status: str = 'upcoming'
+    metadata: EventMetadata = field(default_factory=EventMetadata)
+    # UTC epoch seconds, filled in by decode_event (not serialized)
+    start_ts: Optional[float] = field(default=None, compare=False, repr=False)
+    end_ts: Optional[float] = field(default=None, compare=False, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return encode_event(self)
+
+    @classmethod
+    def from_dict(cls, data: Any) -> 'Event':
+        return decode_event(data)
+
+
+def _string(value: Any, path: str, required: bool = False) -> str:
+    if value is None:
+        value = ''
+    if not isinstance(value, str):
+        raise EventValidationError(f"{path}: expected a string, got {type(value).__name__}")
+    if required and not value.strip():
+        raise EventValidationError(f"{path}: must not be empty")
+    return value
+
+
+def _date(value: Any, path: str, required: bool = False, end_of_day: bool = False) -> Tuple[str, Optional[float]]:
+    value = _string(value, path, required)
+    if not value:
+        return value, None
+    timestamp = event_time.to_epoch(value, end_of_day=end_of_day)
+    if timestamp is None:
+        raise EventValidationError(f"{path}: not an ISO date/datetime: {value!r}")
+    return value, timestamp
+
+
+def _number(value: Any, path: str) -> Union[int, float]:
+    if value is None or value == '':
+        return 0
+    if isinstance(value, bool):
+        raise EventValidationError(f"{path}: expected a number, got bool")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value.replace('$', '').replace(',', ''))
+        except ValueError:
+            pass
+    raise EventValidationError(f"{path}: expected a number, got {value!r}")
+
+
+def _optional_int(value: Any, path: str) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        raise EventValidationError(f"{path}: expected an integer, got bool")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    raise EventValidationError(f"{path}: expected an integer, got {value!r}")
+
+
+def _optional_bool(value: Any, path: str) -> Optional[bool]:
+    if value is None or isinstance(value, bool):
+        return value
+    raise EventValidationError(f"{path}: expected a boolean, got {type(value).__name__}")
+
+
+def _strings(value: Any, path: str) -> List[str]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise EventValidationError(f"{path}: expected a list, got {type(value).__name__}")
+    for i, item in enumerate(value):
+        if not isinstance(item, str):
+            raise EventValidationError(f"{path}[{i}]: expected a string, got {type(item).__name__}")
+    return value
+
+
+def _category(value: Any) -> Category:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _string(item, f"category.{key}")
+        return value
+    return _strings(value, 'category')
+
+
+def _price(value: Any) -> Price:
+    if value is None:
+        return Price()
+    if not isinstance(value, dict):
+        raise EventValidationError(f"price: expected an object, got {type(value).__name__}")
+    return Price(
+        amount=_number(value.get('amount'), 'price.amount'),
+        type=_string(value.get('type'), 'price.type') or 'Free',
+        currency=_string(value.get('currency'), 'price.currency') or 'USD',
+        details=_string(value.get('details'), 'price.details'),
+    )
+
+
+def _venue(value: Any) -> Venue:
+    if value is None:
+        return Venue()
+    if isinstance(value, str):
+        return Venue(name=value)
+    if not isinstance(value, dict):
+        raise EventValidationError(f"metadata.venue: expected an object, got {type(value).__name__}")
+    return Venue(
+        name=_string(value.get('name'), 'metadata.venue.name'),
+        address=_string(value.get('address'), 'metadata.venue.address'),
+        type=_string(value.get('type'), 'metadata.venue.type') or 'Other',
+    )
+
+
+def _metadata(value: Any) -> EventMetadata:
+    if value is None:
+        return EventMetadata()
+    if not isinstance(value, dict):
+        raise EventValidationError(f"metadata: expected an object, got {type(value).__name__}")
+    return EventMetadata(
+        source_url=_string(value.get('source_url'), 'metadata.source_url'),
+        venue=_venue(value.get('venue')),
+        extra={key: item for key, item in value.items() if key not in ('source_url', 'venue')},
+        key_order=tuple(value),
+    )
+
+
+def decode_event(data: Any) -> Event:
+    """Validate an event dict and convert it to an Event. Raises EventValidationError."""
+    if not isinstance(data, dict):
+        raise EventValidationError(f"event: expected an object, got {type(data).__name__}")
+    start_date, start_ts = _date(data.get('startDate'), 'startDate', required=True)
+    end_date, end_ts = _date(data.get('endDate') or start_date, 'endDate', end_of_day=True)
+    return Event(
+        id=_string(data.get('id'), 'id', required=True),
+        name=_string(data.get('name'), 'name'),
+        start_date=start_date,
+        end_date=end_date,
+        type=_string(data.get('type'), 'type'),
+        location_id=_string(data.get('locationId'), 'locationId'),
+        community_id=_string(data.get('communityId'), 'communityId'),
+        description=_string(data.get('description'), 'description'),
+        category=_category(data.get('category')),
+        price=_price(data.get('price')),
+        capacity=_optional_int(data.get('capacity'), 'capacity'),
+        registration_required=_optional_bool(data.get('registrationRequired'), 'registrationRequired'),
+        tags=_strings(data.get('tags'), 'tags'),
+        image=_string(data.get('image'), 'image'),
+        status=_string(data.get('status'), 'status') or 'upcoming',
+        metadata=_metadata(data.get('metadata')),
+        start_ts=start_ts,
+        end_ts=end_ts,
+    )
+
+
+def _encode_metadata(metadata: EventMetadata) -> Dict[str, Any]:
+    venue = metadata.venue
+    known = {
+        'source_url': metadata.source_url,
+        'venue': {'name': venue.name, 'address': venue.address, 'type': venue.type},
+    }
+    # Events built in code (no decoded order) put source_url first and venue last
+    order = metadata.key_order or ('source_url', *metadata.extra, 'venue')
+    encoded: Dict[str, Any] = {}
+    for key in order:
+        if key in known:
+            encoded[key] = known[key]
+        elif key in metadata.extra:
+            encoded[key] = metadata.extra[key]
+    for key, value in metadata.extra.items():
+        encoded.setdefault(key, value)
+    for key, value in known.items():
+        encoded.setdefault(key, value)
+    return encoded
+
+
+def encode_event(event: Event) -> Dict[str, Any]:
+    """The event in the shared JSON shape."""
+    price = event.price
+    return {
+        'id': event.id,
+        'name': event.name,
+        'type': event.type,
+        'locationId': event.location_id,
+        'communityId': event.community_id,
+        'description': event.description,
+        'startDate': event.start_date,
+        'endDate': event.end_date,
+        'category': event.category,
+        'price': {'amount': price.amount, 'type': price.type, 'currency': price.currency, 'details': price.details},
+        'capacity': event.capacity,
+        'registrationRequired': event.registration_required,
+        'tags': event.tags,
+        'image': event.image,
+        'status': event.status,
+        'metadata': _encode_metadata(event.metadata),
+    }
+
+
+def normalize_event(data: Any) -> Dict[str, Any]:
+    """Validate an event dict and return it in canonical form. Raises EventValidationError."""
+    return encode_event(decode_event(data))
+
+
+def decode_events(items: Iterable[Any], source: str = '') -> Iterator[Event]:
+    """Decode events, logging and skipping the ones that fail validation."""
+    for item in items:
+        try:
+            yield decode_event(item)
+        except EventValidationError as e:
+            event_id = item.get('id') if isinstance(item, dict) else None
+            logging.warning(f"Skipping invalid event {event_id or '?'}{f' from {source}' if source else ''}: {e}")
@@ -0,0 +1,142 @@
+"""Shared event time handling.
+
+startDate/endDate strings are parsed once into UTC epoch seconds (parsing is
+memoized, since the same strings are seen by several stages), and time
+filters run over NumPy arrays of those values for the whole corpus instead
+of calling datetime.now() and fromisoformat() per event.
+
+Conventions, matching what the scrapers have always assumed:
+- 'Z' suffixes and 'YYYY-MM-DD HH:MM' (space separator) are accepted.
+- Naive values are UTC unless a different naive_tz is passed.
+- A date-only start is midnight UTC; a date-only end is 23:59:59 UTC.
+- An event with no endDate ends at its start (end of day if date-only),
+  the same as an event whose endDate was filled in from startDate.
+- Missing or unparseable values are NaN in arrays and never pass a filter.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import time
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+
+NY_TZ = pytz.timezone('America/New_York')
+
+
+def parse_datetime(value: object, naive_tz: tzinfo = pytz.utc) -> Optional[datetime]:
+    """Timezone-aware datetime for an ISO date/datetime string or datetime, or None."""
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    elif isinstance(value, str) and value.strip():
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace(' ', 'T', 1).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is None:
+        parsed = naive_tz.localize(parsed) if hasattr(naive_tz, 'localize') else parsed.replace(tzinfo=naive_tz)
+    return parsed
+
+
+@functools.lru_cache(maxsize=65536)
+def _string_epoch(value: str, end_of_day: bool, naive_tz: tzinfo) -> Optional[float]:
+    parsed = parse_datetime(value, naive_tz)
+    if parsed is None:
+        return None
+    if end_of_day and 'T' not in value and ' ' not in value.strip():
+        parsed = parsed.replace(hour=23, minute=59, second=59)
+    return parsed.timestamp()
+
+
+def to_epoch(value: object, end_of_day: bool = False, naive_tz: tzinfo = pytz.utc) -> Optional[float]:
+    """
+    UTC epoch seconds for an ISO date/datetime string (or datetime), or None.
+    With end_of_day, a date-only value means 23:59:59 of that day.
+    """
+    if isinstance(value, str):
+        return _string_epoch(value, end_of_day, naive_tz)
+    parsed = parse_datetime(value, naive_tz)
+    return None if parsed is None else parsed.timestamp()
+
+
+def event_span(event: Dict) -> Tuple[Optional[float], Optional[float]]:
+    """(start, end) epoch seconds of an event dict; either may be None."""
+    start = to_epoch(event.get('startDate'))
+    end = to_epoch(event.get('endDate') or event.get('startDate'), end_of_day=True)
+    return start, end
+
+
+def time_arrays(events: Sequence[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """Start and end epoch seconds for every event, NaN where unknown."""
+    starts = np.full(len(events), np.nan)
+    ends = np.full(len(events), np.nan)
+    for i, event in enumerate(events):
+        start, end = event_span(event)
+        if start is not None:
+            starts[i] = start
+        if end is not None:
+            ends[i] = end
+    return starts, ends
+
+
+def _now(now: Optional[float]) -> float:
+    return time.time() if now is None else now
+
+
+def future_mask(ends: np.ndarray, now: Optional[float] = None) -> np.ndarray:
+    """Events that have not ended yet."""
+    with np.errstate(invalid='ignore'):
+        return ends > _now(now)
+
+
+def starts_after_mask(starts: np.ndarray, now: Optional[float] = None) -> np.ndarray:
+    """Events that have not started yet."""
+    with np.errstate(invalid='ignore'):
+        return starts > _now(now)
+
+
+def ny_day_bounds(day: date) -> Tuple[float, float]:
+    """Epoch seconds of New York midnight at the start of day and of the next day."""
+    start = NY_TZ.localize(datetime(day.year, day.month, day.day))
+    following = day + timedelta(days=1)
+    end = NY_TZ.localize(datetime(following.year, following.month, following.day))
+    return start.timestamp(), end.timestamp()
+
+
+def ny_day_mask(starts: np.ndarray, day: date) -> np.ndarray:
+    """Events starting on the given New York calendar day."""
+    lower, upper = ny_day_bounds(day)
+    with np.errstate(invalid='ignore'):
+        return (starts >= lower) & (starts < upper)
+
+
+def window_mask(starts: np.ndarray, ends: np.ndarray, window_start: float, window_end: float) -> np.ndarray:
+    """Events overlapping [window_start, window_end)."""
+    with np.errstate(invalid='ignore'):
+        return (starts < window_end) & (ends >= window_start)
+
+
+def select(events: Sequence[Dict], mask: np.ndarray) -> List[Dict]:
+    """The events where mask is true, in their original order."""
+    return [events[i] for i in np.flatnonzero(mask)]
+
+
+def filter_future(events: Sequence[Dict], now: Optional[float] = None) -> List[Dict]:
+    """Events that have not ended yet, in their original order."""
+    events = list(events)
+    _, ends = time_arrays(events)
+    return select(events, future_mask(ends, now))
+
+
+def is_future(event: Dict, now: Optional[float] = None) -> bool:
+    """Whether a single event has not ended yet."""
+    end = event_span(event)[1]
+    return end is not None and not math.isnan(end) and end > _now(now)
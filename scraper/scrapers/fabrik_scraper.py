@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import os
 import re
@@ -12,7 +11,9 @@ from typing import Dict, List, Optional
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 
 import pytz
-import requests
+
+from . import event_io, http_cache
+from .event_model import Event, EventMetadata, Price, Venue
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
@@ -70,7 +71,7 @@ def fetch_all_gatherings() -> List[Dict]:
     while True:
         url = f'{API_BASE}/guests/all-gatherings?page={page}'
         logging.info(f'Fetching Fabrik gatherings page {page}')
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        response = http_cache.fetch(url, headers=HEADERS, timeout=30)
         response.raise_for_status()
         payload = response.json()
         batch = payload.get('items') or []
@@ -109,44 +110,40 @@ def convert_gathering(item: Dict) -> Optional[Dict]:
     raw_id = str(item.get('id') or title)
     event_id = f"evt_fabrik_{hashlib.md5(f'{raw_id}{start_iso}'.encode()).hexdigest()[:8]}"
 
-    return {
-        'id': event_id,
-        'name': title,
-        'type': item.get('category') or 'Community',
-        'locationId': 'loc_fabrik' if space_name == 'Tribeca' else '',
-        'communityId': FABRIK_COMMUNITY_ID,
-        'description': item.get('description') or '',
-        'startDate': start_iso,
-        'endDate': end_iso,
-        'category': [item.get('category')] if item.get('category') else ['Community'],
-        'price': {
-            'amount': 0,
-            'type': 'Free',
-            'currency': 'USD',
-            'details': 'See registration link for details',
-        },
-        'capacity': item.get('event_size'),
-        'registrationRequired': True,
-        'tags': ['fabrik'],
-        'image': item.get('image_url') or '',
-        'status': 'upcoming',
-        'metadata': {
-            'source': 'Fabrik',
-            'source_url': source_url,
-            'organizer': {
-                'name': (item.get('community') or 'Fabrik').strip() or 'Fabrik',
-                'website': 'https://www.joinfabrik.com',
-            },
-            'venue': {
-                'name': f'Fabrik {space_name}',
-                'address': SPACE_ADDRESSES.get(space_name, f'Fabrik {space_name}, New York, NY'),
-                'type': 'Community Space',
+    return Event(
+        id=event_id,
+        name=title,
+        type=item.get('category') or 'Community',
+        location_id='loc_fabrik' if space_name == 'Tribeca' else '',
+        community_id=FABRIK_COMMUNITY_ID,
+        description=item.get('description') or '',
+        start_date=start_iso,
+        end_date=end_iso,
+        category=[item.get('category')] if item.get('category') else ['Community'],
+        price=Price(details='See registration link for details'),
+        capacity=item.get('event_size'),
+        registration_required=True,
+        tags=['fabrik'],
+        image=item.get('image_url') or '',
+        metadata=EventMetadata(
+            source_url=source_url,
+            extra={
+                'source': 'Fabrik',
+                'organizer': {
+                    'name': (item.get('community') or 'Fabrik').strip() or 'Fabrik',
+                    'website': 'https://www.joinfabrik.com',
+                },
+                'featured': bool(item.get('is_featured')),
+                'members_only': bool(item.get('is_members_only')),
+                'original_event_id': item.get('id'),
             },
-            'featured': bool(item.get('is_featured')),
-            'members_only': bool(item.get('is_members_only')),
-            'original_event_id': item.get('id'),
-        },
-    }
+            venue=Venue(
+                name=f'Fabrik {space_name}',
+                address=SPACE_ADDRESSES.get(space_name, f'Fabrik {space_name}, New York, NY'),
+                type='Community Space',
+            ),
+        ),
+    ).to_dict()
 
 
 def main() -> Optional[str]:
@@ -160,8 +157,7 @@ def main() -> Optional[str]:
 
     events.sort(key=lambda e: e.get('startDate') or '')
     output_file = os.path.join(DATA_DIR, 'fabrik_events.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({'events': events}, f, indent=2, ensure_ascii=False)
+    output_file = event_io.write_events(output_file, events)
     logging.info(f'Saved {len(events)} public NYC Fabrik events to {output_file}')
     return output_file
 
@@ -1,6 +1,5 @@
 import requests
 from bs4 import BeautifulSoup
-import json
 from datetime import datetime, timedelta
 import uuid
 import os
@@ -12,6 +11,9 @@ import time
 from urllib.parse import urljoin
 import logging
 
+from . import event_io, http_cache, http_client
+from .event_model import Event, EventMetadata, Price, Venue
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -35,13 +37,14 @@ class GarysEvent:
 class GarysGuideScraper:
     BASE_URL = "https://www.garysguide.com"
     EVENTS_URL = f"{BASE_URL}/events?region=nyc"
+    # Bump when _parse_event_links changes so cached link lists are discarded
+    LIST_PARSE_VERSION = "1"
     
     def __init__(self):
         self.tz = pytz.timezone("America/New_York")
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
     
     def _extract_speakers_from_html(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
         """Extract speaker information from HTML"""
@@ -99,7 +102,7 @@ class GarysGuideScraper:
     def _scrape_event_page(self, url: str) -> Optional[GarysEvent]:
         """Scrape individual event page"""
         try:
-            response = self.session.get(url)
+            response = http_client.get(url, headers=self.headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -248,59 +251,52 @@ class GarysGuideScraper:
             
     def _convert_to_event_json(self, gary_event: GarysEvent) -> Dict:
         """Convert GarysEvent to our standard event JSON format"""
-        return {
-            "id": gary_event.id,
-            "name": gary_event.name,
-            "type": gary_event.event_type,
-            "locationId": "loc_tbd",
-            "communityId": "com_gary",
-            "description": gary_event.description,
-            "startDate": gary_event.start_date,
-            "endDate": gary_event.end_date,
-            "category": [gary_event.event_type] + gary_event.tags[:2],  # Main type plus top 2 tags
-            "price": {
-                "amount": gary_event.price["amount"],
-                "type": gary_event.price["type"],
-                "currency": "USD",
-                "details": ""
-            },
-            "capacity": gary_event.capacity or 100,
-            "registrationRequired": True,
-            "tags": gary_event.tags,
-            "image": "gary-event.jpg",
-            "status": "upcoming",
-            "metadata": {
-                "source_url": gary_event.url,  # The direct Gary's Guide event URL
-                "registration_url": gary_event.registration_url,  # Add registration URL to metadata
-                "speakers": gary_event.speakers,
-                "venue": {
-                    "name": gary_event.location["name"],
-                    "address": gary_event.location["address"],
-                    "type": "Other"
-                }
-            }
-        }
+        return Event(
+            id=gary_event.id,
+            name=gary_event.name,
+            type=gary_event.event_type,
+            location_id="loc_tbd",
+            community_id="com_gary",
+            description=gary_event.description,
+            start_date=gary_event.start_date,
+            end_date=gary_event.end_date,
+            category=[gary_event.event_type] + gary_event.tags[:2],  # Main type plus top 2 tags
+            price=Price(amount=gary_event.price["amount"], type=gary_event.price["type"]),
+            capacity=gary_event.capacity or 100,
+            registration_required=True,
+            tags=gary_event.tags,
+            image="gary-event.jpg",
+            metadata=EventMetadata(
+                source_url=gary_event.url,  # The direct Gary's Guide event URL
+                extra={
+                    "registration_url": gary_event.registration_url,  # Add registration URL to metadata
+                    "speakers": gary_event.speakers,
+                },
+                venue=Venue(name=gary_event.location["name"], address=gary_event.location["address"]),
+            ),
+        ).to_dict()
+    
+    def _parse_event_links(self, response: requests.Response) -> List[str]:
+        """Absolute URLs of every event link on the events page"""
+        soup = BeautifulSoup(response.text, 'html.parser')
+        event_links = []
+        for link in soup.find_all('a', href=re.compile(r'/events/[a-zA-Z0-9]+/[^/]+$')):
+            if link.get('href'): # Ensure href exists
+                event_links.append(urljoin(self.BASE_URL, link['href']))
+        return event_links
     
     def scrape_events(self) -> List[Dict]:
         """Scrape all events from Gary's Guide"""
         logger.info("Starting Gary's Guide events scraper")
         
-        # Fetch the main events page
+        # Fetch the main events page; an unchanged page (304) reuses the links parsed on a previous run
         try:
-            response = self.session.get(self.EVENTS_URL)
-            response.raise_for_status()
+            event_links = http_cache.fetch_parsed(
+                self.EVENTS_URL, self._parse_event_links, self.LIST_PARSE_VERSION, headers=self.headers
+            )
         except requests.RequestException as e:
             logger.error(f"Failed to fetch main events page: {e}")
             return []  # Return empty list on failure
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find all event links
-        event_links = []
-        for link in soup.find_all('a', href=re.compile(r'/events/[a-zA-Z0-9]+/[^/]+$')):
-            if link.get('href'): # Ensure href exists
-                full_url = urljoin(self.BASE_URL, link['href'])
-                event_links.append(full_url)
         
         event_links = list(set(event_links))  # Remove duplicates
         logger.info(f"Found {len(event_links)} events to scrape")
@@ -343,8 +339,7 @@ class GarysGuideScraper:
         output_file = os.path.join(data_dir, "gary_events.json")
 
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump({"events": new_events}, f, indent=2, ensure_ascii=False)
+            output_file = event_io.write_events(output_file, new_events)
             logger.info(f"Saved {len(new_events)} new events to {output_file}")
             return output_file
         except IOError as e:
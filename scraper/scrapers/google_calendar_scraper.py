@@ -1,15 +1,18 @@
 import os
 import json
 import re
-import requests
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from googleapiclient.discovery import build
-from datetime import datetime
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 import pytz
 import hashlib
 from bs4 import BeautifulSoup
 import sys
+import threading
 
 # Setup paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -30,6 +33,9 @@ os.makedirs(CACHE_DIR, exist_ok=True)
 # Import local modules
 from .calendar_configs import GOOGLE_CALENDARS
 from .utils import get_luma_event_details
+from . import event_io, event_time, image_pipeline, json_io, luma_cache
+from .event_model import Event, EventMetadata, Price, Venue
+from .location_index import get_location_index
 from dotenv import load_dotenv
 
 # Load environment variables from .env.local in the project root
@@ -44,20 +50,6 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
 )
 
-# Load locations data
-def load_locations() -> Dict:
-    try:
-        locations_file = os.path.join(CONFIG_DATA_DIR, 'locations.json')
-        if not os.path.exists(locations_file):
-            logging.warning(f"Locations file not found: {locations_file}")
-            return {}
-        
-        with open(locations_file, 'r', encoding='utf-8') as f:
-            return {loc['id']: loc for loc in json.load(f).get('locations', [])}
-    except Exception as e:
-        logging.error(f"Error loading locations from {CONFIG_DATA_DIR}: {e}")
-        return {}
-
 # Load communities data
 def load_communities() -> Dict:
     try:
@@ -66,8 +58,7 @@ def load_communities() -> Dict:
             logging.warning(f"Communities file not found: {communities_file}")
             return {}
             
-        with open(communities_file, 'r', encoding='utf-8') as f:
-            return {com['id']: com for com in json.load(f).get('communities', [])}
+        return {com['id']: com for com in json_io.load(communities_file).get('communities', [])}
     except Exception as e:
         logging.error(f"Error loading communities from {CONFIG_DATA_DIR}: {e}")
         return {}
@@ -86,7 +77,7 @@ if not API_KEY:
         logging.error("Google API key still not found after attempting to load from .env.local. Scraper may not function correctly.")
 
 
-LOCATIONS = load_locations()
+# Locations come from get_location_index(), which reads locations.json on first use
 COMMUNITIES = load_communities()
 
 def get_location_id(event_location: str, community_id: str) -> str:
@@ -119,26 +110,12 @@ def get_location_id(event_location: str, community_id: str) -> str:
     if not event_location:
         return ""
     
-    # Clean the event location for matching
-    event_location_clean = event_location.lower().strip()
-    
-    # First try to match against community's meeting locations
-    for loc_id in meeting_locations:
-        location = LOCATIONS.get(loc_id, {})
-        if location:
-            # Check if location name or address matches
-            if (location.get('name', '').lower() in event_location_clean or 
-                location.get('address', '').lower() in event_location_clean):
-                return loc_id
-    
-    # If no match in community locations, try all locations
-    for loc_id, location in LOCATIONS.items():
-        # Check if location name or address matches
-        if (location.get('name', '').lower() in event_location_clean or 
-            location.get('address', '').lower() in event_location_clean):
-            return loc_id
-    
-    return ""
+    # First try to match against community's meeting locations, then all locations
+    location_index = get_location_index()
+    return (
+        location_index.match_text(event_location, meeting_locations)
+        or location_index.match_text(event_location)
+    )
 
 def _unwrap_google_redirect(url: str) -> str:
     """Expand Google Calendar redirect wrappers to the underlying destination."""
@@ -291,14 +268,14 @@ def format_google_event(event: Dict, community_id: str) -> Dict:
     venue_address = event_location
     venue_type = "Offline" # Default to Offline
     
-    if location_id and location_id in LOCATIONS:
-        location_data = LOCATIONS[location_id]
+    location_data = get_location_index().get(location_id) if location_id else None
+    if location_data:
         venue_name = location_data.get('name', '')
         venue_address = location_data.get('address', event_location)
         # Use location type if available, otherwise keep default
         venue_type = location_data.get('type', venue_type) 
     
-    # If Luma details have location type info, it might override the one from LOCATIONS
+    # If Luma details have location type info, it might override the one from locations.json
     if luma_details and 'location_details' in luma_details:
         luma_venue_type = luma_details['location_details'].get('type')
         if luma_venue_type: # Only override if Luma provides a type
@@ -346,37 +323,8 @@ def format_google_event(event: Dict, community_id: str) -> Dict:
             if cat not in categories:
                 categories.append(cat)
     
-    # Get event image from Luma if available
-    image_filename = ""
-    if luma_details and 'image_url' in luma_details:
-        image_url = luma_details['image_url']
-        if image_url:
-            # Generate a filename from the URL
-            image_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
-            # Define image path relative to public/images/events/
-            # This will be used in the `image` field of the event
-            image_filename = f"events/luma-event-{image_hash}.jpg" # Relative path for frontend
-            
-            # Actual download path for the image
-            image_download_path = os.path.join(PROJECT_ROOT, 'public', 'images', 'events')
-            os.makedirs(image_download_path, exist_ok=True)
-            full_image_path = os.path.join(image_download_path, f"luma-event-{image_hash}.jpg")
-
-            # Download and save image if not already present
-            if not os.path.exists(full_image_path):
-                try:
-                    img_response = requests.get(image_url, stream=True)
-                    if img_response.status_code == 200:
-                        with open(full_image_path, 'wb') as img_f:
-                            for chunk in img_response.iter_content(1024):
-                                img_f.write(chunk)
-                        logging.info(f"Downloaded image for event {event_id} to {full_image_path}")
-                    else:
-                        logging.warning(f"Failed to download image {image_url} for event {event_id}. Status: {img_response.status_code}")
-                        image_filename = "" # Reset if download fails
-                except Exception as img_e:
-                    logging.error(f"Error downloading image {image_url} for event {event_id}: {img_e}")
-                    image_filename = "" # Reset on error
+    # Remote image from Luma; downloaded later by image_pipeline (sets `image`)
+    image_url = (luma_details or {}).get('image_url') or ''
     
     # Use Luma full description if available and more detailed
     enhanced_description = description
@@ -414,103 +362,275 @@ def format_google_event(event: Dict, community_id: str) -> Dict:
         if community_website:
             source_url_to_use = community_website
 
-    return {
-        "id": event_id,
-        "name": event_title,
-        "type": categories[0] if categories else "Tech", # Use first category as main type
-        "locationId": location_id,
-        "communityId": community_id,
-        "description": enhanced_description,
-        "startDate": start,
-        "endDate": end,
-        "category": categories, # Store all categories
-        "price": price_info,
-        "capacity": capacity,
-        "registrationRequired": registration_required,
-        "tags": [], # Deprecated or handle differently - using category now
-        "image": image_filename, # Use the relative path for the image
-        "status": "upcoming",
-        "metadata": {
-            "source": "Google Calendar", # Indicate source
-            "source_url": source_url_to_use,
-            "original_event_id": event['id'], # Store original Google Calendar event ID
-            "organizer": {
-                "name": (
-                    (luma_details or {}).get('primary_host', {}).get('name')
-                    or event.get('organizer', {}).get('displayName')
-                    or COMMUNITIES.get(community_id, {}).get('name', '')
-                ),
-                "website": (luma_details or {}).get('primary_host', {}).get('url', ''),
-                "instagram": COMMUNITIES.get(community_id, {}).get('socialMedia', {}).get('instagram', ''),
-                "email": event.get('organizer', {}).get('email', '')
+    return Event(
+        id=event_id,
+        name=event_title,
+        type=categories[0] if categories else "Tech", # Use first category as main type
+        location_id=location_id,
+        community_id=community_id,
+        description=enhanced_description,
+        start_date=start,
+        end_date=end,
+        category=categories, # Store all categories
+        price=Price(**price_info),
+        capacity=capacity,
+        registration_required=registration_required,
+        tags=[], # Deprecated or handle differently - using category now
+        image="", # Filled in by image_pipeline.download_event_images
+        metadata=EventMetadata(
+            source_url=source_url_to_use,
+            extra={
+                "source": "Google Calendar", # Indicate source
+                "original_event_id": event['id'], # Store original Google Calendar event ID
+                "organizer": {
+                    "name": (
+                        (luma_details or {}).get('primary_host', {}).get('name')
+                        or event.get('organizer', {}).get('displayName')
+                        or COMMUNITIES.get(community_id, {}).get('name', '')
+                    ),
+                    "website": (luma_details or {}).get('primary_host', {}).get('url', ''),
+                    "instagram": COMMUNITIES.get(community_id, {}).get('socialMedia', {}).get('instagram', ''),
+                    "email": event.get('organizer', {}).get('email', '')
+                },
+                "speakers": speakers,
+                "social_links": social_links,
+                "featured": False, # Default featured status
+                "luma_source": bool(event_url and ('lu.ma' in event_url or 'luma.com' in event_url)),
+                "luma_host": (luma_details or {}).get('primary_host') or None,
+                "google_calendar_link": event.get('htmlLink', ''), # Explicitly store Google Calendar link
+                "image_url": image_url
             },
-            "venue": {
-                "name": venue_name,
-                "address": venue_address,
-                "type": venue_type
-            },
-            "speakers": speakers,
-            "social_links": social_links,
-            "featured": False, # Default featured status
-            "luma_source": bool(event_url and ('lu.ma' in event_url or 'luma.com' in event_url)),
-            "luma_host": (luma_details or {}).get('primary_host') or None,
-            "google_calendar_link": event.get('htmlLink', '') # Explicitly store Google Calendar link
-        }
-    }
+            venue=Venue(name=venue_name, address=venue_address, type=venue_type),
+        ),
+    ).to_dict()
+
+# Events requested per events().list page (API maximum is 2500)
+GCAL_PAGE_SIZE = 250
+# Calendars fetched at the same time
+GCAL_FETCH_WORKERS = 8
+# A full sync lists events between now and now + GCAL_SYNC_WINDOW. Incremental
+# syncs only report changes inside that stored window, so once it no longer
+# reaches GCAL_SYNC_HORIZON ahead of today a full sync moves it forward
+GCAL_SYNC_WINDOW = timedelta(days=365)
+GCAL_SYNC_HORIZON = timedelta(days=335)
+
+_calendar_service = None
+_calendar_service_lock = threading.Lock()
+_thread_local = threading.local()
+
+def get_calendar_service():
+    """Build the Calendar API client once per run (discovery is parsed only once)."""
+    global _calendar_service
+    with _calendar_service_lock:
+        if _calendar_service is None:
+            _calendar_service = build('calendar', 'v3', developerKey=API_KEY, cache_discovery=False)
+        return _calendar_service
+
+def _thread_http():
+    """httplib2 connections aren't thread-safe, so each fetch thread executes requests on its own."""
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = build_http()
+        _thread_local.http = http
+    return http
+
+def _calendar_cache_file(community_id: str) -> str:
+    return os.path.join(CACHE_DIR, f"cache_gcal_{community_id}.json")
+
+def _load_calendar_cache(community_id: str) -> Dict:
+    """Read the per-community cache (formatted events + sync state), or {}."""
+    try:
+        data = json_io.load(_calendar_cache_file(community_id))
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _full_sync_window() -> Dict[str, str]:
+    """timeMin/timeMax of a full sync starting now."""
+    now = datetime.now(pytz.utc)
+    return {'time_min': now.isoformat(), 'time_max': (now + GCAL_SYNC_WINDOW).isoformat()}
+
+def _window_reaches_horizon(window: Dict) -> bool:
+    """True while a stored sync window still covers GCAL_SYNC_HORIZON ahead of now."""
+    time_max = event_time.parse_datetime(window.get('time_max'))
+    return time_max is not None and time_max >= datetime.now(pytz.utc) + GCAL_SYNC_HORIZON
+
+def _list_calendar_items(service, calendar_id: str, sync_token: Optional[str] = None, window: Optional[Dict] = None) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Page through events().list for one calendar.
+    Without a sync token this is a full sync of window (timeMin/timeMax); with
+    one, only events changed since that token are returned (cancelled ones
+    included), limited to the window of the full sync that issued it.
+    Returns (raw items, nextSyncToken).
+    """
+    if sync_token:
+        params = {'syncToken': sync_token}
+    else:
+        params = {'timeMin': window['time_min'], 'timeMax': window['time_max']}
+
+    items: List[Dict] = []
+    page_token = None
+    while True:
+        events_result = service.events().list(
+            calendarId=calendar_id,
+            singleEvents=True,
+            maxResults=GCAL_PAGE_SIZE,
+            pageToken=page_token,
+            **params
+        ).execute(http=_thread_http())
+        items.extend(events_result.get('items', []))
+        page_token = events_result.get('nextPageToken')
+        if not page_token:
+            return items, events_result.get('nextSyncToken')
+
+def _raw_event_end(event: Dict) -> str:
+    return event.get('end', {}).get('dateTime', event.get('end', {}).get('date', '')) or ''
+
+# Bump when format_google_event's output changes so cached formatted events are rebuilt
+GCAL_FORMAT_VERSION = '2'
+# Item fields that change without changing anything format_google_event reads
+_VOLATILE_ITEM_FIELDS = ('etag', 'updated')
+
+def _event_fingerprint(event: Dict) -> str:
+    """Content hash of a raw API item; equal fingerprints format to the same event."""
+    stable = {k: v for k, v in event.items() if k not in _VOLATILE_ITEM_FIELDS}
+    # Stdlib json so the stored fingerprints don't depend on which JSON backend is installed
+    payload = json.dumps(stable, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(f"{GCAL_FORMAT_VERSION}\n{payload}".encode('utf-8')).hexdigest()
 
 def fetch_google_calendar_events(calendar_id: str, community_id: str) -> List[Dict]:
-    """Fetch events from a Google Calendar."""
+    """
+    Fetch events from a Google Calendar.
+
+    Uses incremental sync: the Calendar API nextSyncToken is kept in the
+    community's cache_gcal_*.json with the timeMin/timeMax window it was
+    issued for, and later runs only request changed events. A full sync runs
+    again when that window stops reaching GCAL_SYNC_HORIZON ahead.
+    Each item's content fingerprint is stored there too: format_google_event
+    (and its Luma fetch) only runs for items whose fingerprint changed; the
+    rest reuse the cached formatted event.
+    """
     events = []
     
     if not API_KEY:
         logging.error("No Google API key available. Skipping calendar fetch.")
         return events # Return empty list, no fallback to cache here as main() handles that
     
+    cache = _load_calendar_cache(community_id)
+    if cache.get('calendar_id') != calendar_id:
+        # Calendar id changed (or legacy cache without sync state): start over
+        cache = {'events': cache.get('events', [])}
+    known_items = cache.get('raw_events') or {}
+    cached_events = {e['id']: e for e in cache.get('events', []) if isinstance(e, dict) and 'id' in e}
+    sync_token = cache.get('sync_token') if known_items else None
+    sync_window = cache.get('sync_window') or {}
+    if sync_token and not _window_reaches_horizon(sync_window):
+        # The token only reports changes up to the stored timeMax (unknown for
+        # older caches), so events further out would never show up
+        logging.info(
+            f"Sync window for Google Calendar {community_id} ends {sync_window.get('time_max') or 'at an unknown date'}, "
+            f"doing a full sync"
+        )
+        sync_token = None
+    if not sync_token:
+        sync_window = _full_sync_window()
+
     try:
-        # Create a service object
-        service = build('calendar', 'v3', developerKey=API_KEY, cache_discovery=False)
-        
-        # Get current time and one year from now
-        now = datetime.now(pytz.utc)
-        one_year_from_now = datetime(now.year + 1, now.month, now.day, tzinfo=pytz.utc)
+        service = get_calendar_service()
         
-        # Fetch events
-        events_result = service.events().list(
-            calendarId=calendar_id,
-            timeMin=now.isoformat(),
-            timeMax=one_year_from_now.isoformat(),
-            singleEvents=True,
-            orderBy='startTime',
-            maxResults=100 # Max results per page (can be up to 2500)
-        ).execute()
-            
-        raw_events = events_result.get('items', [])
+        try:
+            raw_events, next_sync_token = _list_calendar_items(service, calendar_id, sync_token, sync_window)
+        except HttpError as sync_error:
+            if not sync_token or sync_error.resp.status != 410:
+                raise
+            # Sync token expired: Google requires a fresh full sync
+            logging.info(f"Sync token expired for Google Calendar {community_id}, doing a full sync")
+            sync_token = None
+            sync_window = _full_sync_window()
+            raw_events, next_sync_token = _list_calendar_items(service, calendar_id, window=sync_window)
+
+        # Incremental results are deltas on top of what we already know; a full sync replaces it
+        item_state = dict(known_items) if sync_token else {}
+        reformatted = 0
             
-        # Process each event
+        # Process each changed event
         for event_data in raw_events:
+            google_id = event_data.get('id')
+            if not google_id:
+                continue
+            if event_data.get('status') == 'cancelled':
+                item_state.pop(google_id, None)
+                continue
+
+            previous = known_items.get(google_id)
+            fingerprint = _event_fingerprint(event_data)
+            if (
+                previous
+                and previous.get('fingerprint') == fingerprint
+                and (previous.get('event_id') is None or previous['event_id'] in cached_events)
+            ):
+                # Same content as last run: reuse the formatted event as-is
+                item_state[google_id] = dict(previous, etag=event_data.get('etag'), updated=event_data.get('updated'))
+                continue
+
+            state = {
+                'etag': event_data.get('etag'),
+                'updated': event_data.get('updated'),
+                'fingerprint': fingerprint,
+                'end': _raw_event_end(event_data),
+                'event_id': None,
+            }
             try:
                 # Skip untitled calendar placeholders (common on NYC Resistor)
                 summary = (event_data.get('summary') or '').strip()
                 if not summary:
                     logging.info(
                         f"Skipping event without summary in calendar {calendar_id}. "
-                        f"Event ID: {event_data.get('id')}"
+                        f"Event ID: {google_id}"
                     )
+                    item_state[google_id] = state
                     continue
                 formatted_event = format_google_event(event_data, community_id)
-                events.append(formatted_event)
+                cached_events[formatted_event['id']] = formatted_event
+                state['event_id'] = formatted_event['id']
+                item_state[google_id] = state
+                reformatted += 1
             except Exception as e:
-                logging.error(f"Error formatting event '{event_data.get('summary', 'Unnamed event')}' (ID: {event_data.get('id')}) from calendar {calendar_id}: {e}", exc_info=True)
+                logging.error(f"Error formatting event '{event_data.get('summary', 'Unnamed event')}' (ID: {google_id}) from calendar {calendar_id}: {e}", exc_info=True)
+                if previous:
+                    item_state[google_id] = previous
                 continue
+
+        # Drop state for events that have ended; they can't come back into the window
+        item_state = {
+            google_id: state for google_id, state in item_state.items()
+            if not state.get('end') or is_future_event({'endDate': state['end']})
+        }
+        events = [
+            cached_events[state['event_id']]
+            for state in item_state.values()
+            if state.get('event_id') in cached_events
+        ]
+        events = event_time.filter_future(events)
+        events.sort(key=lambda e: e.get('startDate') or '')
                     
-        logging.info(f"Fetched {len(events)} events from calendar {calendar_id} for community {community_id}")
+        logging.info(
+            f"Fetched {len(events)} events from calendar {calendar_id} for community {community_id} "
+            f"({'incremental' if sync_token else 'full'} sync: {len(raw_events)} changed, {reformatted} reformatted)"
+        )
         
-        # Cache events for this community (successful fetch)
+        # Cache events and sync state for this community (successful fetch)
         try:
-            cache_file = os.path.join(CACHE_DIR, f"cache_gcal_{community_id}.json")
-            os.makedirs(os.path.dirname(cache_file), exist_ok=True) # Ensure cache subdir exists
-            with open(cache_file, 'w') as f:
-                json.dump({"events": events, "timestamp": datetime.now().isoformat()}, f, indent=2)
+            cache_file = _calendar_cache_file(community_id)
+            # These caches are committed, so they stay indented
+            json_io.dump({
+                "events": events,
+                "timestamp": datetime.now().isoformat(),
+                "calendar_id": calendar_id,
+                "sync_token": next_sync_token,
+                "sync_window": sync_window,
+                "raw_events": item_state,
+            }, cache_file, pretty=True)
             logging.info(f"Successfully cached {len(events)} events for Google Calendar {community_id} to {cache_file}")
         except Exception as e:
             logging.error(f"Could not cache events for Google Calendar {community_id}: {e}")
@@ -519,15 +639,14 @@ def fetch_google_calendar_events(calendar_id: str, community_id: str) -> List[Di
         logging.error(f"API error fetching events for Google Calendar {calendar_id} (Community: {community_id}): {api_error}", exc_info=True)
         # Try to load cached data if API fails
         try:
-            cache_file = os.path.join(CACHE_DIR, f"cache_gcal_{community_id}.json")
+            cache_file = _calendar_cache_file(community_id)
             if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                    if 'events' in cached_data:
-                        # Filter for future events from cache
-                        cached_events = [e for e in cached_data['events'] if is_future_event(e)]
-                        events.extend(cached_events) # Add to events list
-                        logging.info(f"Loaded {len(cached_events)} future events from cache for Google Calendar {community_id} due to API error.")
+                cached_data = json_io.load(cache_file)
+                if 'events' in cached_data:
+                    # Filter for future events from cache
+                    cached_events = event_time.filter_future(cached_data['events'])
+                    events.extend(cached_events) # Add to events list
+                    logging.info(f"Loaded {len(cached_events)} future events from cache for Google Calendar {community_id} due to API error.")
             else:
                 logging.warning(f"No cache file found for Google Calendar {community_id} at {cache_file} after API error.")
         except Exception as cache_error:
@@ -537,32 +656,10 @@ def fetch_google_calendar_events(calendar_id: str, community_id: str) -> List[Di
         
 def is_future_event(event: Dict) -> bool:
     """Check if event hasn't ended yet"""
-    try:
-        end_date_str = event.get('endDate')
-        if not end_date_str:
-            # If no end date, check start date. If start date is also missing, assume not future.
-            start_date_str = event.get('startDate')
-            if not start_date_str:
-                return False 
-            # If only start date, assume it's a single day event or ongoing if start is in future/today
-            if 'T' in start_date_str:
-                 start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
-            else: # Date only
-                 start_date = datetime.fromisoformat(start_date_str).replace(tzinfo=pytz.utc)
-            return start_date >= datetime.now(pytz.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-
-
-        # Parse both date-only and datetime formats for end_date
-        if 'T' in end_date_str: # Datetime with timezone
-            end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-        else: # Date only, assume end of day in UTC
-            end_date = datetime.fromisoformat(end_date_str).replace(hour=23, minute=59, second=59, tzinfo=pytz.utc)
-            
-        return end_date > datetime.now(pytz.utc)
-        
-    except Exception as e:
-        logging.error(f"Error parsing date for event {event.get('id', 'Unknown ID')}: {e}. Event data: {event.get('startDate')}, {event.get('endDate')}")
+    if event_time.event_span(event)[1] is None:
+        logging.error(f"Error parsing date for event {event.get('id', 'Unknown ID')}. Event data: {event.get('startDate')}, {event.get('endDate')}")
         return False  # Exclude events with invalid dates
+    return event_time.is_future(event)
 
 def main():
     all_events = []
@@ -573,26 +670,25 @@ def main():
 
     # Try to load existing events from this scraper's previous runs (from its specific output file)
     # This helps in preserving events if some calendars fail to fetch, but new fetches will overwrite.
-    if os.path.exists(output_file):
+    previous_output = event_io.find_output(output_file)
+    if previous_output:
         try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                if 'events' in existing_data:
-                    # Filter to keep only future events from the last successful run
-                    # This acts as a fallback if all calendar fetches fail.
-                    # New data from successful fetches will replace these.
-                    existing_future_events = [e for e in existing_data['events'] if is_future_event(e)]
-                    if existing_future_events:
-                        # Add to a temporary list, to be merged carefully later
-                        # We prioritize newly fetched data over these.
-                        all_events.extend(existing_future_events) 
-                        logging.info(f"Loaded {len(existing_future_events)} existing future events from previous run: {output_file}")
+            # Filter to keep only future events from the last successful run
+            # This acts as a fallback if all calendar fetches fail.
+            # New data from successful fetches will replace these.
+            existing_future_events = event_time.filter_future(event_io.iter_events(previous_output))
+            if existing_future_events:
+                # Add to a temporary list, to be merged carefully later
+                # We prioritize newly fetched data over these.
+                all_events.extend(existing_future_events) 
+                logging.info(f"Loaded {len(existing_future_events)} existing future events from previous run: {previous_output}")
         except Exception as e:
-            logging.error(f"Error loading existing events from {output_file}: {e}")
+            logging.error(f"Error loading existing events from {previous_output}: {e}")
     
     # Fetch Google Calendar events
     logging.info("Fetching Google Calendar events...")
     fetched_events_current_run = []
+    calendars = []
     for calendar_name, config in GOOGLE_CALENDARS.items():
         community_id = config.get("community_id")
         calendar_api_id = config.get("id")
@@ -602,9 +698,24 @@ def main():
             continue
 
         logging.info(f"Fetching events for {calendar_name} (Community: {community_id}, Calendar ID: {calendar_api_id})...")
-        google_events = fetch_google_calendar_events(calendar_api_id, community_id)
-        fetched_events_current_run.extend(google_events)
-        # Caching is handled within fetch_google_calendar_events
+        calendars.append((calendar_api_id, community_id))
+
+    # Calendars are independent, so fetch them concurrently through the shared service;
+    # results are merged in config order so output stays deterministic.
+    with ThreadPoolExecutor(max_workers=max(1, min(GCAL_FETCH_WORKERS, len(calendars)))) as executor:
+        futures = [
+            executor.submit(fetch_google_calendar_events, calendar_api_id, community_id)
+            for calendar_api_id, community_id in calendars
+        ]
+        for future in futures:
+            fetched_events_current_run.extend(future.result())
+    # Caching is handled within fetch_google_calendar_events
+
+    # Image stage: download every referenced image concurrently once scraping is done
+    image_pipeline.download_event_images(fetched_events_current_run)
+
+    # Persist Luma details for the next run (atexit doesn't fire in run_all worker processes)
+    luma_cache.save()
     
     # Merge and de-duplicate events
     # Prioritize newly fetched events.
@@ -625,17 +736,13 @@ def main():
     # Filter again to ensure all events in the final list are future events
     # This is important if some stale events were loaded from cache or previous output
     # and not overwritten by a new fetch for that specific source.
-    processed_events = [event for event in final_events_map.values() if is_future_event(event)]
+    processed_events = event_time.filter_future(final_events_map.values())
     
     # Save filtered events to file
-    output_data = {
+    output_file = event_io.write_events(output_file, processed_events, extra={
         "last_updated": datetime.now(pytz.utc).isoformat(),
         "source": "google_calendar_scraper.py",
-        "events": processed_events
-    }
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    })
     
     logging.info(f"Total future events processed by Google Calendar scraper: {len(processed_events)}")
     logging.info(f"Saved {len(processed_events)} Google Calendar events to {output_file}")
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Union
 
 from .calendar_configs import ICS_CALENDARS, COMMUNITY_ID_ALIASES, HOST_NAME_TO_COMMUNITY_ID
+from .location_index import LocationIndex, as_index
+
+# A {id: location} mapping, or a prebuilt index over one
+Locations = Union[Dict[str, Dict], LocationIndex]
 
 
 def slugify_derived_community_id(name: str) -> str:
@@ -48,26 +52,10 @@ def ics_calendar_display_map() -> Dict[str, Dict[str, str]]:
 def match_location_id(
     venue_name: str,
     venue_address: str,
-    locations: Dict[str, Dict],
+    locations: Locations,
 ) -> str:
     """Match venue text to a curated location id, or ''."""
-    blob = f"{venue_name or ''} {venue_address or ''}".lower().strip()
-    if not blob or blob.startswith('http'):
-        return ''
-
-    for loc_id, location in locations.items():
-        name = (location.get('name') or '').lower().strip()
-        address = (location.get('address') or '').lower().strip()
-        if name and name in blob:
-            return loc_id
-        if address and address in blob:
-            return loc_id
-        # Match on street line without city/zip when present
-        if address:
-            street = address.split(',')[0].strip()
-            if street and street in blob:
-                return loc_id
-    return ''
+    return as_index(locations).match(venue_name, venue_address)
 
 
 def build_derived_community(
@@ -90,7 +78,7 @@ def build_derived_community(
 
 def enrich_event_host_and_venue(
     event: Dict,
-    locations: Dict[str, Dict],
+    locations: Locations,
     formal_community_ids: Set[str],
     calendar_names: Optional[Dict[str, Dict[str, str]]] = None,
 ) -> Dict:
@@ -230,10 +218,12 @@ def enrich_event_host_and_venue(
 
 def enrich_events(
     events: List[Dict],
-    locations: Dict[str, Dict],
+    locations: Locations,
     formal_community_ids: Set[str],
 ) -> List[Dict]:
     calendar_names = ics_calendar_display_map()
+    # Build match keys once for the whole batch
+    locations = as_index(locations)
     enriched = 0
     for event in events:
         before = (
@@ -0,0 +1,259 @@
+"""Persistent on-disk HTTP cache with ETag / Last-Modified revalidation.
+
+Responses carrying validators are stored under data/scrapers/cache/http/. On
+the next run the request is sent with If-None-Match / If-Modified-Since, and a
+304 is answered from disk. Callers can also keep a parsed form of a body next
+to it (fetch_parsed, or store_parsed / load_parsed) so an unchanged source
+skips parsing too.
+The cache is size-bounded and evicts least-recently-used entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from . import http_client, json_io
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+CACHE_DIR = os.path.join(PROJECT_ROOT, 'data', 'scrapers', 'cache', 'http')
+
+# Total bytes of cached bodies + parsed payloads before LRU eviction kicks in
+MAX_CACHE_BYTES = int(os.getenv('SCRAPER_HTTP_CACHE_MAX_BYTES', str(200 * 1024 * 1024)))
+# Evict down to this fraction of MAX_CACHE_BYTES so eviction doesn't run on every store
+EVICT_TO_FRACTION = 0.9
+
+# Response headers worth replaying when a body is served from disk
+_KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+_size_lock = threading.Lock()
+_cache_bytes: Optional[int] = None
+
+
+def _key(url: str) -> str:
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def _paths(url: str) -> Dict[str, str]:
+    key = _key(url)
+    return {
+        'body': os.path.join(CACHE_DIR, f'{key}.body'),
+        'meta': os.path.join(CACHE_DIR, f'{key}.meta'),
+        'parsed': os.path.join(CACHE_DIR, f'{key}.parsed'),
+    }
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _remove(path: str) -> int:
+    try:
+        size = os.path.getsize(path)
+        os.remove(path)
+        return size
+    except OSError:
+        return 0
+
+
+def _load_meta(paths: Dict[str, str]) -> Optional[Dict]:
+    if not os.path.exists(paths['body']):
+        return None
+    try:
+        return json_io.load(paths['meta'])
+    except (OSError, ValueError):
+        return None
+
+
+def _touch(paths: Dict[str, str]) -> None:
+    """Mark an entry as recently used (eviction orders by body mtime)."""
+    try:
+        os.utime(paths['body'])
+    except OSError:
+        pass
+
+
+def _scan_cache_bytes() -> int:
+    total = 0
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    total += entry.stat().st_size
+    except FileNotFoundError:
+        pass
+    return total
+
+
+def _account(delta: int) -> None:
+    """Track cache size and evict least-recently-used entries when over budget."""
+    global _cache_bytes
+    with _size_lock:
+        if _cache_bytes is None:
+            _cache_bytes = _scan_cache_bytes()
+        else:
+            _cache_bytes += delta
+        if _cache_bytes > MAX_CACHE_BYTES:
+            _cache_bytes = _evict(int(MAX_CACHE_BYTES * EVICT_TO_FRACTION))
+
+
+def _evict(target_bytes: int) -> int:
+    """Delete oldest entries until the cache holds at most target_bytes. Returns the new size."""
+    entries = []
+    total = 0
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            size = entry.stat().st_size
+            total += size
+            if entry.name.endswith('.body'):
+                entries.append((entry.stat().st_mtime, entry.name[:-len('.body')]))
+    entries.sort()
+    removed = 0
+    for _, key in entries:
+        if total <= target_bytes:
+            break
+        for suffix in ('.body', '.meta', '.parsed'):
+            freed = _remove(os.path.join(CACHE_DIR, key + suffix))
+            total -= freed
+        removed += 1
+    if removed:
+        logging.info(f'HTTP cache evicted {removed} entries, now {total} bytes')
+    return total
+
+
+def _response_from_disk(url: str, meta: Dict, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = meta.get('status_code', 200)
+    response._content = content
+    response.headers = CaseInsensitiveDict(meta.get('headers') or {})
+    response.encoding = meta.get('encoding')
+    response.url = meta.get('url') or url
+    response.reason = 'OK'
+    return response
+
+
+def fetch(url: str, **kwargs) -> requests.Response:
+    """
+    GET url through the shared HTTP client, revalidating any cached copy.
+
+    The returned response has a `from_cache` attribute: True when the server
+    answered 304 and the body was read from disk.
+    """
+    paths = _paths(url)
+    meta = _load_meta(paths)
+    request_headers = dict(kwargs.pop('headers', None) or {})
+    headers = dict(request_headers)
+    if meta:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    response = http_client.get(url, headers=headers, **kwargs)
+
+    if response.status_code == 304 and meta:
+        try:
+            with open(paths['body'], 'rb') as f:
+                content = f.read()
+        except OSError:
+            content = None
+        if content is not None:
+            _touch(paths)
+            logging.info(f'HTTP cache: {url} not modified')
+            cached = _response_from_disk(url, meta, content)
+            cached.from_cache = True
+            return cached
+        # The body went missing after the validators were sent (evicted or
+        # removed), so the 304 has nothing to answer from: ask for the full body
+        logging.info(f'HTTP cache: {url} not modified but no cached body, fetching again')
+        response = http_client.get(url, headers=request_headers, **kwargs)
+
+    response.from_cache = False
+    if response.status_code != 200:
+        return response
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    freed = sum(_remove(paths[name]) for name in ('body', 'meta', 'parsed')) if meta else 0
+    if not etag and not last_modified:
+        # Nothing to revalidate against next time
+        if freed:
+            _account(-freed)
+        return response
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        meta_bytes = json_io.dumpb({
+            'url': url,
+            'status_code': response.status_code,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': response.encoding,
+            'headers': {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers},
+        })
+        _atomic_write(paths['body'], response.content)
+        _atomic_write(paths['meta'], meta_bytes)
+        _account(len(response.content) + len(meta_bytes) - freed)
+    except OSError as e:
+        logging.warning(f'Could not write HTTP cache entry for {url}: {e}')
+    return response
+
+
+def fetch_parsed(url: str, parse: Callable[[requests.Response], Any], version: str = '', **kwargs) -> Any:
+    """
+    GET url through fetch() and return parse(response), raising for HTTP
+    errors. When the server answers 304 the result stored by the previous run
+    is returned and parse is skipped. parse must depend only on the body and
+    return something JSON-serializable; bump version when its output changes.
+    """
+    response = fetch(url, **kwargs)
+    response.raise_for_status()
+    if response.from_cache:
+        parsed = load_parsed(url, version)
+        if parsed is not None:
+            return parsed
+    parsed = parse(response)
+    store_parsed(url, parsed, version)
+    return parsed
+
+
+def load_parsed(url: str, version: str = '') -> Optional[Any]:
+    """Return the parsed payload stored for url's current cached body, if any."""
+    paths = _paths(url)
+    try:
+        stored = json_io.load(paths['parsed'])
+    except (OSError, ValueError):
+        return None
+    if not isinstance(stored, dict) or stored.get('version') != version:
+        return None
+    return stored.get('data')
+
+
+def store_parsed(url: str, data: Any, version: str = '') -> None:
+    """Keep a JSON-serializable parsed form of url's cached body.
+
+    Only stored when the body itself is cached; it is dropped automatically
+    whenever the body changes.
+    """
+    paths = _paths(url)
+    if not os.path.exists(paths['body']):
+        return
+    try:
+        payload = json_io.dumpb({'version': version, 'data': data})
+        previous = os.path.getsize(paths['parsed']) if os.path.exists(paths['parsed']) else 0
+        _atomic_write(paths['parsed'], payload)
+        _account(len(payload) - previous)
+    except (OSError, TypeError, ValueError) as e:
+        logging.warning(f'Could not store parsed cache entry for {url}: {e}')
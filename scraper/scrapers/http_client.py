@@ -0,0 +1,152 @@
+"""Shared pooled HTTP client used by every scraper.
+
+One requests.Session per process keeps TLS connections alive between calls,
+so a run opens a handful of connections per host instead of one per request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import weakref
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+# (connect, read) seconds; applied whenever a caller does not pass its own timeout
+DEFAULT_TIMEOUT = (10, 30)
+# Upper bound on simultaneous requests (and pooled connections) to a single host
+MAX_CONNECTIONS_PER_HOST = 4
+# Number of distinct hosts whose connection pools are kept open
+MAX_POOLED_HOSTS = 32
+
+
+def _accept_encoding() -> str:
+    """Advertise brotli only when urllib3 can actually decode it."""
+    encodings = ['gzip', 'deflate']
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append('br')
+        except ImportError:
+            pass
+    return ', '.join(encodings)
+
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+_host_limits: Dict[str, threading.BoundedSemaphore] = {}
+_host_limits_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide keep-alive session, creating it on first use.
+
+    The session is rebuilt after a fork so worker processes never share sockets
+    with their parent.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is not None and _session_pid == pid:
+        return _session
+    with _session_lock:
+        if _session is None or _session_pid != pid:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=MAX_POOLED_HOSTS,
+                pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': DEFAULT_USER_AGENT,
+                'Accept-Encoding': _accept_encoding(),
+                'Connection': 'keep-alive',
+            })
+            _session = session
+            _session_pid = pid
+            _host_limits.clear()
+    return _session
+
+
+def _host_semaphore(url: str) -> threading.BoundedSemaphore:
+    host = (urlparse(url).netloc or '').lower()
+    with _host_limits_lock:
+        semaphore = _host_limits.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST)
+            _host_limits[host] = semaphore
+    return semaphore
+
+
+def _release_on_close(response: requests.Response, semaphore: threading.BoundedSemaphore) -> None:
+    """Release semaphore when response is closed (or garbage collected, if never closed)."""
+    release = weakref.finalize(response, semaphore.release)
+    # The wrapper is stored on the response, so it must not hold the response
+    # strongly (a bound response.close would make a reference cycle)
+    response_ref = weakref.ref(response)
+    close = type(response).close
+
+    def close_and_release() -> None:
+        try:
+            closing = response_ref()
+            if closing is not None:
+                close(closing)
+        finally:
+            release()
+
+    response.close = close_and_release
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Issue a request through the shared session with a default timeout and per-host limit.
+
+    The host slot is held until the body has been read: for a normal request
+    that is when this returns; with stream=True it is when the response is
+    closed, so use it as a context manager (or call close()).
+    """
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    session = get_session()
+    semaphore = _host_semaphore(url)
+    semaphore.acquire()
+    try:
+        logging.debug(f'{method} {url}')
+        response = session.request(method, url, **kwargs)
+    except BaseException:
+        semaphore.release()
+        raise
+    if kwargs.get('stream'):
+        _release_on_close(response, semaphore)
+    else:
+        semaphore.release()
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET url through the shared session. Accepts the same keyword arguments as requests.get."""
+    return request('GET', url, **kwargs)
+
+
+def head(url: str, **kwargs) -> requests.Response:
+    """HEAD url through the shared session."""
+    kwargs.setdefault('allow_redirects', True)
+    return request('HEAD', url, **kwargs)
+
+
+def close() -> None:
+    """Close pooled connections (safe to call more than once)."""
+    global _session, _session_pid
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
@@ -1,16 +1,16 @@
 import os
-import json
 import requests
 import hashlib
 import logging
-import pytz
 import re
+import time
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
-from datetime import datetime
 from ics import Calendar, Event
 from .calendar_configs import ICS_CALENDARS
-from .utils import get_luma_event_details
+from .utils import get_luma_event_details_batch
+from . import event_io, event_model, event_time, http_cache, json_io, luma_cache
+from .location_index import get_location_index
 
 # Setup paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -35,8 +35,7 @@ communities = {}
 try:
     communities_file = os.path.join(CONFIG_DATA_DIR, 'communities.json')
     if os.path.exists(communities_file):
-        with open(communities_file, 'r') as f:
-            communities = {com['id']: com for com in json.load(f).get('communities', [])}
+        communities = {com['id']: com for com in json_io.load(communities_file).get('communities', [])}
     else:
         logging.warning(f"Communities file not found: {communities_file} (Looking in public/data/)")
 except Exception as e:
@@ -78,6 +77,42 @@ def is_nyc_event(event_data):
     
     return False
 
+# Bump when _parse_ics_feed output changes so cached parses are discarded
+ICS_PARSE_VERSION = '1'
+
+def _parse_ics_feed(ics_text: str) -> List[Dict]:
+    """Parse an ICS document into JSON-serializable event dicts (no network access)."""
+    cal = Calendar(ics_text)
+    parsed = []
+    for event in cal.events:
+        try:
+            parsed.append({
+                "uid": getattr(event, 'uid', ''),
+                "summary": getattr(event, 'name', ''),
+                "start": event.begin.datetime.isoformat(),
+                "end": event.end.datetime.isoformat(),
+                "url": getattr(event, 'url', '') or '',
+                "location": getattr(event, 'location', '') or '',
+                "description": getattr(event, 'description', '') or '',
+                "organizer": str(getattr(event, 'organizer', '') or ''),
+                "geo": str(getattr(event, 'geo', '') or ''),
+            })
+        except Exception as e:
+            logging.error(f"Error parsing event: {getattr(event, 'name', 'Unknown Event')} - {e}")
+    return parsed
+
+def _first_luma_url(text: str) -> str:
+    """First public Luma event URL in text (skipping host-only manage links), or ''."""
+    if not text:
+        return ''
+    matches = re.findall(r'https?://(?:www\.)?(?:lu\.ma|luma\.com)/[^\s<>"\']+', text, flags=re.I)
+    for match in matches:
+        cleaned = match.rstrip(').,;>"\'')
+        if '/event/manage/' in cleaned.lower():
+            continue
+        return cleaned.replace('https://lu.ma/', 'https://luma.com/').replace('http://lu.ma/', 'https://luma.com/')
+    return ''
+
 def get_luma_events(ics_url, filter_nyc=False):
     """Fetch and parse Luma calendar events from ICS feed"""
     try:
@@ -85,42 +120,43 @@ def get_luma_events(ics_url, filter_nyc=False):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        response = requests.get(ics_url, headers=headers, timeout=10)
+        response = http_cache.fetch(ics_url, headers=headers, timeout=10)
         response.raise_for_status()
-        
-        if not response.text:
-            logging.error(f"Empty response from ICS feed: {ics_url}")
-            return []
-            
-        logging.info(f"Successfully fetched ICS feed, size: {len(response.text)} bytes")
-        cal = Calendar(response.text)
+
+        # An unchanged feed (304) reuses the events parsed on a previous run
+        raw_events = http_cache.load_parsed(ics_url, ICS_PARSE_VERSION) if response.from_cache else None
+        if raw_events is not None:
+            logging.info(f"ICS feed unchanged, reusing {len(raw_events)} parsed events")
+        else:
+            if not response.text:
+                logging.error(f"Empty response from ICS feed: {ics_url}")
+                return []
+
+            logging.info(f"Successfully fetched ICS feed, size: {len(response.text)} bytes")
+            raw_events = _parse_ics_feed(response.text)
+            http_cache.store_parsed(ics_url, raw_events, ICS_PARSE_VERSION)
+
+        # Phase 1: pick upcoming (and, if requested, NYC) events and their Luma URLs
         events = []
-        now = datetime.now(pytz.utc)
+        now = time.time()
         
-        for event in cal.events:
+        for event in raw_events:
             try:
+                start = event_time.parse_datetime(event['start'])
+                end = event_time.parse_datetime(event['end'])
+                if start is None or end is None:
+                    raise ValueError(f"unparseable start/end {event['start']!r} / {event['end']!r}")
                 # Skip past events (end time in past)
-                if event.end < now:
+                if end.timestamp() < now:
                     continue
                 
                 # Get event URL from:
                 # 1. URL property
                 # 2. Location field if it contains a Luma URL
                 # 3. Description field if it contains a Luma URL
-                event_url = getattr(event, 'url', '') or ''
-                location = getattr(event, 'location', '') or ''
-                description = getattr(event, 'description', '') or ''
-
-                def _first_luma_url(text: str) -> str:
-                    if not text:
-                        return ''
-                    matches = re.findall(r'https?://(?:www\.)?(?:lu\.ma|luma\.com)/[^\s<>"\']+', text, flags=re.I)
-                    for match in matches:
-                        cleaned = match.rstrip(').,;>"\'')
-                        if '/event/manage/' in cleaned.lower():
-                            continue
-                        return cleaned.replace('https://lu.ma/', 'https://luma.com/').replace('http://lu.ma/', 'https://luma.com/')
-                    return ''
+                event_url = event['url']
+                location = event['location']
+                description = event['description']
                 
                 # Check if location is a Luma URL
                 if not event_url:
@@ -133,31 +169,36 @@ def get_luma_events(ics_url, filter_nyc=False):
                 if event_url and ('lu.ma' in event_url or 'luma.com' in event_url):
                     event_url = event_url.replace('https://lu.ma/', 'https://luma.com/').replace('http://lu.ma/', 'https://luma.com/')
                 
-                # Get detailed event information if we have a URL
-                event_details = get_luma_event_details(event_url) if event_url else None
-                
                 # Create event data
                 event_data = {
-                    "uid": getattr(event, 'uid', ''),
-                    "summary": getattr(event, 'name', ''),
-                    "start": event.begin.datetime,
-                    "end": event.end.datetime,
+                    "uid": event['uid'],
+                    "summary": event['summary'],
+                    "start": start,
+                    "end": end,
                     "location": location,
                     "description": description,
-                    "organizer": getattr(event, 'organizer', ''),
-                    "geo": getattr(event, 'geo', ''),
+                    "organizer": event['organizer'],
+                    "geo": event['geo'],
                     "url": event_url,
-                    "additional_details": event_details
+                    "additional_details": None
                 }
                 
-                # Apply NYC filtering if requested
+                # Apply NYC filtering if requested (before spending a page fetch on it)
                 if filter_nyc and not is_nyc_event(event_data):
                     continue
                     
                 events.append(event_data)
             except Exception as e:
-                logging.error(f"Error processing event: {getattr(event, 'name', 'Unknown Event')} - {e}")
+                logging.error(f"Error processing event: {event.get('summary') or 'Unknown Event'} - {e}")
                 continue
+
+        # Phase 2: fetch every distinct Luma page concurrently
+        details_by_url = get_luma_event_details_batch(event['url'] for event in events)
+
+        # Phase 3: merge the details back onto their events
+        for event_data in events:
+            if event_data['url']:
+                event_data['additional_details'] = details_by_url.get(event_data['url'])
         
         logging.info(f"Found {len(events)} upcoming events")
         return events
@@ -298,13 +339,6 @@ def convert_ics_event(ics_event: Dict, community_id: str) -> Dict:
     event_name = event_details.get('title') or ics_event.get('summary') or 'Untitled Event'
     primary_host = event_details.get('primary_host') or {}
     from .host_enrichment import parse_ics_organizer_name, match_location_id
-    import json as _json
-    import os as _os
-    _locations_path = _os.path.join(_os.path.dirname(__file__), '..', '..', 'public', 'data', 'locations.json')
-    try:
-        _locations = {loc['id']: loc for loc in _json.load(open(_locations_path)).get('locations', [])}
-    except Exception:
-        _locations = {}
 
     organizer_name = primary_host.get('name') or parse_ics_organizer_name(str(ics_event.get('organizer', '') or ''))
     venue_name = (luma_location or {}).get('venue_name') or location_info.get('venue', '')
@@ -313,47 +347,43 @@ def convert_ics_event(ics_event: Dict, community_id: str) -> Dict:
         addr = luma_location['address']
         venue_address = f"{venue_name}, {addr}" if venue_name and venue_name not in addr else (addr or location_str)
 
-    location_id = match_location_id(venue_name, venue_address, _locations)
-
-    event = {
-        "id": event_id,
-        "name": event_name,
-        "type": tags[0] if tags else "Tech",
-        "locationId": location_id,
-        "communityId": community_id,
-        "description": description,
-        "startDate": ics_event['start'].isoformat(),
-        "endDate": ics_event['end'].isoformat(),
-        "category": tags,
-        "price": price_info,
-        "capacity": event_details.get('actual_capacity'),
-        "registrationRequired": True,
-        "tags": tags,
-        "image": image_url,
-        "status": "upcoming",
-        "metadata": {
-            "source": "ICS/Luma",
-            "source_url": ics_event.get('url', ''),
-            "original_event_id": ics_event.get('uid'),
-            "organizer": {
-                "name": organizer_name,
-                "website": primary_host.get('url', ''),
-            },
-            "venue": {
-                "name": venue_name,
-                "address": venue_address,
-                "type": location_type,
+    location_id = match_location_id(venue_name, venue_address, get_location_index())
+
+    # ics.Event is the parsed calendar entry; the shared schema is event_model.Event
+    return event_model.Event(
+        id=event_id,
+        name=event_name,
+        type=tags[0] if tags else "Tech",
+        location_id=location_id,
+        community_id=community_id,
+        description=description,
+        start_date=ics_event['start'].isoformat(),
+        end_date=ics_event['end'].isoformat(),
+        category=tags,
+        price=event_model.Price(**price_info),
+        capacity=event_details.get('actual_capacity'),
+        registration_required=True,
+        tags=tags,
+        image=image_url,
+        metadata=event_model.EventMetadata(
+            source_url=ics_event.get('url', ''),
+            extra={
+                "source": "ICS/Luma",
+                "original_event_id": ics_event.get('uid'),
+                "organizer": {
+                    "name": organizer_name,
+                    "website": primary_host.get('url', ''),
+                },
+                "speakers": speakers,
+                "social_links": event_details.get('social_links', []),
+                "featured": False,
+                "luma_source": bool(ics_event.get('url')),
+                "luma_host": primary_host or None,
+                "luma_hosts": event_details.get('hosts') or ([primary_host] if primary_host else []),
             },
-            "speakers": speakers,
-            "social_links": event_details.get('social_links', []),
-            "featured": False,
-            "luma_source": bool(ics_event.get('url')),
-            "luma_host": primary_host or None,
-            "luma_hosts": event_details.get('hosts') or ([primary_host] if primary_host else []),
-        },
-    }
-    
-    return event
+            venue=event_model.Venue(name=venue_name, address=venue_address, type=location_type),
+        ),
+    ).to_dict()
 
 def is_future_event(event: Dict) -> bool:
     """Check if the event's start time is in the future."""
@@ -361,20 +391,16 @@ def is_future_event(event: Dict) -> bool:
         start_time = None
         # Handle raw ICS events ('start') and converted events ('startDate' / legacy 'start_time')
         if 'startDate' in event:
-            start_time = event['startDate']
-            if isinstance(start_time, str):
-                start_time = datetime.fromisoformat(start_time.replace(" ", "T"))
+            start_time = event_time.parse_datetime(event['startDate'])
         elif 'start_time' in event:
             # Legacy converted event
-            start_time = event['start_time']
-            if isinstance(start_time, str):
-                # fromisoformat doesn't like spaces
-                start_time = datetime.fromisoformat(start_time.replace(" ", "T"))
+            start_time = event_time.parse_datetime(event['start_time'])
         elif 'start' in event:
             # This is a raw ICS event from the initial fetch
             start_time = event['start']
             if hasattr(start_time, 'datetime'):
                 start_time = start_time.datetime
+            start_time = event_time.parse_datetime(start_time)
         else:
             logging.error(f"Event has no start time field: {event.keys()}")
             return False
@@ -383,10 +409,7 @@ def is_future_event(event: Dict) -> bool:
             logging.error(f"Could not determine start time for event.")
             return False
             
-        if start_time.tzinfo is None:
-            start_time = pytz.utc.localize(start_time)
-            
-        return start_time > datetime.now(pytz.utc)
+        return start_time.timestamp() > time.time()
     except Exception as e:
         logging.error(f"Could not parse event start time: {event.get('startDate', event.get('start_time', event.get('start', 'Unknown')))} - {e}")
         return False
@@ -431,13 +454,14 @@ def main():
         except Exception as e:
             logging.error(f"Failed to process calendar '{cal_info.get('name', 'Unknown')}': {e}")
             continue
+
+    # Persist Luma details for the next run (atexit doesn't fire in run_all worker processes)
+    luma_cache.save()
             
     # Save the combined list of events
     output_path = os.path.join(OUTPUT_DATA_DIR, 'ics_events.json')
     try:
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(all_events, f, indent=2, default=str)
+        output_path = event_io.write_events(output_path, all_events)
         logging.info(f"Successfully saved {len(all_events)} events to {output_path}")
     except Exception as e:
         logging.error(f"Error saving events to {output_path}: {e}")
@@ -0,0 +1,255 @@
+"""Concurrent, content-addressed download stage for event images.
+
+Scrapers only record an event's remote image in metadata.image_url. After
+scraping, download_event_images() gathers every URL, downloads the distinct
+ones concurrently and stores each file under public/images/events/ named by
+the SHA-256 of its bytes, so the same picture behind different CDN query
+strings is kept once. An index of URL -> file, ETag and Last-Modified lets
+later runs confirm an existing file with a HEAD request instead of
+downloading it again.
+
+build_image_manifest() then renders resized WebP derivatives of each stored
+image on a process pool (when Pillow is installed) and returns the event id
+-> derivative manifest written into events.json.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from . import http_client, json_io
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; derivatives are skipped without it
+    Image = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+IMAGES_DIR = os.path.join(PROJECT_ROOT, 'public', 'images', 'events')
+# Path prefix stored in an event's `image` field (relative to public/images/)
+IMAGE_FIELD_PREFIX = 'events'
+IMAGE_INDEX_FILE = os.path.join(PROJECT_ROOT, 'data', 'scrapers', 'cache', 'images', 'image_index.json')
+
+IMAGE_DOWNLOAD_WORKERS = 8
+# (connect, read) seconds for image requests
+IMAGE_TIMEOUT = (10, 30)
+# Bytes per read/write while streaming an image to disk
+CHUNK_SIZE = 256 * 1024
+# Images larger than this are skipped
+MAX_IMAGE_BYTES = 25 * 1024 * 1024
+
+# Derivative name -> maximum width in pixels (never upscaled)
+DERIVATIVE_WIDTHS = {
+    'thumbnail': 320,
+    'medium': 960,
+}
+WEBP_QUALITY = 80
+
+_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+    'image/webp': '.webp',
+    'image/gif': '.gif',
+    'image/avif': '.avif',
+}
+
+
+def _load_index() -> Dict[str, Dict]:
+    try:
+        data = json_io.load(IMAGE_INDEX_FILE)
+        return data.get('images', {}) if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(index: Dict[str, Dict]) -> None:
+    try:
+        # Committed with the other scraper caches, so keep it diffable
+        json_io.dump({'images': index}, IMAGE_INDEX_FILE, pretty=True, sort_keys=True)
+    except OSError as e:
+        logging.warning(f'Could not write image index {IMAGE_INDEX_FILE}: {e}')
+
+
+def _image_field(filename: str) -> str:
+    return f'{IMAGE_FIELD_PREFIX}/{filename}'
+
+
+def _extension(content_type: Optional[str]) -> str:
+    media_type = (content_type or '').split(';')[0].strip().lower()
+    return _EXTENSIONS.get(media_type, '.jpg')
+
+
+def _still_current(url: str, entry: Dict) -> bool:
+    """HEAD the URL and compare validators with the ones saved at download time."""
+    if not entry.get('etag') and not entry.get('last_modified'):
+        # Nothing to compare against; the file on disk is all we have
+        return True
+    try:
+        response = http_client.head(url, timeout=IMAGE_TIMEOUT)
+    except Exception as e:
+        logging.warning(f'HEAD failed for image {url}, keeping existing file: {e}')
+        return True
+    if response.status_code != 200:
+        return True
+    etag = response.headers.get('ETag')
+    if etag and entry.get('etag'):
+        return etag == entry['etag']
+    last_modified = response.headers.get('Last-Modified')
+    if last_modified and entry.get('last_modified'):
+        return last_modified == entry['last_modified']
+    return True
+
+
+def _download(url: str) -> Optional[Dict]:
+    """Stream url to a temp file while hashing it, then move it to its content-hash name."""
+    os.makedirs(IMAGES_DIR, exist_ok=True)
+    tmp_path = os.path.join(IMAGES_DIR, f'.download.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        with http_client.get(url, stream=True, timeout=IMAGE_TIMEOUT) as response:
+            if response.status_code != 200:
+                logging.warning(f'Failed to download image {url}. Status: {response.status_code}')
+                return None
+            digest = hashlib.sha256()
+            size = 0
+            with open(tmp_path, 'wb', buffering=CHUNK_SIZE) as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > MAX_IMAGE_BYTES:
+                        logging.warning(f'Image {url} exceeds {MAX_IMAGE_BYTES} bytes, skipping')
+                        return None
+                    digest.update(chunk)
+                    f.write(chunk)
+            if not size:
+                return None
+            filename = f'luma-event-{digest.hexdigest()[:16]}{_extension(response.headers.get("Content-Type"))}'
+            final_path = os.path.join(IMAGES_DIR, filename)
+            if os.path.exists(final_path):
+                logging.info(f'Image {url} is identical to existing {filename}')
+            else:
+                os.replace(tmp_path, final_path)
+                logging.info(f'Downloaded image {url} to {final_path}')
+            return {
+                'file': filename,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+    except Exception as e:
+        logging.error(f'Error downloading image {url}: {e}')
+        return None
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _resolve(url: str, entry: Optional[Dict]) -> Optional[Dict]:
+    if entry and entry.get('file') and os.path.exists(os.path.join(IMAGES_DIR, entry['file'])):
+        if _still_current(url, entry):
+            return entry
+    return _download(url) or (entry if entry and entry.get('file') else None)
+
+
+def download_event_images(events: Iterable[Dict], max_workers: int = IMAGE_DOWNLOAD_WORKERS) -> List[Dict]:
+    """
+    Download the images referenced by events' metadata.image_url and set each
+    event's `image` field to the stored file. Events are updated in place;
+    the list is returned for convenience.
+    """
+    events = list(events)
+    urls = list(dict.fromkeys(
+        (event.get('metadata') or {}).get('image_url') for event in events
+    ))
+    urls = [url for url in urls if url]
+    if not urls:
+        return events
+
+    index = _load_index()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+        results = dict(zip(urls, executor.map(lambda url: _resolve(url, index.get(url)), urls)))
+
+    # Only keep index entries for images still referenced by upcoming events
+    index = {url: entry for url, entry in results.items() if entry}
+    for event in events:
+        entry = results.get((event.get('metadata') or {}).get('image_url'))
+        event['image'] = _image_field(entry['file']) if entry else ''
+
+    _save_index(index)
+    logging.info(f'Resolved {len(index)} of {len(urls)} event images')
+    return events
+
+
+def _derivative_filename(filename: str, name: str) -> str:
+    return f'{os.path.splitext(filename)[0]}-{name}.webp'
+
+
+def _make_derivatives(filename: str) -> Dict[str, Dict]:
+    """Render (or reuse) the WebP derivatives of one stored image. Runs in a worker process."""
+    derivatives: Dict[str, Dict] = {}
+    source_path = os.path.join(IMAGES_DIR, filename)
+    try:
+        with Image.open(source_path) as source:
+            source.seek(0)  # first frame of animated images
+            for name, max_width in DERIVATIVE_WIDTHS.items():
+                target_name = _derivative_filename(filename, name)
+                target_path = os.path.join(IMAGES_DIR, target_name)
+                if os.path.exists(target_path):
+                    with Image.open(target_path) as existing:
+                        width, height = existing.size
+                else:
+                    image = source.convert('RGBA' if source.mode in ('RGBA', 'LA', 'P') else 'RGB')
+                    if image.width > max_width:
+                        image = image.resize(
+                            (max_width, max(1, round(image.height * max_width / image.width))),
+                            Image.LANCZOS,
+                        )
+                    width, height = image.size
+                    tmp_path = f'{target_path}.{os.getpid()}.tmp'
+                    image.save(tmp_path, 'WEBP', quality=WEBP_QUALITY, method=4)
+                    os.replace(tmp_path, target_path)
+                derivatives[name] = {
+                    'path': _image_field(target_name),
+                    'width': width,
+                    'height': height,
+                }
+    except Exception as e:
+        logging.warning(f'Could not create derivatives for {filename}: {e}')
+        return {}
+    return derivatives
+
+
+def generate_derivatives(filenames: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, Dict[str, Dict]]:
+    """Render WebP derivatives for stored images on all cores. Returns filename -> derivatives."""
+    if Image is None:
+        logging.info('Pillow not installed; skipping image derivatives')
+        return {}
+    filenames = [name for name in dict.fromkeys(filenames) if os.path.exists(os.path.join(IMAGES_DIR, name))]
+    if not filenames:
+        return {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(zip(filenames, executor.map(_make_derivatives, filenames, chunksize=4)))
+    return {name: derivatives for name, derivatives in results.items() if derivatives}
+
+
+def build_image_manifest(events: Iterable[Dict], max_workers: Optional[int] = None) -> Dict[str, Dict[str, Dict]]:
+    """
+    Map event id -> {derivative name: {path, width, height}} for every event
+    whose `image` is a file stored by this pipeline, creating missing
+    derivatives first.
+    """
+    prefix = f'{IMAGE_FIELD_PREFIX}/'
+    event_files = {
+        event['id']: event['image'][len(prefix):]
+        for event in events
+        if event.get('id') and isinstance(event.get('image'), str) and event['image'].startswith(prefix)
+    }
+    derivatives = generate_derivatives(event_files.values(), max_workers=max_workers)
+    manifest = {event_id: derivatives[name] for event_id, name in event_files.items() if name in derivatives}
+    if manifest:
+        logging.info(f'Image manifest covers {len(manifest)} events ({len(derivatives)} images)')
+    return manifest
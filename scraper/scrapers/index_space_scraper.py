@@ -1,15 +1,16 @@
-import requests
 from bs4 import BeautifulSoup
-import json
 import logging
 import hashlib
 import os
 import re
-from datetime import datetime, timezone
+import time
 from dateutil import parser
 from typing import Dict, List, Optional
 import pytz
 
+from . import event_io, event_time, http_cache, http_client
+from .event_model import Event, EventMetadata, Price, Venue
+
 # Set up logging to console
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +21,8 @@ logging.basicConfig(
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 TECH_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(TECH_DIR, 'data')
+# Bump when _parse_product_links changes so cached link lists are discarded
+LIST_PARSE_VERSION = '1'
 
 def safe_extract_text(element, default="") -> str:
     """Safely extract text from a BS4 element"""
@@ -27,6 +30,20 @@ def safe_extract_text(element, default="") -> str:
         return default
     return element.get_text(separator='\n').strip()
 
+def _parse_product_links(response) -> List[str]:
+    """Absolute URLs of every product link on a collection page, in page order."""
+    soup = BeautifulSoup(response.text, 'html.parser')
+    product_links = []
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        if '/products/' in href:
+            # Make sure it's an absolute URL
+            if href.startswith('/'):
+                product_links.append(f"https://www.index-space.org{href}")
+            else:
+                product_links.append(href)
+    return product_links
+
 def fetch_events_list() -> List[str]:
     """Fetch all event URLs from the events page"""
     base_url = "https://www.index-space.org"
@@ -40,23 +57,11 @@ def fetch_events_list() -> List[str]:
     for url in [events_url, happenings_url]:
         try:
             logging.info(f"Fetching events from {url}")
-            response = requests.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find all product links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if '/products/' in href:
-                    # Make sure it's an absolute URL
-                    if href.startswith('/'):
-                        full_url = f"{base_url}{href}"
-                    else:
-                        full_url = href
-                    
-                    if full_url not in event_links:
-                        event_links.append(full_url)
-                        logging.debug(f"Found event link: {full_url}")
+            # An unchanged page (304) reuses the links parsed on a previous run
+            for full_url in http_cache.fetch_parsed(url, _parse_product_links, LIST_PARSE_VERSION):
+                if full_url not in event_links:
+                    event_links.append(full_url)
+                    logging.debug(f"Found event link: {full_url}")
             
             logging.info(f"Found {len(event_links)} event links from {url}")
         except Exception as e:
@@ -158,25 +163,19 @@ def parse_date_time(date_str: str, time_str: str = "") -> tuple:
 
 def is_future_event(start_date_str: str) -> bool:
     """Check if an event is in the future."""
-    try:
-        start_date = datetime.fromisoformat(start_date_str)
-        now = datetime.now()
-        
-        # Make both datetimes timezone-naive for comparison
-        if start_date.tzinfo is not None:
-            start_date = start_date.replace(tzinfo=None)
-            
-        return start_date > now
-    except Exception as e:
-        logging.error(f"Error checking if event is in the future: {e}")
+    # Times parsed from the site are New York wall-clock times
+    start = event_time.to_epoch(start_date_str, naive_tz=event_time.NY_TZ)
+    if start is None:
+        logging.error(f"Error checking if event is in the future: unparseable start {start_date_str!r}")
         # If we can't determine, assume it's a future event
         return True
+    return start > time.time()
 
 def fetch_event_details(url: str) -> Optional[Dict]:
     """Fetch and parse details for a single event"""
     try:
         logging.info(f"Fetching details for event at {url}")
-        response = requests.get(url)
+        response = http_client.get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
         
@@ -273,38 +272,39 @@ def fetch_event_details(url: str) -> Optional[Dict]:
             tags.append("course")
         
         # Build event object
-        event = {
-            "id": f"evt_index_{event_id}",
-            "name": title,
-            "type": event_type,
-            "locationId": "loc_index",
-            "communityId": "com_index",
-            "description": description,
-            "startDate": start_dt,
-            "endDate": end_dt,
-            "category": ["Arts", "Culture", "Community"],
-            "price": price_info,
-            "capacity": 50,  # Default capacity
-            "registrationRequired": True,
-            "tags": tags,
-            "image": "index-space.jpg",
-            "status": "upcoming",
-            "metadata": {
-                "source_url": url,
-                "registration_url": registration_link,
-                "organizer": {
-                    "name": facilitator_name if facilitator_name else "Index Space",
-                    "email": "info@index-space.org"
-                },
-                "venue": {
-                    "name": "Index Space",
-                    "address": "120 Walker St, Manhattan, NY 10013",
-                    "type": "Offline" if "IRL" in location_text else "Online"
+        event = Event(
+            id=f"evt_index_{event_id}",
+            name=title,
+            type=event_type,
+            location_id="loc_index",
+            community_id="com_index",
+            description=description,
+            start_date=start_dt,
+            end_date=end_dt,
+            category=["Arts", "Culture", "Community"],
+            price=Price(**price_info),
+            capacity=50,  # Default capacity
+            registration_required=True,
+            tags=tags,
+            image="index-space.jpg",
+            metadata=EventMetadata(
+                source_url=url,
+                extra={
+                    "registration_url": registration_link,
+                    "organizer": {
+                        "name": facilitator_name if facilitator_name else "Index Space",
+                        "email": "info@index-space.org"
+                    },
+                    "featured": False,
+                    "image_url": image_url
                 },
-                "featured": False,
-                "image_url": image_url
-            }
-        }
+                venue=Venue(
+                    name="Index Space",
+                    address="120 Walker St, Manhattan, NY 10013",
+                    type="Offline" if "IRL" in location_text else "Online"
+                ),
+            ),
+        ).to_dict()
         
         logging.info(f"Successfully processed event: {title}")
         return event
@@ -337,8 +337,7 @@ def main():
     if all_events:
         try:
             output_file = os.path.join(DATA_DIR, 'index_space_events.json')
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump({"events": all_events}, f, indent=2, ensure_ascii=False)
+            output_file = event_io.write_events(output_file, all_events)
             logging.info(f"Saved {len(all_events)} events to {output_file}")
             return output_file
         except Exception as e:
@@ -1,6 +1,4 @@
-import requests
 from bs4 import BeautifulSoup
-import json
 import logging
 from datetime import datetime
 import hashlib
@@ -9,6 +7,9 @@ import re
 from dateutil import parser
 from typing import Dict, List, Optional
 
+from . import event_io, http_cache, http_client
+from .event_model import Event, EventMetadata, Price, Venue
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -18,6 +19,8 @@ logging.basicConfig(
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 TECH_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(TECH_DIR, 'data')
+# Bump when _parse_event_links changes so cached link lists are discarded
+LIST_PARSE_VERSION = '1'
 
 def safe_extract_text(element, default="") -> str:
     """Safely extract text from a BS4 element"""
@@ -25,19 +28,17 @@ def safe_extract_text(element, default="") -> str:
         return default
     return element.get_text(separator='\n').strip()
 
+def _parse_event_links(response) -> List[str]:
+    """Every event link on the events page, in page order."""
+    soup = BeautifulSoup(response.text, 'html.parser')
+    return [link['href'] for link in soup.find_all('a', href=True) if '/event/' in link['href']]
+
 def fetch_events_list() -> List[str]:
     """Fetch all event URLs from the events page"""
     base_url = "https://interferencearchive.org/what-we-do/events/"
     try:
-        response = requests.get(base_url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find all event links
-        event_links = []
-        for link in soup.find_all('a', href=True):
-            if '/event/' in link['href']:
-                event_links.append(link['href'])
+        # An unchanged page (304) reuses the links parsed on a previous run
+        event_links = http_cache.fetch_parsed(base_url, _parse_event_links, LIST_PARSE_VERSION)
         
         logging.info(f"Found {len(event_links)} event links")
         return list(set(event_links))  # Remove duplicates
@@ -73,7 +74,7 @@ def safe_parse_date_time(date_str: str, time_str: str) -> tuple:
 def fetch_event_details(url: str) -> Optional[Dict]:
     """Fetch and parse details for a single event"""
     try:
-        response = requests.get(url)
+        response = http_client.get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
         
@@ -108,47 +109,44 @@ def fetch_event_details(url: str) -> Optional[Dict]:
         if description:
             description_text = safe_extract_text(description)
         
-        # Build event object with required fields
-        event = {
-            "id": f"evt_interference_{event_id}",
-            "name": title,
-            "type": "Community",
-            "locationId": "loc_interference",
-            "communityId": "com_interference",
-            "description": description_text,
-            "startDate": start_dt,
-            "endDate": end_dt,
-            "category": ["Community", "Arts", "Activism"],
-            "price": {
-                "amount": 0,
-                "type": "Free",
-                "currency": "USD",
-                "details": "Status Unknown"
-            },
-            "capacity": None,
-            "registrationRequired": False,
-            "tags": [],
-            "image": "interference-archive.jpg",
-            "status": "upcoming",
-            "metadata": {
-                "source_url": url,
-                "organizer": {
-                    "name": "Interference Archive",
-                    "email": "info@interferencearchive.org"
-                },
-                "venue": {
-                    "name": "Interference Archive",
-                    "address": "314 7th St, Brooklyn, NY 11215",
-                    "type": "Offline"
-                },
-                "featured": False
-            }
-        }
-        
         # Try to extract tags from description
+        tags = []
         if description_text:
             potential_tags = ["workshop", "exhibition", "panel", "discussion", "screening", "talk"]
-            event["tags"] = [tag for tag in potential_tags if tag.lower() in description_text.lower()]
+            tags = [tag for tag in potential_tags if tag.lower() in description_text.lower()]
+        
+        # Build event object with required fields
+        event = Event(
+            id=f"evt_interference_{event_id}",
+            name=title,
+            type="Community",
+            location_id="loc_interference",
+            community_id="com_interference",
+            description=description_text,
+            start_date=start_dt,
+            end_date=end_dt,
+            category=["Community", "Arts", "Activism"],
+            price=Price(details="Status Unknown"),
+            capacity=None,
+            registration_required=False,
+            tags=tags,
+            image="interference-archive.jpg",
+            metadata=EventMetadata(
+                source_url=url,
+                extra={
+                    "organizer": {
+                        "name": "Interference Archive",
+                        "email": "info@interferencearchive.org"
+                    },
+                    "featured": False
+                },
+                venue=Venue(
+                    name="Interference Archive",
+                    address="314 7th St, Brooklyn, NY 11215",
+                    type="Offline"
+                ),
+            ),
+        ).to_dict()
         
         return event
     except Exception as e:
@@ -179,8 +177,7 @@ def main():
     if all_events:
         try:
             output_file = os.path.join(DATA_DIR, 'interference_events.json')
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump({"events": all_events}, f, indent=2, ensure_ascii=False)
+            output_file = event_io.write_events(output_file, all_events)
             logging.info(f"Saved {len(all_events)} events to {output_file}")
             return output_file
         except Exception as e:
@@ -0,0 +1,91 @@
+"""JSON encode/decode for the whole pipeline.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Output is compact unless pretty=True; pretty output is the same
+indent=2 layout json.dump produces. Use pretty for files people read or diff
+(anything committed or published), compact for caches and intermediates.
+Non-ASCII text is written as UTF-8, like json.dump(..., ensure_ascii=False).
+Values JSON cannot represent fall back to str(), as default=str did.
+
+Decode errors are json.JSONDecodeError (orjson's error subclasses it), so
+existing `except json.JSONDecodeError` / `except ValueError` handlers still
+apply.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_options(pretty: bool, sort_keys: bool) -> int:
+    options = _ORJSON_OPTIONS
+    if pretty:
+        options |= orjson.OPT_INDENT_2
+    if sort_keys:
+        options |= orjson.OPT_SORT_KEYS
+    return options
+
+
+def _stdlib_dumps(obj: Any, pretty: bool, sort_keys: bool) -> str:
+    if pretty:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False, default=str)
+    return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys, ensure_ascii=False, default=str)
+
+
+def dumpb(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_orjson_options(pretty, sort_keys))
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib handles those
+            pass
+    return _stdlib_dumps(obj, pretty, sort_keys).encode('utf-8')
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> str:
+    """Encode obj as a JSON string."""
+    if orjson is not None:
+        return dumpb(obj, pretty=pretty, sort_keys=sort_keys).decode('utf-8')
+    return _stdlib_dumps(obj, pretty, sort_keys)
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Decode a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load(path: str) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump(obj: Any, path: str, pretty: bool = False, sort_keys: bool = False) -> None:
+    """
+    Encode obj into path. The file is written under a temporary name and moved
+    into place, so readers never see a partial document.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(dumpb(obj, pretty=pretty, sort_keys=sort_keys))
+    os.replace(tmp_path, path)
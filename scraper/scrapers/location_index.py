@@ -0,0 +1,144 @@
+"""Process-wide index of curated venues from public/data/locations.json.
+
+The file is read once, on first use, and each location's lowercase name,
+full address and street line (address up to the first comma) are computed
+up front, so resolving an event's venue does no I/O and no per-call string
+normalization. The keys are compiled into Aho-Corasick automata, so matching
+is one pass over the venue text however many locations there are. Shared by
+the ICS and Google scrapers and host enrichment.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from . import json_io
+from .pattern_matcher import PatternMatcher
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+LOCATIONS_FILE = os.path.join(PROJECT_ROOT, 'public', 'data', 'locations.json')
+
+
+class LocationKeys(NamedTuple):
+    """Lowercased match keys for one location ('' when the field is missing)."""
+    id: str
+    name: str
+    address: str
+    street: str
+
+
+def load_locations(path: str = LOCATIONS_FILE) -> Dict[str, Dict]:
+    """Read locations.json into {id: location}; {} if it is missing or invalid."""
+    if not os.path.exists(path):
+        logging.warning(f"Locations file not found: {path}")
+        return {}
+    try:
+        return {loc['id']: loc for loc in json_io.load(path).get('locations', [])}
+    except Exception as e:
+        logging.error(f"Error loading locations from {path}: {e}")
+        return {}
+
+
+class LocationIndex:
+    """Precomputed lookup keys over a {id: location} mapping, in file order."""
+
+    def __init__(self, locations: Dict[str, Dict]):
+        self.locations = locations
+        self.keys: List[LocationKeys] = []
+        for loc_id, location in locations.items():
+            name = (location.get('name') or '').lower().strip()
+            address = (location.get('address') or '').lower().strip()
+            street = address.split(',')[0].strip() if address else ''
+            self.keys.append(LocationKeys(loc_id, name, address, street))
+        self._order = {keys.id: position for position, keys in enumerate(self.keys)}
+        self._venue_matcher: Optional[PatternMatcher] = None
+        self._text_matcher: Optional[PatternMatcher] = None
+
+    @property
+    def venue_matcher(self) -> PatternMatcher:
+        """Names, addresses and street lines; priority is the location's position."""
+        if self._venue_matcher is None:
+            self._venue_matcher = PatternMatcher(
+                (pattern, position)
+                for position, keys in enumerate(self.keys)
+                for pattern in (keys.name, keys.address, keys.street)
+            )
+        return self._venue_matcher
+
+    @property
+    def text_matcher(self) -> PatternMatcher:
+        """Names and full addresses only; priority is the location's position."""
+        if self._text_matcher is None:
+            self._text_matcher = PatternMatcher(
+                (pattern, position)
+                for position, keys in enumerate(self.keys)
+                for pattern in (keys.name, keys.address)
+            )
+        return self._text_matcher
+
+    def warm(self) -> None:
+        """Build both matchers now (e.g. in a worker initializer) rather than on the first match."""
+        self.venue_matcher
+        self.text_matcher
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def __contains__(self, loc_id: str) -> bool:
+        return loc_id in self.locations
+
+    def __getitem__(self, loc_id: str) -> Dict:
+        return self.locations[loc_id]
+
+    def get(self, loc_id: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        return self.locations.get(loc_id, default)
+
+    def match(self, venue_name: str, venue_address: str) -> str:
+        """Match venue name/address text to a location id by name, address or street line, or ''."""
+        blob = f"{venue_name or ''} {venue_address or ''}".lower().strip()
+        if not blob or blob.startswith('http'):
+            return ''
+        # Earliest location in file order whose name, address or street line occurs
+        position = self.venue_matcher.first(blob)
+        return '' if position is None else self.keys[position].id
+
+    def match_text(self, text: str, candidate_ids: Optional[Iterable[str]] = None) -> str:
+        """Match free text on location name or full address, trying candidate_ids (in order) or every location."""
+        text = (text or '').lower().strip()
+        if not text:
+            return ''
+        if candidate_ids is None:
+            position = self.text_matcher.first(text)
+            return '' if position is None else self.keys[position].id
+        found = self.text_matcher.find_all(text)
+        for loc_id in candidate_ids:
+            if self._order.get(loc_id) in found:
+                return loc_id
+        return ''
+
+
+_index: Optional[LocationIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_location_index() -> LocationIndex:
+    """The shared index over public/data/locations.json, loaded on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = LocationIndex(load_locations())
+    return _index
+
+
+def as_index(locations: Union[Dict[str, Dict], LocationIndex]) -> LocationIndex:
+    """Return an index for locations, reusing the shared one when it wraps the same mapping."""
+    if isinstance(locations, LocationIndex):
+        return locations
+    if _index is not None and _index.locations is locations:
+        return _index
+    return LocationIndex(locations)
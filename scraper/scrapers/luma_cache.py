@@ -0,0 +1,211 @@
+"""Memoized, TTL-bounded cache of parsed Luma event details.
+
+Entries are keyed by the canonical luma.com URL so the same page linked from
+several calendars (or as lu.ma/...) is fetched and parsed once. Failed and
+missing (404) pages are cached too, for a shorter time, so a dead link isn't
+retried by every calendar that references it. The cache lives in memory for
+the run and is persisted to data/scrapers/cache/luma/ between runs. Scrapers
+running in parallel processes share the file; saves take an exclusive lock
+around the read-merge-write so one process cannot drop another's entries.
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from . import json_io
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; saves there are unlocked
+    fcntl = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+LUMA_CACHE_FILE = os.path.join(PROJECT_ROOT, 'data', 'scrapers', 'cache', 'luma', 'luma_details.json')
+
+# How long parsed details stay fresh (hours, overridable from the environment)
+TTL_SECONDS = float(os.getenv('LUMA_CACHE_TTL_HOURS', '36')) * 3600
+# Pages that returned 404/410 are not retried for this long
+NOT_FOUND_TTL_SECONDS = float(os.getenv('LUMA_CACHE_NOT_FOUND_TTL_HOURS', '72')) * 3600
+# Timeouts, 5xx and parse errors are retried sooner
+FAILURE_TTL_SECONDS = float(os.getenv('LUMA_CACHE_FAILURE_TTL_HOURS', '2')) * 3600
+MAX_ENTRIES = int(os.getenv('LUMA_CACHE_MAX_ENTRIES', '5000'))
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {'lm_source', 'lm_medium', 'lm_campaign', 'ref', 'referrer', 'source'}
+
+
+def canonical_luma_url(url: str) -> Optional[str]:
+    """Normalize a lu.ma / luma.com URL to https://luma.com/<path> without tracking params."""
+    if not url or not isinstance(url, str):
+        return None
+    url = url.strip()
+    if url.startswith('LOCATION:'):
+        url = url[len('LOCATION:'):].strip()
+    parsed = urlparse(url if '://' in url else f'https://{url}')
+    host = (parsed.netloc or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if host not in ('lu.ma', 'luma.com'):
+        return None
+    path = parsed.path.rstrip('/') or '/'
+    query = [
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith('utm_')
+    ]
+    return urlunparse(('https', 'luma.com', path, '', urlencode(query), ''))
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Exclusive advisory lock on path + '.lock', held across processes."""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f'{path}.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class LumaDetailCache:
+    """Thread-safe LRU of canonical URL -> parsed details (or a cached miss)."""
+
+    def __init__(self, path: str = LUMA_CACHE_FILE, max_entries: int = MAX_ENTRIES, version: str = ''):
+        self.path = path
+        self.max_entries = max_entries
+        # Parser output version; entries stored under another version are ignored
+        self.version = version
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            stored = json_io.load(self.path).get('entries', {})
+        except (OSError, ValueError, AttributeError) as e:
+            logging.warning(f'Could not read Luma cache {self.path}: {e}')
+            return
+        now = time.time()
+        # Oldest access first so the LRU order survives a reload
+        for url, entry in sorted(stored.items(), key=lambda item: item[1].get('accessed_at', 0)):
+            if self._is_live(entry, now):
+                self._entries[url] = entry
+        self._evict()
+
+    def _is_live(self, entry: Dict[str, Any], now: float) -> bool:
+        return entry.get('expires_at', 0) > now and entry.get('version', '') == self.version
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get(self, url: str) -> Tuple[bool, Optional[Dict]]:
+        """Return (hit, details). details is None for a cached failure."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or entry.get('expires_at', 0) <= time.time():
+                if entry is not None:
+                    del self._entries[url]
+                    self._dirty = True
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(url)
+            entry['accessed_at'] = time.time()
+            self._dirty = True
+            self.hits += 1
+            return True, copy.deepcopy(entry.get('details'))
+
+    def put(self, url: str, details: Optional[Dict], ttl: float = TTL_SECONDS, status: str = 'ok') -> None:
+        now = time.time()
+        with self._lock:
+            self._entries[url] = {
+                'details': copy.deepcopy(details),
+                'status': status,
+                'fetched_at': now,
+                'accessed_at': now,
+                'expires_at': now + ttl,
+                'version': self.version,
+            }
+            self._entries.move_to_end(url)
+            self._dirty = True
+            self._evict()
+
+    def put_failure(self, url: str, not_found: bool = False) -> None:
+        """Negative-cache a page that 404'd (long TTL) or failed to fetch/parse (short TTL)."""
+        if not_found:
+            self.put(url, None, ttl=NOT_FOUND_TTL_SECONDS, status='not_found')
+        else:
+            self.put(url, None, ttl=FAILURE_TTL_SECONDS, status='error')
+
+    def save(self) -> None:
+        """Persist entries, merging with anything another scraper process wrote meanwhile."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                with _file_lock(self.path):
+                    self._merge_and_write()
+            except OSError as e:
+                logging.warning(f'Could not write Luma cache {self.path}: {e}')
+
+    def _merge_and_write(self) -> None:
+        """Merge our entries into the file on disk. Callers hold self._lock and the file lock."""
+        now = time.time()
+        merged: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            try:
+                merged = json_io.load(self.path).get('entries', {}) or {}
+            except (OSError, ValueError, AttributeError):
+                merged = {}
+        for url, entry in self._entries.items():
+            other = merged.get(url)
+            if other is None or other.get('fetched_at', 0) <= entry.get('fetched_at', 0):
+                merged[url] = entry
+        live = sorted(
+            ((url, entry) for url, entry in merged.items() if self._is_live(entry, now)),
+            key=lambda item: item[1].get('accessed_at', 0),
+        )[-self.max_entries:]
+        json_io.dump({'entries': dict(live)}, self.path)
+        self._dirty = False
+        logging.info(f'Saved {len(live)} Luma cache entries ({self.hits} hits, {self.misses} misses this run)')
+
+
+_cache: Optional[LumaDetailCache] = None
+_cache_pid: Optional[int] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache(version: str = '') -> LumaDetailCache:
+    """Process-wide cache instance, loaded lazily and saved at exit."""
+    global _cache, _cache_pid
+    with _cache_lock:
+        if _cache is None or _cache_pid != os.getpid():
+            _cache = LumaDetailCache(version=version)
+            _cache_pid = os.getpid()
+            atexit.register(_cache.save)
+        return _cache
+
+
+def save() -> None:
+    if _cache is not None and _cache_pid == os.getpid():
+        _cache.save()
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import os
 import re
 import subprocess
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set
 from urllib.parse import urljoin
@@ -15,6 +15,9 @@ from urllib.parse import urljoin
 import pytz
 from bs4 import BeautifulSoup
 
+from . import event_io, event_time
+from .event_model import Event, EventMetadata, Price, Venue
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
 DATA_DIR = os.path.join(PROJECT_ROOT, 'data', 'scrapers')
@@ -133,58 +136,44 @@ def convert_card(card: Dict) -> Optional[Dict]:
         return None
 
     # Skip clearly past events
-    try:
-        if datetime.fromisoformat(start) < datetime.now(pytz.utc) - timedelta(hours=6):
-            return None
-    except Exception:
-        pass
+    start_dt = event_time.parse_datetime(start)
+    if start_dt is not None and start_dt.timestamp() < time.time() - 6 * 3600:
+        return None
 
-    try:
-        end = (datetime.fromisoformat(start) + timedelta(hours=3)).isoformat()
-    except Exception:
-        end = start
+    end = (start_dt + timedelta(hours=3)).isoformat() if start_dt is not None else start
 
     event_id = f"evt_nybio_{hashlib.md5(f'{title}{start}'.encode()).hexdigest()[:8]}"
     categories = card.get('industries') or ['Biotech', 'Life Sciences']
-    return {
-        'id': event_id,
-        'name': title,
-        'type': 'Tech',
-        'locationId': '',
-        'communityId': COMMUNITY_ID,
-        'description': card.get('description') or '',
-        'startDate': start,
-        'endDate': end,
-        'category': categories[:6],
-        'price': {
-            'amount': 0,
-            'type': 'Paid',
-            'currency': 'USD',
-            'details': 'See registration link for pricing',
-        },
-        'capacity': None,
-        'registrationRequired': True,
-        'tags': ['biotech', 'life sciences', 'nyc'],
-        'image': '',
-        'status': 'upcoming',
-        'metadata': {
-            'source': 'New York Bio Connect',
-            'source_url': card.get('url') or LISTING_URL,
-            'organizer': {
-                'name': 'New York Bio Connect',
-                'website': BASE_URL,
+    return Event(
+        id=event_id,
+        name=title,
+        type='Tech',
+        location_id='',
+        community_id=COMMUNITY_ID,
+        description=card.get('description') or '',
+        start_date=start,
+        end_date=end,
+        category=categories[:6],
+        price=Price(type='Paid', details='See registration link for pricing'),
+        capacity=None,
+        registration_required=True,
+        tags=['biotech', 'life sciences', 'nyc'],
+        image='',
+        metadata=EventMetadata(
+            source_url=card.get('url') or LISTING_URL,
+            extra={
+                'source': 'New York Bio Connect',
+                'organizer': {
+                    'name': 'New York Bio Connect',
+                    'website': BASE_URL,
+                },
+                'featured': (card.get('status') or '').lower() in ('coming up', 'new'),
+                'event_format': card.get('event_type') or '',
+                'industries': card.get('industries') or [],
             },
-            'venue': {
-                'name': 'NYC',
-                'address': 'New York, NY',
-                'type': card.get('event_type') or 'Event Venue',
-            },
-            'featured': (card.get('status') or '').lower() in ('coming up', 'new'),
-            'event_format': card.get('event_type') or '',
-            'industries': card.get('industries') or [],
-        },
-    }
-
+            venue=Venue(name='NYC', address='New York, NY', type=card.get('event_type') or 'Event Venue'),
+        ),
+    ).to_dict()
 
 def main() -> Optional[str]:
     os.makedirs(DATA_DIR, exist_ok=True)
@@ -224,8 +213,7 @@ def main() -> Optional[str]:
     events.sort(key=lambda e: e.get('startDate') or '')
 
     output_file = os.path.join(DATA_DIR, 'ny_bio_connect_events.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({'events': events}, f, indent=2, ensure_ascii=False)
+    output_file = event_io.write_events(output_file, events)
     logging.info(f'Saved {len(events)} New York Bio Connect events to {output_file}')
     return output_file
 
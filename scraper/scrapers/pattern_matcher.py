@@ -0,0 +1,91 @@
+"""Aho-Corasick multi-pattern matcher for literal substrings.
+
+All patterns are compiled into one automaton, so finding which of them occur
+in a text is a single pass over the text, independent of how many patterns
+there are. Each pattern carries an integer priority; first() returns the
+lowest priority found, which reproduces "first pattern in list order that
+occurs in the text" without trying the patterns one by one.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+_NO_MATCH = float('inf')
+
+
+class PatternMatcher:
+    """Compiled set of (pattern, priority) pairs. Empty patterns are ignored."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, int]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own: List[List[int]] = [[]]
+        # Nearest state on the failure chain that ends a pattern (0 = none)
+        self._output_link: List[int] = [0]
+        # Lowest priority ending at this state or anywhere on its failure chain
+        self._best: List[float] = [_NO_MATCH]
+        for pattern, priority in patterns:
+            if pattern:
+                self._add(pattern, priority)
+        self._build()
+
+    def _add(self, pattern: str, priority: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+                self._output_link.append(0)
+                self._best.append(_NO_MATCH)
+            state = next_state
+        self._own[state].append(priority)
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._best[state] = min(self._own[state], default=_NO_MATCH)
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                self._output_link[child] = fail if self._own[fail] else self._output_link[fail]
+                self._best[child] = min(min(self._own[child], default=_NO_MATCH), self._best[fail])
+
+    def _states(self, text: str) -> Iterator[int]:
+        goto, fail = self._goto, self._fail
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            yield state
+
+    def first(self, text: str) -> Optional[int]:
+        """Lowest priority among the patterns occurring in text, or None."""
+        best = _NO_MATCH
+        for state in self._states(text):
+            if self._best[state] < best:
+                best = self._best[state]
+        return None if best == _NO_MATCH else int(best)
+
+    def find_all(self, text: str) -> Set[int]:
+        """Priorities of every pattern occurring in text."""
+        found: Set[int] = set()
+        for state in self._states(text):
+            if not self._own[state]:
+                state = self._output_link[state]
+            while state:
+                found.update(self._own[state])
+                state = self._output_link[state]
+        return found
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import os
 import re
@@ -11,9 +10,11 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 import pytz
-import requests
 from bs4 import BeautifulSoup
 
+from . import event_io, http_cache, json_io
+from .event_model import Event, EventMetadata, Price, Venue
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
 DATA_DIR = os.path.join(PROJECT_ROOT, 'data', 'scrapers')
@@ -25,6 +26,8 @@ HEADERS = {
 }
 BASE_URL = 'https://pioneerworks.org'
 NY_TZ = pytz.timezone('America/New_York')
+# Bump when _parse_calendar changes so cached calendar parses are discarded
+CALENDAR_PARSE_VERSION = '1'
 
 
 def generate_event_id(title: str, start: str) -> str:
@@ -66,13 +69,24 @@ def _slug_to_url_map(soup: BeautifulSoup) -> Dict[str, str]:
     return mapping
 
 
-def _future_events_from_next_data(html: str) -> List[Dict]:
+def _next_data_events(html: str) -> List[Dict]:
     match = re.search(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', html, re.S)
     if not match:
         logging.error('Pioneer Works calendar missing __NEXT_DATA__')
         return []
-    payload = json.loads(match.group(1))
-    raw_events = payload.get('props', {}).get('pageProps', {}).get('events') or []
+    payload = json_io.loads(match.group(1))
+    return payload.get('props', {}).get('pageProps', {}).get('events') or []
+
+
+def _parse_calendar(response) -> Dict:
+    """Card URLs by slug and every event in the page data, before the date filter."""
+    return {
+        'slug_urls': _slug_to_url_map(BeautifulSoup(response.text, 'html.parser')),
+        'events': _next_data_events(response.text),
+    }
+
+
+def _future_events(raw_events: List[Dict]) -> List[Dict]:
     today = datetime.now(NY_TZ).date()
     future: List[Dict] = []
     for event in raw_events:
@@ -104,57 +118,52 @@ def transform_event(raw: Dict, url: str) -> Dict:
     end_iso = _parse_local_datetime(end_date, end_time)
 
     slug = (raw.get('slug') or {}).get('current') or ''
-    return {
-        'id': generate_event_id(title, start_iso or start_date),
-        'name': title,
-        'type': 'Cultural Event',
-        'locationId': 'loc_pioneer_works',
-        'communityId': 'com_pioneer_works',
-        'description': '',
-        'startDate': start_iso,
-        'endDate': end_iso,
-        'category': ['Arts', 'Music', 'Science'],
-        'price': {
-            'amount': 0,
-            'type': 'Paid',
-            'currency': 'USD',
-            'details': 'See Pioneer Works for ticket details',
-        },
-        'capacity': None,
-        'registrationRequired': True,
-        'tags': [],
-        'image': raw.get('image') or '',
-        'status': 'upcoming',
-        'metadata': {
-            'source': 'Pioneer Works',
-            'source_url': url or f'{BASE_URL}/calendar',
-            'organizer': {
-                'name': 'Pioneer Works',
-                'instagram': '@pioneerworks',
-                'email': 'info@pioneerworks.org',
-                'website': BASE_URL,
-            },
-            'venue': {
-                'name': 'Pioneer Works',
-                'address': '159 Pioneer Street, Brooklyn, NY 11231',
-                'type': 'Cultural Institution',
+    return Event(
+        id=generate_event_id(title, start_iso or start_date),
+        name=title,
+        type='Cultural Event',
+        location_id='loc_pioneer_works',
+        community_id='com_pioneer_works',
+        description='',
+        start_date=start_iso,
+        end_date=end_iso,
+        category=['Arts', 'Music', 'Science'],
+        price=Price(type='Paid', details='See Pioneer Works for ticket details'),
+        capacity=None,
+        registration_required=True,
+        tags=[],
+        image=raw.get('image') or '',
+        metadata=EventMetadata(
+            source_url=url or f'{BASE_URL}/calendar',
+            extra={
+                'source': 'Pioneer Works',
+                'organizer': {
+                    'name': 'Pioneer Works',
+                    'instagram': '@pioneerworks',
+                    'email': 'info@pioneerworks.org',
+                    'website': BASE_URL,
+                },
+                'featured': False,
+                'slug': slug,
             },
-            'featured': False,
-            'slug': slug,
-        },
-    }
+            venue=Venue(
+                name='Pioneer Works',
+                address='159 Pioneer Street, Brooklyn, NY 11231',
+                type='Cultural Institution',
+            ),
+        ),
+    ).to_dict()
 
 
 def main() -> Optional[str]:
     os.makedirs(DATA_DIR, exist_ok=True)
     calendar_url = f'{BASE_URL}/calendar'
     logging.info(f'Fetching Pioneer Works calendar: {calendar_url}')
-    response = requests.get(calendar_url, headers=HEADERS, timeout=30)
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, 'html.parser')
-    slug_urls = _slug_to_url_map(soup)
-    raw_events = _future_events_from_next_data(response.text)
+    # An unchanged calendar (304) reuses the page parsed on a previous run; the
+    # date filter still runs every time
+    calendar = http_cache.fetch_parsed(calendar_url, _parse_calendar, CALENDAR_PARSE_VERSION, headers=HEADERS, timeout=30)
+    slug_urls = calendar['slug_urls']
+    raw_events = _future_events(calendar['events'])
     logging.info(f'Found {len(raw_events)} upcoming Pioneer Works events')
 
     events: List[Dict] = []
@@ -164,8 +173,7 @@ def main() -> Optional[str]:
         events.append(transform_event(raw, url))
 
     output_file = os.path.join(DATA_DIR, 'pioneer_works_events.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({'events': events}, f, indent=2, ensure_ascii=False)
+    output_file = event_io.write_events(output_file, events)
     logging.info(f'Saved {len(events)} Pioneer Works events to {output_file}')
     return output_file
 
@@ -1,23 +1,70 @@
+import html as html_lib
 import json
 import logging
 import re
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
 
+from . import http_cache, json_io, luma_cache
+from .luma_cache import canonical_luma_url
 
-def _parse_luma_json_ld(soup: BeautifulSoup) -> Dict:
-    """Extract host + venue from Luma's schema.org Event JSON-LD when present."""
-    parsed: Dict = {}
-    for script in soup.find_all('script', attrs={'type': 'application/ld+json'}):
-        raw = script.string or script.get_text() or ''
+# Bump when get_luma_event_details output changes so cached parses (HTTP cache and
+# Luma detail cache) are discarded
+LUMA_PARSE_VERSION = '3'
+# Threads used by get_luma_event_details_batch; http_client still caps requests per host
+LUMA_FETCH_WORKERS = 8
+
+
+# Raw-HTML scanners for the fast path, so most pages never need a DOM
+_JSON_LD_RE = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']application/ld\+json["\'][^>]*>(.*?)</script\s*>',
+    re.I | re.S,
+)
+_GUESTS_STRING_RE = re.compile(r'<div\b[^>]*\bclass="[^"]*\bguests-string\b[^"]*"[^>]*>(.*?)</div>', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+_IMG_TAG_RE = re.compile(r'<img\b[^>]*>', re.I)
+_ATTR_RE = re.compile(r'([\w-]+)\s*=\s*(["\'])(.*?)\2', re.S)
+_SCRIPT_RE = re.compile(r'<script\b.*?</script\s*>', re.I | re.S)
+
+# Details the JSON-LD must supply before the DOM-based fallbacks can be skipped
+REQUIRED_JSON_LD_FIELDS = ('title', 'full_description', 'location_details')
+# Page sections JSON-LD never covers (date line, categories, speakers, social
+# links) plus the ticket box used when it has no offers; the fast path builds a
+# DOM of just these, see _parse_page_sections and _parse_price
+_PAGE_SECTIONS = SoupStrainer(
+    'div',
+    class_=re.compile(r'(?:^|\s)jsx-(?:2370077516|3250441484|3733653009|1428039309|681273248)(?:\s|$)'),
+)
+# Phrases Luma shows instead of a street address for hidden or online venues
+_NO_ADDRESS_PHRASES = ('Register to See Address', 'Online Event')
+
+
+def _iter_json_ld_blocks(html: str):
+    """Yield each decoded application/ld+json block straight from the raw HTML."""
+    for match in _JSON_LD_RE.finditer(html or ''):
+        raw = match.group(1)
         if not raw.strip():
             continue
         try:
-            data = json.loads(raw)
+            yield json_io.loads(raw)
         except json.JSONDecodeError:
             continue
 
+
+def _make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Build a DOM with lxml when installed (much faster), else the stdlib parser."""
+    try:
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(html, 'html.parser', parse_only=parse_only)
+
+
+def _parse_luma_json_ld(html: str) -> Dict:
+    """Extract host + venue from Luma's schema.org Event JSON-LD when present."""
+    parsed: Dict = {}
+    for data in _iter_json_ld_blocks(html):
         candidates = data if isinstance(data, list) else [data]
         for item in candidates:
             if not isinstance(item, dict):
@@ -108,153 +155,260 @@ def _parse_luma_json_ld(soup: BeautifulSoup) -> Dict:
 
 
 def get_luma_event_details(event_url: str) -> Optional[Dict]:
-    """Fetch detailed event information from Luma event page"""
+    """Fetch detailed event information from Luma event page.
+
+    Results (including 404s and failures) are memoized per canonical luma.com URL
+    in luma_cache, so repeat lookups within and across runs skip the fetch.
+    """
+    # Make sure we have a valid URL
+    if not event_url or not isinstance(event_url, str):
+        return None
+
+    # Ensure URL is a Luma URL (legacy lu.ma or current luma.com) and normalize it
+    canonical_url = canonical_luma_url(event_url)
+    if not canonical_url:
+        return None
+
+    cache = luma_cache.get_cache(LUMA_PARSE_VERSION)
+    hit, details = cache.get(canonical_url)
+    if hit:
+        logging.debug(f"Luma cache hit for {canonical_url}")
+        return details
+
     try:
-        # Make sure we have a valid URL
-        if not event_url or not isinstance(event_url, str):
-            return None
-            
-        # Normalize URL format if needed
-        if event_url.startswith('LOCATION:'):
-            event_url = event_url.replace('LOCATION:', '')
-            
-        # Ensure URL is a Luma URL (legacy lu.ma or current luma.com)
-        if 'lu.ma' not in event_url and 'luma.com' not in event_url:
-            return None
+        details = _fetch_luma_event_details(canonical_url)
+    except requests.HTTPError as e:
+        status = e.response.status_code if e.response is not None else None
+        logging.error(f"Error fetching Luma event details: {e}")
+        cache.put_failure(canonical_url, not_found=status in (404, 410))
+        return None
+    except Exception as e:
+        logging.error(f"Error fetching Luma event details: {e}")
+        cache.put_failure(canonical_url)
+        return None
 
-        # Normalize legacy host
-        event_url = event_url.replace('https://lu.ma/', 'https://luma.com/').replace('http://lu.ma/', 'https://luma.com/')
-            
-        logging.info(f"Fetching details from Luma event URL: {event_url}")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(event_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+    cache.put(canonical_url, details)
+    return details
+
+
+def get_luma_event_details_batch(event_urls: Iterable[str], max_workers: int = LUMA_FETCH_WORKERS) -> Dict[str, Optional[Dict]]:
+    """Fetch details for many Luma URLs concurrently.
+
+    Returns {url: details-or-None} for every distinct input URL. Each URL is
+    fetched at most once; per-host politeness is enforced by http_client.
+    """
+    unique_urls = list(dict.fromkeys(url for url in event_urls if url))
+    if not unique_urls:
+        return {}
+    if len(unique_urls) == 1 or max_workers <= 1:
+        return {url: get_luma_event_details(url) for url in unique_urls}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls)), thread_name_prefix='luma') as pool:
+        return dict(zip(unique_urls, pool.map(get_luma_event_details, unique_urls)))
+
+
+def _fetch_luma_event_details(event_url: str) -> Dict:
+    """Fetch and parse a (canonical) Luma event page. Raises on HTTP or parse errors."""
+    logging.info(f"Fetching details from Luma event URL: {event_url}")
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    response = http_cache.fetch(event_url, headers=headers, timeout=10)
+    response.raise_for_status()
+    if response.from_cache:
+        cached_details = http_cache.load_parsed(event_url, LUMA_PARSE_VERSION)
+        if cached_details is not None:
+            return cached_details
+    html = response.text
+
+    # Prefer structured JSON-LD (host calendar + venue) when Luma provides it
+    details = _parse_luma_json_ld(html)
+    if _json_ld_is_complete(details):
+        details = _finish_from_raw_html(html, details)
+    else:
+        details = _finish_from_dom(_make_soup(html), details)
+
+    http_cache.store_parsed(event_url, details, LUMA_PARSE_VERSION)
+    return details
+
+
+def _json_ld_is_complete(details: Dict) -> bool:
+    """True when the JSON-LD already covers the fields we need, so the DOM can be skipped."""
+    if not all(details.get(field) for field in REQUIRED_JSON_LD_FIELDS):
+        return False
+    location = details['location_details']
+    return location.get('type') == 'Online' or bool(location.get('venue_name'))
+
+
+def _finish_from_raw_html(html: str, details: Dict) -> Dict:
+    """
+    Fast path: the attendee count comes from a regex over the raw HTML, and
+    the other non-JSON-LD fields from a DOM of only the sections that hold them.
+    """
+    guests = _GUESTS_STRING_RE.search(html)
+    if guests:
+        # Extract number from text like "212 Going"
+        match = re.search(r'(\d+)\s+Going', _TAG_RE.sub('', guests.group(1)))
+        if match:
+            details['actual_capacity'] = int(match.group(1))
+    soup = _make_soup(html, parse_only=_PAGE_SECTIONS)
+    _parse_page_sections(soup, details)
+
+    # JSON-LD without an address: same hidden/online venue check as the DOM path
+    location_details = details['location_details']
+    if location_details.get('type') != 'Online' and not location_details.get('address'):
+        page_text = _SCRIPT_RE.sub('', html)
+        if any(phrase in page_text for phrase in _NO_ADDRESS_PHRASES):
+            location_details['type'] = 'Online'
+
+    if not details.get('image_url'):
+        img_src = _eager_image_src(html)
+        if img_src:
+            details['image_url'] = img_src
+
+    if 'price_info' not in details:
+        details['price_info'] = _parse_price(soup)
+    return details
+
+
+def _eager_image_src(html: str) -> Optional[str]:
+    """src of the first <img fetchpriority="auto" loading="eager"> in the raw HTML (the event cover)."""
+    for match in _IMG_TAG_RE.finditer(html):
+        attrs = {name.lower(): html_lib.unescape(value) for name, _, value in _ATTR_RE.findall(match.group(0))}
+        if attrs.get('fetchpriority') == 'auto' and attrs.get('loading') == 'eager':
+            return attrs.get('src') or None
+    return None
+
+
+def _parse_price(soup: BeautifulSoup) -> Dict:
+    """Price from the ticket box; free unless it shows a dollar amount."""
+    price_info = {
+        "amount": 0,
+        "type": "Free",
+        "currency": "USD",
+        "details": ""
+    }
+
+    price_elem = soup.select_one('div.jsx-681273248.cta-wrapper')
+    if price_elem:
+        price_text = price_elem.get_text(strip=True)
+        if any(term in price_text.lower() for term in ['$', 'usd', 'pay']):
+            # Try to extract the price
+            price_match = re.search(r'\$(\d+(\.\d+)?)', price_text)
+            if price_match:
+                price_info = {
+                    "amount": float(price_match.group(1)),
+                    "type": "Paid",
+                    "currency": "USD",
+                    "details": price_text
+                }
+    return price_info
+
+
+def _parse_page_sections(soup: BeautifulSoup, details: Dict) -> None:
+    """Date line, categories, speakers and social links from the rendered page."""
+    # Get event date and time
+    date_elem = soup.select_one('div.jsx-2370077516.title.text-ellipses')
+    if date_elem and not date_elem.select_one('div.shimmer'):
+        details['date_display'] = date_elem.get_text(strip=True)
         
-        # Prefer structured JSON-LD (host calendar + venue) when Luma provides it
-        details = _parse_luma_json_ld(soup)
+    # Get event categories
+    categories = []
+    category_elems = soup.select('div.jsx-3250441484.event-categories a')
+    for cat in category_elems:
+        category_text = cat.get_text(strip=True)
+        if category_text:
+            categories.append(category_text)
+    details['categories'] = categories
         
-        # Get event title
-        if not details.get('title'):
-            title_elem = soup.find('h1', {'class': 'title'})
-            if title_elem:
-                details['title'] = title_elem.get_text(strip=True)
+    # Get speaker details
+    speakers = []
+    speaker_divs = soup.select('div.jsx-3733653009.flex-center.gap-2')
+    for speaker in speaker_divs:
+        speaker_name = speaker.select_one('div.jsx-3733653009.fw-medium.text-ellipses')
+        if speaker_name:
+            speakers.append({
+                'name': speaker_name.get_text(strip=True),
+                'title': '',  # Could parse from description if available
+                'bio': ''     # Could parse from description if available
+            })
+    if speakers and not details.get('speakers'):
+        details['speakers'] = speakers
+    
+    # Get social media links
+    social_links = []
+    social_divs = soup.select('div.jsx-1428039309.social-links a')
+    for link in social_divs:
+        href = link.get('href')
+        if href:
+            social_links.append(href)
+    details['social_links'] = social_links
+
+
+def _finish_from_dom(soup: BeautifulSoup, details: Dict) -> Dict:
+    """Slow path: CSS-selector fallbacks for pages whose JSON-LD is missing or partial."""
+
+    # Get event title
+    if not details.get('title'):
+        title_elem = soup.find('h1', {'class': 'title'})
+        if title_elem:
+            details['title'] = title_elem.get_text(strip=True)
+    
+    # Get full description/about section
+    if not details.get('full_description'):
+        about_section = soup.find('div', {'class': 'spark-content'})
+        if about_section:
+            details['full_description'] = about_section.get_text(strip=True)
         
-        # Get full description/about section
-        if not details.get('full_description'):
-            about_section = soup.find('div', {'class': 'spark-content'})
-            if about_section:
-                details['full_description'] = about_section.get_text(strip=True)
+    # Get actual capacity/attendee count
+    attendees_div = soup.find('div', {'class': 'guests-string'})
+    if attendees_div:
+        attendee_text = attendees_div.get_text(strip=True)
+        # Extract number from text like "212 Going"
+        match = re.search(r'(\d+)\s+Going', attendee_text)
+        if match:
+            details['actual_capacity'] = int(match.group(1))
             
-        # Get actual capacity/attendee count
-        attendees_div = soup.find('div', {'class': 'guests-string'})
-        if attendees_div:
-            attendee_text = attendees_div.get_text(strip=True)
-            # Extract number from text like "212 Going"
-            match = re.search(r'(\d+)\s+Going', attendee_text)
-            if match:
-                details['actual_capacity'] = int(match.group(1))
-                
-        # Get detailed location info (CSS fallback when JSON-LD lacked it)
-        location_details = details.get('location_details') or {
-            'venue_name': '',
-            'address': '',
-            'room': '',
-            'additional_info': '',
-            'type': 'Offline'  # Default to offline
-        }
-        
-        location_div = soup.select('div.jsx-4155675949.content-card:-soup-contains("Location")')
-        if location_div and not location_details.get('venue_name'):
-            # Get venue name
-            venue_name = soup.select_one('div.jsx-33066475.info div:first-child')
-            if venue_name:
-                location_details['venue_name'] = venue_name.get_text(strip=True)
-                
-            # Get address
-            address = soup.select_one('div.jsx-33066475.text-tinted.fs-sm.mt-1')
-            if address:
-                location_details['address'] = address.get_text(strip=True)
-                
-            # Check if this is an online event
-            if 'Register to See Address' in soup.text or 'Online Event' in soup.text:
-                location_details['type'] = 'Online'
-                
-        details['location_details'] = location_details
+    # Get detailed location info (CSS fallback when JSON-LD lacked it)
+    location_details = details.get('location_details') or {
+        'venue_name': '',
+        'address': '',
+        'room': '',
+        'additional_info': '',
+        'type': 'Offline'  # Default to offline
+    }
+    
+    location_div = soup.select('div.jsx-4155675949.content-card:-soup-contains("Location")')
+    if location_div and not location_details.get('venue_name'):
+        # Get venue name
+        venue_name = soup.select_one('div.jsx-33066475.info div:first-child')
+        if venue_name:
+            location_details['venue_name'] = venue_name.get_text(strip=True)
             
-        # Get event date and time
-        date_elem = soup.select_one('div.jsx-2370077516.title.text-ellipses')
-        if date_elem and not date_elem.select_one('div.shimmer'):
-            details['date_display'] = date_elem.get_text(strip=True)
+        # Get address
+        address = soup.select_one('div.jsx-33066475.text-tinted.fs-sm.mt-1')
+        if address:
+            location_details['address'] = address.get_text(strip=True)
             
-        # Get event categories
-        categories = []
-        category_elems = soup.select('div.jsx-3250441484.event-categories a')
-        for cat in category_elems:
-            category_text = cat.get_text(strip=True)
-            if category_text:
-                categories.append(category_text)
-        details['categories'] = categories
+        # Check if this is an online event
+        page_text = soup.text
+        if any(phrase in page_text for phrase in _NO_ADDRESS_PHRASES):
+            location_details['type'] = 'Online'
             
-        # Get speaker details
-        speakers = []
-        speaker_divs = soup.select('div.jsx-3733653009.flex-center.gap-2')
-        for speaker in speaker_divs:
-            speaker_name = speaker.select_one('div.jsx-3733653009.fw-medium.text-ellipses')
-            if speaker_name:
-                speakers.append({
-                    'name': speaker_name.get_text(strip=True),
-                    'title': '',  # Could parse from description if available
-                    'bio': ''     # Could parse from description if available
-                })
-        if speakers and not details.get('speakers'):
-            details['speakers'] = speakers
-        
-        # Get social media links
-        social_links = []
-        social_divs = soup.select('div.jsx-1428039309.social-links a')
-        for link in social_divs:
-            href = link.get('href')
-            if href:
-                social_links.append(href)
-        details['social_links'] = social_links
-        
-        # Get event image URL
-        if not details.get('image_url'):
-            image_elem = soup.select_one('img[fetchPriority="auto"][loading="eager"]')
-            if image_elem:
-                img_src = image_elem.get('src')
-                if img_src:
-                    details['image_url'] = img_src
-                
-        # Extract price information
-        if 'price_info' not in details:
-            price_info = {
-                "amount": 0,
-                "type": "Free",
-                "currency": "USD",
-                "details": ""
-            }
+    details['location_details'] = location_details
+
+    _parse_page_sections(soup, details)
+
+    # Get event image URL
+    if not details.get('image_url'):
+        image_elem = soup.select_one('img[fetchPriority="auto"][loading="eager"]')
+        if image_elem:
+            img_src = image_elem.get('src')
+            if img_src:
+                details['image_url'] = img_src
             
-            price_elem = soup.select_one('div.jsx-681273248.cta-wrapper')
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                if any(term in price_text.lower() for term in ['$', 'usd', 'pay']):
-                    # Try to extract the price
-                    price_match = re.search(r'\$(\d+(\.\d+)?)', price_text)
-                    if price_match:
-                        price_info = {
-                            "amount": float(price_match.group(1)),
-                            "type": "Paid",
-                            "currency": "USD",
-                            "details": price_text
-                        }
-            details['price_info'] = price_info
-        
-        return details
-        
-    except Exception as e:
-        logging.error(f"Error fetching Luma event details: {e}")
-        return None 
\ No newline at end of file
+    # Extract price information
+    if 'price_info' not in details:
+        details['price_info'] = _parse_price(soup)
+    
+    return details
+ 
\ No newline at end of file
@@ -1,5 +1,4 @@
 import os
-import json
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
@@ -9,7 +8,8 @@ import google.generativeai as genai
 from dotenv import load_dotenv
 import pyshorteners
 import re
-import requests # Added for shorten_url function
+
+from scraper.scrapers import event_io, event_time, http_client
 
 load_dotenv()
 
@@ -44,20 +44,24 @@ else:
     logging.warning("GEMINI_API_KEY not found in environment variables. Tweet generation will use fallback.")
 
 def load_events(events_file='combined_events.json'):
-    """Load events from the events file."""
+    """Yield events from the events file ({"events": [...]} document or NDJSON), reading it incrementally."""
     try:
         # After moving, SCRIPT_DIR is 'scraper', DATA_DIR is 'scraper/data' (defined as os.path.join(SCRIPT_DIR, 'data'))
         # combined_events.json is expected in DATA_DIR.
         file_path = os.path.join(DATA_DIR, events_file)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('events', [])
+        yield from event_io.iter_events(file_path)
     except Exception as e:
         logging.error(f"Error loading events: {e}")
-        return []
+
+# Names used by the tweet test fixtures
+_TEST_EVENT_NAMES = ('Valid Event', 'No Date Event', 'Invalid URL Event')
 
 def get_events_for_target_day_ny(events, target_day_for_filtering_ny):
-    """Filter events that occur on the specified target_day_for_filtering_ny in New York time."""
+    """
+    Filter events that occur on the specified target_day_for_filtering_ny in New York time.
+    events may be any iterable (such as load_events()); it is read once and
+    only the matching events are kept.
+    """
     ny_tz = pytz.timezone('America/New_York')
     
     # Ensure target_day_for_filtering_ny is the start of the day in NY
@@ -67,49 +71,41 @@ def get_events_for_target_day_ny(events, target_day_for_filtering_ny):
     logging.info(f"Filtering events for NY date: {day_start_ny.strftime('%Y-%m-%d')}, " +
                  f"Window (NYT): {day_start_ny.isoformat()} to {day_end_ny.isoformat()}")
 
-    # Check if this is test data (assuming test data has specific event names)
-    is_test_data = any(event.get('name') in ['Valid Event', 'No Date Event', 'Invalid URL Event'] for event in events)
-    
-    if is_test_data:
-        logging.info("Test data detected - including all test events with valid dates, ignoring target day for tests.")
-        upcoming_for_test = []
-        for event in events:
-            if event.get('startDate'):
-                upcoming_for_test.append(event)
-                logging.info(f"Including test event: {event.get('name')}")
-        return upcoming_for_test
-    
+    lower, upper = event_time.ny_day_bounds(day_start_ny.date())
     upcoming_on_target_day = []
+    dated_test_events = []
+    is_test_data = False
+    total = 0
     skipped_no_date = 0
     skipped_date_parsing = 0
-    skipped_outside_target_day = 0
-    
     for event in events:
-        try:
+        total += 1
+        # Test data is recognised by its event names
+        if event.get('name') in _TEST_EVENT_NAMES:
+            is_test_data = True
+            if event.get('startDate'):
+                dated_test_events.append(event)
+        start = event_time.to_epoch(event.get('startDate'))
+        if start is None:
             if not event.get('startDate'):
                 logging.warning(f"Skipping event without start date: {event.get('name', 'Unknown')}")
                 skipped_no_date += 1
-                continue
-                
-            start_date_str = event['startDate'].replace('Z', '+00:00') # Ensure ISO format compatibility
-            event_start_utc = datetime.fromisoformat(start_date_str)
-            
-            if event_start_utc.tzinfo is None: # Should ideally always have tzinfo from source
-                event_start_utc = pytz.utc.localize(event_start_utc)
-                
-            # Convert event start time to New York time
-            event_start_ny = event_start_utc.astimezone(ny_tz)
-            
-            if day_start_ny <= event_start_ny < day_end_ny:
-                upcoming_on_target_day.append(event)
-                logging.info(f"Including event: {event.get('name')} starting at {event_start_ny.isoformat()} (NYT)")
             else:
-                skipped_outside_target_day += 1
-                logging.debug(f"Skipping event: {event.get('name')} starting at {event_start_ny.isoformat()} (NYT) - outside target day window.")
-        except Exception as e:
-            logging.warning(f"Error processing date for event {event.get('name')}: {e}")
-            skipped_date_parsing += 1
+                skipped_date_parsing += 1
             continue
+        if lower <= start < upper:
+            upcoming_on_target_day.append(event)
+            event_start_ny = datetime.fromtimestamp(start, ny_tz)
+            logging.info(f"Including event: {event.get('name')} starting at {event_start_ny.isoformat()} (NYT)")
+    logging.info(f"Loaded {total} events total")
+    
+    if is_test_data:
+        logging.info("Test data detected - including all test events with valid dates, ignoring target day for tests.")
+        for event in dated_test_events:
+            logging.info(f"Including test event: {event.get('name')}")
+        return dated_test_events
+    
+    skipped_outside_target_day = total - len(upcoming_on_target_day) - skipped_no_date - skipped_date_parsing
             
     logging.info(f"Event processing for {day_start_ny.strftime('%Y-%m-%d')} (NYT) summary: " +
                  f"{len(upcoming_on_target_day)} included, " +
@@ -125,7 +121,7 @@ def shorten_url(url):
         return '#'
     
     try:
-        response = requests.get(f"http://tinyurl.com/api-create.php?url={url}")
+        response = http_client.get(f"http://tinyurl.com/api-create.php?url={url}")
         if response.status_code == 200:
             return response.text.strip()
         else:
@@ -205,15 +201,14 @@ def generate_tweet_with_gemini(event):
 
         # Attempt to format date nicely if possible
         formatted_date = "Date not specified"  # Default value
-        try:
-            if start_date_str != 'Not specified':
-                dt_obj = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
+        if start_date_str != 'Not specified':
+            dt_obj = event_time.parse_datetime(start_date_str)
+            if dt_obj is not None:
                 # Convert to NY time and format without timezone abbreviation
-                ny_tz = pytz.timezone('America/New_York')
-                dt_ny = dt_obj.astimezone(ny_tz)
+                dt_ny = dt_obj.astimezone(event_time.NY_TZ)
                 formatted_date = dt_ny.strftime("%A, %B %d at %I:%M %p").replace(" 0", " ")  # Remove leading zero from hour
-        except ValueError:
-            formatted_date = start_date_str # Fallback to original string if parsing fails
+            else:
+                formatted_date = start_date_str # Fallback to original string if parsing fails
 
         prompt = f"""Create an engaging and concise tweet for the following NYC tech event.
         The event is: {event_name}
@@ -292,8 +287,8 @@ def post_to_twitter(tweet_text, api_key, api_secret, access_token, access_token_
 def main():
     """Main function to generate tweets and post them as a thread."""
     try:
+        # Read lazily: only the target day's events are kept
         events = load_events()
-        logging.info(f"Loaded {len(events)} events total")
         
         # Determine the target date for the tweet header and event filtering
         # This will be two days from the script's current run date in New York
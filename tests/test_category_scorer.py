@@ -0,0 +1,56 @@
+import importlib
+import random
+
+import pytest
+
+
+@pytest.fixture
+def categorize(tmp_path, monkeypatch):
+    # categorize_events opens its log file in the working directory on import
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module('scraper.categorize_events')
+
+
+def _texts(categories):
+    keywords = sorted({
+        keyword
+        for cat_data in categories.values()
+        for keyword in cat_data['keywords'] + [k for ks in cat_data['subcategories'].values() for k in ks]
+    })
+    rng = random.Random(3)
+    return ['', 'maintain a chair', 'startup founders pitch at the art show'] + [
+        ' '.join(rng.choice(keywords + ['the', 'nyc', 'night']) for _ in range(rng.randint(1, 8)))
+        for _ in range(500)
+    ]
+
+
+def test_scores_match_testing_each_keyword_list(categorize):
+    scorer = categorize.CategoryScorer()
+    categories = categorize.CATEGORIES
+    for text in _texts(categories):
+        main_scores, sub_scores = scorer.score(text)
+        for cat_name, cat_data in categories.items():
+            expected = sum(keyword in text for keyword in cat_data['keywords'])
+            assert main_scores[cat_name] == scorer.category_scores(text)[cat_name] == expected
+            own_scores = scorer.subcategory_scores(text, cat_name)
+            for subcat_name, subcat_keywords in cat_data['subcategories'].items():
+                expected = sum(keyword in text for keyword in subcat_keywords)
+                assert sub_scores[(cat_name, subcat_name)] == own_scores[subcat_name] == expected
+
+
+def test_categorize_batch_matches_get_event_category(categorize):
+    events = [{'summary': text, 'description': ''} for text in _texts(categorize.CATEGORIES)]
+    events.append({'summary': 'x', 'description': '', 'category': {'type': 'Tech', 'subCategory': 'Kept'}})
+    assert categorize.categorize_batch(events) == [categorize.get_event_category(event) for event in events]
+
+
+@pytest.mark.parametrize('use_scipy', [True, False])
+def test_keyword_matrix_matches_substring_tests(categorize, monkeypatch, use_scipy):
+    if not use_scipy:
+        monkeypatch.setattr(categorize, 'sparse', None)
+    scorer = categorize.CategoryScorer()
+    texts = _texts(categorize.CATEGORIES) + ['tech talks\nat the hub', 'wordtechword', 'a  b']
+    matrix = scorer.keyword_matrix(texts)
+    dense = matrix.toarray() if use_scipy else matrix
+    for row, text in enumerate(texts):
+        assert sorted(dense[row].nonzero()[0]) == sorted(scorer.matched_keywords(text))
@@ -0,0 +1,80 @@
+import importlib
+import json
+import sqlite3
+
+import pytest
+
+from scraper.event_store import EventStore
+
+
+@pytest.fixture
+def run_all(tmp_path, monkeypatch):
+    # run_all opens scraper.log in the working directory on import
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module('scraper.run_all')
+    monkeypatch.setattr(module, 'EventStore', lambda: EventStore(str(tmp_path / 'events.sqlite3')))
+    return module
+
+
+def _write(path, events):
+    path.write_text(json.dumps({'events': events}), encoding='utf-8')
+    return str(path)
+
+
+def _inputs(tmp_path):
+    first = _write(tmp_path / 'b_events.json', [
+        {'id': 'x', 'name': 'Past', 'startDate': '2001-01-01T10:00:00Z', 'image': 'past.jpg'},
+        {'id': 'y', 'name': 'No image or end', 'startDate': '2099-01-01T10:00:00Z'},
+    ])
+    second = _write(tmp_path / 'a_events.json', [
+        {'id': 'x', 'name': 'Same id, other source', 'startDate': '2000-01-01T10:00:00Z'},
+        {'name': 'No id'},
+    ])
+    broken = tmp_path / 'broken_events.json'
+    broken.write_text('{"events": [{"id": "z", "name": "Half"}, {"id": ', encoding='utf-8')
+    return [first, second, str(broken), str(tmp_path / 'missing_events.json'), True]
+
+
+def _combined_events(run_all, tmp_path, inputs):
+    output = tmp_path / 'combined_events.json'
+    assert run_all.combine_event_files(inputs, str(output)) == str(output)
+    return json.loads(output.read_text(encoding='utf-8'))
+
+
+def test_output_is_the_readable_files_concatenated_in_order(run_all, tmp_path):
+    combined = _combined_events(run_all, tmp_path, _inputs(tmp_path))
+    # Past events, repeated ids and events the store rejects are all kept, in file order;
+    # the truncated file contributes nothing rather than its first event
+    assert [event.get('name') for event in combined['events']] == [
+        'Past', 'No image or end', 'Same id, other source', 'No id',
+    ]
+    assert 'imageManifest' in combined
+
+
+def test_output_does_not_depend_on_the_store(run_all, tmp_path, monkeypatch):
+    expected = _combined_events(run_all, tmp_path, _inputs(tmp_path))['events']
+
+    def unavailable():
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(run_all, 'EventStore', unavailable)
+    assert _combined_events(run_all, tmp_path, _inputs(tmp_path))['events'] == expected
+
+
+def test_store_expires_sources_without_output(run_all, tmp_path):
+    inputs = _inputs(tmp_path)
+    _combined_events(run_all, tmp_path, inputs)
+    _combined_events(run_all, tmp_path, inputs[1:2])
+    with sqlite3.connect(str(tmp_path / 'events.sqlite3')) as conn:
+        assert [json.loads(data)['name'] for (data,) in conn.execute('SELECT data FROM events')] == ['Same id, other source']
+
+
+def test_store_failure_mid_file_keeps_the_output_whole(run_all, tmp_path, monkeypatch):
+    expected = _combined_events(run_all, tmp_path, _inputs(tmp_path))['events']
+
+    def failing_replace(self, source, events):
+        next(iter(events))
+        raise sqlite3.OperationalError('disk I/O error')
+
+    monkeypatch.setattr(EventStore, 'replace_source', failing_replace)
+    assert _combined_events(run_all, tmp_path, _inputs(tmp_path))['events'] == expected
@@ -0,0 +1,35 @@
+import importlib
+
+import pytest
+
+
+@pytest.fixture
+def categorize(tmp_path, monkeypatch):
+    # categorize_events opens its log file in the working directory on import
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module('scraper.categorize_events')
+
+
+def _event(name, start, url, community='com_ai', category=None):
+    return {
+        'id': url,
+        'name': name,
+        'startDate': start,
+        'communityId': community,
+        'locationId': '',
+        'category': category or ['Tech'],
+        'metadata': {'source_url': url, 'venue': {'name': '', 'address': '', 'type': 'Offline'}},
+    }
+
+
+def test_deduplicate_events_merges_across_sources(categorize):
+    events = [
+        _event('Untitled Event', '2026-03-10T18:00:00-04:00', 'https://cal/placeholder'),
+        _event('AI Engineers - Devs & Drinks', '2026-03-10T18:00:00-04:00', 'https://lu.ma/devs', category=['Tech', 'AI']),
+        _event('AI Engineers - Devs & Drinks', '2026-03-10T18:00:00-04:00', 'https://lu.ma/devs-copy'),
+        _event('AI Engineers: Devs and Drinks', '2026-03-10T19:00:00-04:00', 'https://www.garysguide.com/e/1', category=['Networking']),
+        _event('Pottery for Beginners', '2026-03-10T18:00:00-04:00', 'https://lu.ma/pottery'),
+    ]
+    result = categorize.deduplicate_events(events)
+    assert [event['name'] for event in result] == ['AI Engineers - Devs & Drinks', 'Pottery for Beginners']
+    assert result[0]['metadata']['source_url'] == 'https://lu.ma/devs'
@@ -0,0 +1,98 @@
+import pytest
+
+from scraper.scrapers import event_io
+from scraper.scrapers.event_model import (
+    Event,
+    EventMetadata,
+    EventValidationError,
+    Price,
+    Venue,
+    decode_event,
+    encode_event,
+    normalize_event,
+)
+
+
+def _event_dict():
+    return {
+        'id': 'evt_test_1',
+        'name': 'Hack Night',
+        'type': 'Tech',
+        'locationId': 'loc_fractal',
+        'communityId': 'com_fractal',
+        'description': 'Build things',
+        'startDate': '2026-03-08T18:00:00-05:00',
+        'endDate': '2026-03-08T21:00:00-05:00',
+        'category': ['Tech', 'AI'],
+        'price': {'amount': 10.0, 'type': 'Paid', 'currency': 'USD', 'details': 'At the door'},
+        'capacity': 40,
+        'registrationRequired': True,
+        'tags': ['hack'],
+        'image': 'hack.jpg',
+        'status': 'upcoming',
+        'metadata': {
+            'source': 'Google Calendar',
+            'source_url': 'https://lu.ma/hack',
+            'organizer': {'name': 'Fractal'},
+            'venue': {'name': 'Fractal Tech', 'address': '111 Conselyea St', 'type': 'Offline'},
+            'speakers': [{'name': 'Ada'}],
+        },
+    }
+
+
+def test_round_trip_reproduces_dict_and_key_order():
+    data = _event_dict()
+    encoded = encode_event(decode_event(data))
+    assert encoded == data
+    assert list(encoded) == list(data)
+    assert list(encoded['metadata']) == list(data['metadata'])
+
+
+def test_decode_fills_defaults_and_timestamps():
+    event = decode_event({'id': 'evt_2', 'startDate': '2026-03-08', 'metadata': {'venue': 'Somewhere'}})
+    assert event.end_date == '2026-03-08'
+    assert event.price == Price()
+    assert event.metadata.venue == Venue(name='Somewhere')
+    assert event.tags == [] and event.status == 'upcoming'
+    # Date-only: midnight UTC to 23:59:59 UTC
+    assert event.end_ts - event.start_ts == 24 * 3600 - 1
+
+
+def test_event_built_in_code_puts_source_url_first_and_venue_last():
+    encoded = Event(
+        id='evt_3',
+        name='Talk',
+        start_date='2026-03-08T18:00:00Z',
+        metadata=EventMetadata(source_url='https://x', extra={'source': 'Test', 'featured': False}),
+    ).to_dict()
+    assert list(encoded['metadata']) == ['source_url', 'source', 'featured', 'venue']
+    assert encoded['price'] == {'amount': 0, 'type': 'Free', 'currency': 'USD', 'details': ''}
+
+
+def test_unknown_top_level_keys_are_dropped():
+    data = _event_dict()
+    data['lumaUrl'] = 'https://lu.ma/hack'
+    assert 'lumaUrl' not in normalize_event(data)
+
+
+@pytest.mark.parametrize('change, message', [
+    ({'id': ''}, 'id'),
+    ({'startDate': 'next tuesday'}, 'startDate'),
+    ({'capacity': 'lots'}, 'capacity'),
+    ({'tags': 'hack'}, 'tags'),
+    ({'metadata': {'venue': 3}}, 'metadata.venue'),
+])
+def test_invalid_events_are_rejected(change, message):
+    data = _event_dict()
+    data.update(change)
+    with pytest.raises(EventValidationError, match=message):
+        decode_event(data)
+
+
+def test_writer_logs_and_skips_invalid_events(tmp_path, caplog):
+    invalid = dict(_event_dict(), id='evt_bad', startDate='next tuesday')
+    path = event_io.write_events(str(tmp_path / 'x_events.json'), [_event_dict(), invalid], fmt='json')
+    assert [event['id'] for event in event_io.iter_events(path)] == ['evt_test_1']
+    messages = [record.getMessage() for record in caplog.records if record.levelname == 'WARNING']
+    assert any('evt_bad' in message and 'startDate' in message for message in messages)
+    assert any('skipped 1 invalid' in message for message in messages)
@@ -0,0 +1,65 @@
+import sqlite3
+
+import pytest
+
+from scraper.event_store import EventStore, source_name
+
+
+def _event(event_id, name='Meetup', start='2026-03-08T18:00:00-05:00'):
+    return {'id': event_id, 'name': name, 'startDate': start, 'metadata': {'source_url': f'https://x/{event_id}'}}
+
+
+def _stored_ids(store):
+    with sqlite3.connect(store.path) as conn:
+        return [event_id for (event_id,) in conn.execute('SELECT id FROM events ORDER BY id')]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with EventStore(str(tmp_path / 'events.sqlite3')) as store:
+        yield store
+
+
+def test_replace_source_counts_written_unchanged_and_deleted(store):
+    counts = store.replace_source('fabrik', [_event('a'), _event('b'), _event('c')])
+    assert counts == {'written': 3, 'unchanged': 0, 'skipped': 0, 'deleted': 0}
+
+    counts = store.replace_source('fabrik', [_event('a'), _event('b', name='Renamed')])
+    assert counts == {'written': 1, 'unchanged': 1, 'skipped': 0, 'deleted': 1}
+    assert _stored_ids(store) == ['a', 'b']
+
+
+def test_repeated_id_in_a_source_counts_once(store):
+    counts = store.replace_source('gcal', [_event('a'), _event('a')])
+    assert (counts['written'], counts['unchanged']) == (1, 0)
+    counts = store.replace_source('gcal', [_event('a'), _event('a')])
+    assert (counts['written'], counts['unchanged']) == (0, 1)
+
+
+def test_invalid_events_are_skipped(store):
+    counts = store.replace_source('gcal', [_event('a'), {'id': 'b'}])
+    assert (counts['written'], counts['skipped']) == (1, 1)
+
+
+def test_failed_snapshot_is_rolled_back(store):
+    store.replace_source('gcal', [_event('a')])
+
+    def broken():
+        yield _event('b')
+        raise ValueError('truncated file')
+
+    with pytest.raises(ValueError):
+        store.replace_source('gcal', broken())
+    assert _stored_ids(store) == ['a']
+
+
+def test_expire_sources_removes_sources_not_seen(store):
+    store.replace_source('fabrik', [_event('a'), _event('b')])
+    store.replace_source('gcal', [_event('c')])
+    assert store.expire_sources(['gcal']) == 2
+    assert _stored_ids(store) == ['c']
+    assert store.expire_sources(['gcal']) == 0
+
+
+def test_source_name():
+    assert source_name('/tmp/data/fabrik_events.ndjson') == 'fabrik_events'
@@ -0,0 +1,61 @@
+from datetime import date, datetime
+
+import numpy as np
+import pytz
+
+from scraper.scrapers import event_time
+
+
+def _epoch(value):
+    return event_time.to_epoch(value)
+
+
+def test_parsing_conventions():
+    assert _epoch('2026-03-08T18:00:00Z') == _epoch('2026-03-08T18:00:00+00:00')
+    # Naive values are UTC, with either separator
+    assert _epoch('2026-03-08 18:00') == _epoch('2026-03-08T18:00:00Z')
+    assert event_time.to_epoch('2026-03-08', end_of_day=True) - _epoch('2026-03-08') == 24 * 3600 - 1
+    assert _epoch('not a date') is None and _epoch('') is None
+
+
+def test_ny_day_bounds_across_dst():
+    start, end = event_time.ny_day_bounds(date(2026, 3, 8))
+    assert end - start == 23 * 3600
+    start, end = event_time.ny_day_bounds(date(2026, 11, 1))
+    assert end - start == 25 * 3600
+    start, _ = event_time.ny_day_bounds(date(2026, 7, 4))
+    assert datetime.fromtimestamp(start, pytz.utc).hour == 4
+
+
+def test_ny_day_mask_uses_new_york_midnight():
+    events = [
+        {'startDate': '2026-03-08T23:30:00-04:00'},  # late evening NY, already the 9th in UTC
+        {'startDate': '2026-03-08T00:30:00-05:00'},  # just after NY midnight, before the DST jump
+        {'startDate': '2026-03-09T00:00:00-04:00'},  # next NY day
+        {'startDate': '2026-03-08T02:00:00Z'},       # still the 7th in New York
+        {'startDate': ''},
+    ]
+    starts, _ = event_time.time_arrays(events)
+    assert event_time.ny_day_mask(starts, date(2026, 3, 8)).tolist() == [True, True, False, False, False]
+
+
+def test_future_mask_and_missing_values():
+    events = [
+        {'startDate': '2026-11-01T01:30:00-04:00', 'endDate': '2026-11-01T01:30:00-05:00'},
+        {'startDate': '2026-11-01'},
+        {'startDate': 'garbage'},
+    ]
+    starts, ends = event_time.time_arrays(events)
+    assert np.isnan(starts[2]) and np.isnan(ends[2])
+    # The repeated 01:30 hour: the second one is an hour after the first
+    assert ends[0] - starts[0] == 3600
+    now = _epoch('2026-11-01T12:00:00Z')
+    assert event_time.future_mask(ends, now).tolist() == [False, True, False]
+    assert event_time.filter_future(events, now) == [events[1]]
+    assert event_time.is_future(events[1], now) and not event_time.is_future(events[2], now)
+
+
+def test_window_mask_includes_overlapping_events():
+    starts = np.array([0.0, 100.0, 200.0, np.nan])
+    ends = np.array([50.0, 150.0, 300.0, np.nan])
+    assert event_time.window_mask(starts, ends, 120.0, 200.0).tolist() == [False, True, False, False]
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from scraper.scrapers import google_calendar_scraper as gcal, json_io
+
+
+class FakeCalendar:
+    """Stands in for the Calendar API client, recording each events().list call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def events(self):
+        return self
+
+    def list(self, **params):
+        self.calls.append(params)
+        return self
+
+    def execute(self, http=None):
+        return {'items': [], 'nextSyncToken': f'token{len(self.calls)}'}
+
+
+@pytest.fixture
+def calendar(tmp_path, monkeypatch):
+    fake = FakeCalendar()
+    monkeypatch.setattr(gcal, 'API_KEY', 'key')
+    monkeypatch.setattr(gcal, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(gcal, 'get_calendar_service', lambda: fake)
+    monkeypatch.setattr(gcal, '_thread_http', lambda: None)
+    return fake
+
+
+def _seed_cache(time_max):
+    # A previous run that knows one item, so its sync token would be reused
+    cache = {
+        'calendar_id': 'cal',
+        'sync_token': 'stored',
+        'raw_events': {'g1': {'fingerprint': 'x', 'end': '', 'event_id': None}},
+        'events': [],
+    }
+    if time_max is not None:
+        cache['sync_window'] = {'time_min': '2000-01-01T00:00:00+00:00', 'time_max': time_max.isoformat()}
+    json_io.dump(cache, gcal._calendar_cache_file('com'))
+
+
+def test_full_sync_stores_its_window(calendar):
+    gcal.fetch_google_calendar_events('cal', 'com')
+    params = calendar.calls[0]
+    assert 'syncToken' not in params
+    cache = json_io.load(gcal._calendar_cache_file('com'))
+    assert cache['sync_token'] == 'token1'
+    assert cache['sync_window'] == {'time_min': params['timeMin'], 'time_max': params['timeMax']}
+
+
+def test_sync_token_is_used_while_the_window_reaches_the_horizon(calendar):
+    _seed_cache(datetime.now(pytz.utc) + gcal.GCAL_SYNC_HORIZON + timedelta(days=1))
+    gcal.fetch_google_calendar_events('cal', 'com')
+    assert calendar.calls[0]['syncToken'] == 'stored'
+    assert 'timeMax' not in calendar.calls[0]
+
+
+@pytest.mark.parametrize('days_short', [1, None])
+def test_full_sync_once_the_window_falls_short_of_the_horizon(calendar, days_short):
+    time_max = None if days_short is None else datetime.now(pytz.utc) + gcal.GCAL_SYNC_HORIZON - timedelta(days=days_short)
+    _seed_cache(time_max)
+    gcal.fetch_google_calendar_events('cal', 'com')
+    params = calendar.calls[0]
+    assert 'syncToken' not in params
+    assert datetime.fromisoformat(params['timeMax']) >= datetime.now(pytz.utc) + gcal.GCAL_SYNC_HORIZON
@@ -0,0 +1,129 @@
+import os
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from scraper.scrapers import http_cache, http_client
+
+URL = 'https://example.com/events.ics'
+
+
+def _response(status, content=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = 'utf-8'
+    response.url = URL
+    return response
+
+
+class FakeServer:
+    """Stands in for http_client.get, answering from a queue and recording request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, 'CACHE_DIR', str(tmp_path / 'http'))
+    monkeypatch.setattr(http_cache, '_cache_bytes', None)
+    fake = FakeServer()
+    monkeypatch.setattr(http_client, 'get', fake.get)
+    return fake
+
+
+def test_304_is_answered_from_disk(server):
+    server.responses = [
+        _response(200, b'BEGIN:VCALENDAR', {'ETag': '"v1"', 'Last-Modified': 'Mon, 02 Mar 2026 10:00:00 GMT', 'Content-Type': 'text/calendar'}),
+        _response(304),
+    ]
+    first = http_cache.fetch(URL)
+    assert first.from_cache is False and first.content == b'BEGIN:VCALENDAR'
+    assert server.requests[0] == {}
+
+    second = http_cache.fetch(URL, headers={'Accept': 'text/calendar'})
+    assert server.requests[1] == {
+        'Accept': 'text/calendar',
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 02 Mar 2026 10:00:00 GMT',
+    }
+    assert second.from_cache is True
+    assert second.status_code == 200
+    assert second.content == b'BEGIN:VCALENDAR'
+    assert second.headers['Content-Type'] == 'text/calendar'
+
+
+def test_parsed_payload_is_dropped_when_the_body_changes(server):
+    server.responses = [
+        _response(200, b'v1', {'ETag': '"v1"'}),
+        _response(304),
+        _response(200, b'v2', {'ETag': '"v2"'}),
+    ]
+    http_cache.fetch(URL)
+    http_cache.store_parsed(URL, {'events': 1}, version='1')
+    assert http_cache.fetch(URL).from_cache is True
+    assert http_cache.load_parsed(URL, version='1') == {'events': 1}
+    assert http_cache.load_parsed(URL, version='2') is None
+
+    changed = http_cache.fetch(URL)
+    assert changed.from_cache is False and changed.content == b'v2'
+    assert http_cache.load_parsed(URL, version='1') is None
+
+
+def test_responses_without_validators_are_not_cached(server):
+    server.responses = [_response(200, b'fresh'), _response(200, b'fresh again')]
+    http_cache.fetch(URL)
+    http_cache.fetch(URL)
+    assert server.requests == [{}, {}]
+    http_cache.store_parsed(URL, {'events': 1})
+    assert http_cache.load_parsed(URL) is None
+
+
+def test_304_without_a_cached_body_is_returned_as_is(server):
+    server.responses = [_response(304)]
+    response = http_cache.fetch(URL)
+    assert response.status_code == 304 and response.from_cache is False
+
+
+def test_304_whose_body_vanished_is_fetched_again_without_validators(server, monkeypatch):
+    server.responses = [_response(200, b'v1', {'ETag': '"v1"'}), _response(304), _response(200, b'v1', {'ETag': '"v1"'})]
+    http_cache.fetch(URL)
+
+    def evicted_in_flight(url, headers=None, **kwargs):
+        # The entry is evicted between reading its metadata and the 304 arriving
+        if 'If-None-Match' in headers:
+            os.remove(http_cache._paths(URL)['body'])
+        return server.get(url, headers=headers, **kwargs)
+
+    monkeypatch.setattr(http_client, 'get', evicted_in_flight)
+    response = http_cache.fetch(URL, headers={'Accept': 'text/html'})
+    assert response.status_code == 200 and response.content == b'v1' and response.from_cache is False
+    assert server.requests[1]['If-None-Match'] == '"v1"'
+    assert server.requests[2] == {'Accept': 'text/html'}
+
+
+def test_fetch_parsed_skips_parsing_an_unchanged_body(server):
+    server.responses = [_response(200, b'a b', {'ETag': '"v1"'}), _response(304)]
+    parses = []
+
+    def parse(response):
+        parses.append(response.content)
+        return response.text.split()
+
+    assert http_cache.fetch_parsed(URL, parse, version='1') == ['a', 'b']
+    assert http_cache.fetch_parsed(URL, parse, version='1') == ['a', 'b']
+    assert parses == [b'a b']
+
+
+def test_fetch_parsed_raises_for_http_errors(server):
+    server.responses = [_response(500)]
+    with pytest.raises(requests.HTTPError):
+        http_cache.fetch_parsed(URL, lambda response: response.text)
@@ -0,0 +1,52 @@
+import json
+
+from scraper.scrapers import utils
+
+
+def _page(json_ld, body):
+    return (
+        '<html><head><script type="application/ld+json">' + json.dumps(json_ld) + '</script></head>'
+        '<body>' + body + '</body></html>'
+    )
+
+
+JSON_LD = {
+    '@type': 'Event',
+    'name': 'Founders Night',
+    'description': 'Talks and drinks',
+    'location': {'@type': 'Place', 'name': 'Secret Loft'},
+}
+
+BODY = (
+    '<div class="jsx-4155675949 content-card"><div>Location</div>'
+    '<div class="jsx-33066475 info"><div>Secret Loft</div></div>'
+    '<div>Register to See Address</div></div>'
+    '<img fetchPriority="auto" loading="eager" src="https://images.lu.ma/cover.png?w=1&amp;h=2">'
+    '<div class="jsx-681273248 cta-wrapper"><span>Get Ticket</span><span>$25.00</span></div>'
+)
+
+
+def test_fast_path_falls_back_to_the_page_for_fields_json_ld_lacks():
+    html = _page(JSON_LD, BODY)
+    details = utils._parse_luma_json_ld(html)
+    assert utils._json_ld_is_complete(details)
+    details = utils._finish_from_raw_html(html, details)
+
+    assert details['price_info'] == {'amount': 25.0, 'type': 'Paid', 'currency': 'USD', 'details': 'Get Ticket$25.00'}
+    assert details['image_url'] == 'https://images.lu.ma/cover.png?w=1&h=2'
+    assert details['location_details']['type'] == 'Online'
+
+
+def test_json_ld_fields_win_over_the_page():
+    json_ld = dict(
+        JSON_LD,
+        image='https://images.lu.ma/ld.png',
+        offers={'price': 0, 'priceCurrency': 'USD'},
+        location={'@type': 'Place', 'name': 'Secret Loft', 'address': {'streetAddress': '1 Main St'}},
+    )
+    html = _page(json_ld, BODY)
+    details = utils._finish_from_raw_html(html, utils._parse_luma_json_ld(html))
+
+    assert details['price_info']['type'] == 'Free'
+    assert details['image_url'] == 'https://images.lu.ma/ld.png'
+    assert details['location_details']['type'] == 'Offline'
@@ -0,0 +1,72 @@
+from scraper.near_duplicates import find_near_duplicate_groups, minhash_signature, title_shingles
+
+
+def _event(name, start, community='com_ai', location='', url=''):
+    return {
+        'name': name,
+        'startDate': start,
+        'communityId': community,
+        'locationId': location,
+        'metadata': {'source_url': url},
+    }
+
+
+def test_signature_estimates_similarity():
+    first = minhash_signature(title_shingles('AI Engineers - Devs & Drinks'))
+    assert (first == minhash_signature(title_shingles('ai engineers: devs and drinks!'))).mean() > 0.6
+    assert (first == minhash_signature(title_shingles('Pottery for Beginners'))).mean() < 0.3
+
+
+def test_groups_listings_of_one_event_across_sources():
+    events = [
+        _event('AI Engineers - Devs & Drinks', '2026-03-10T18:00:00-04:00', url='https://lu.ma/devs'),
+        _event('Pottery for Beginners', '2026-03-10T18:00:00-04:00'),
+        _event('AI Engineers: Devs and Drinks', '2026-03-10T19:30:00-04:00', url='https://www.garysguide.com/events/1'),
+        _event('AI Engineers - Devs & Drinks', '2026-03-10', url='https://calendar.google.com/x'),
+    ]
+    assert find_near_duplicate_groups(events) == [[0, 2, 3]]
+
+
+def test_listings_across_new_york_midnight_are_grouped():
+    events = [
+        _event('Late Night Jazz Jam', '2026-03-10T23:30:00-04:00', url='https://a.example/jam'),
+        _event('Late Night Jazz Jam', '2026-03-11T00:30:00-04:00', url='https://b.example/jam'),
+    ]
+    assert find_near_duplicate_groups(events) == [[0, 1]]
+
+
+def test_distinct_events_are_not_grouped():
+    events = [
+        # Too far apart in time
+        _event('Founder Breakfast', '2026-03-10T08:00:00-04:00'),
+        _event('Founder Breakfast', '2026-03-10T13:00:00-04:00'),
+        # Same generic title, different organizers and venues
+        _event('Fall Orientation', '2026-09-09T18:30:00-04:00', community='com_a', location='loc_a'),
+        _event('Fall Orientation', '2026-09-09T18:30:00-04:00', community='com_b', location='loc_b'),
+        # Two pages on the same site are two listings
+        _event('September Nexus Networking Meet Up', '2026-09-20T18:00:00-04:00', url='https://www.garysguide.com/events/1'),
+        _event('October Nexus Networking Meet Up', '2026-09-20T18:00:00-04:00', url='https://www.garysguide.com/events/2'),
+        # Date-only values must share the calendar day
+        _event('Open Studio', '2026-03-12', url='https://a.example/open'),
+        _event('Open Studio', '2026-03-13', url='https://b.example/open'),
+    ]
+    assert find_near_duplicate_groups(events) == []
+
+
+def test_pages_on_one_site_stay_apart_through_a_shared_listing():
+    # The calendar listing matches both Luma pages, but they are two events
+    events = [
+        _event('AI Engineers - Devs & Drinks', '2026-03-10T18:00:00-04:00', url='https://luma.com/devs-1'),
+        _event('AI Engineers - Devs & Drinks', '2026-03-10T18:30:00-04:00', url='https://luma.com/devs-2'),
+        _event('AI Engineers - Devs & Drinks', '2026-03-10T18:00:00-04:00', url='https://calendar.google.com/x'),
+    ]
+    groups = find_near_duplicate_groups(events)
+    assert len(groups) == 1 and len(groups[0]) == 2 and 2 in groups[0]
+
+
+def test_shared_venue_is_enough():
+    events = [
+        _event('Soldering Workshop: LED Tile', '2026-09-06T12:00:00-04:00', community='com_a', location='loc_resistor'),
+        _event('HOLD: Soldering Workshop: LED Tile', '2026-09-06T13:00:00-04:00', community='com_b', location='loc_resistor'),
+    ]
+    assert find_near_duplicate_groups(events) == [[0, 1]]
@@ -0,0 +1,35 @@
+import random
+
+from scraper.scrapers.pattern_matcher import PatternMatcher
+
+
+def test_first_returns_lowest_priority_not_earliest_position():
+    matcher = PatternMatcher([('fractal', 0), ('brooklyn', 1)])
+    assert matcher.first('brooklyn at fractal tech') == 0
+    assert matcher.first('somewhere in brooklyn') == 1
+    assert matcher.first('queens') is None
+
+
+def test_patterns_found_through_failure_links():
+    matcher = PatternMatcher([('hers', 0), ('he', 1), ('she', 2), ('his', 3)])
+    assert matcher.find_all('ushers') == {0, 1, 2}
+    assert matcher.first('ushe') == 1
+    assert matcher.find_all('this') == {3}
+
+
+def test_duplicate_and_empty_patterns():
+    matcher = PatternMatcher([('', 0), ('soho', 2), ('soho', 1)])
+    assert matcher.first('anywhere') is None
+    assert matcher.first('soho house') == 1
+    assert matcher.find_all('soho house') == {1, 2}
+
+
+def test_matches_brute_force():
+    rng = random.Random(7)
+    patterns = [(''.join(rng.choice('abc') for _ in range(rng.randint(1, 4))), i) for i in range(40)]
+    matcher = PatternMatcher(patterns)
+    for _ in range(300):
+        text = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 12)))
+        expected = {priority for pattern, priority in patterns if pattern in text}
+        assert matcher.find_all(text) == expected
+        assert matcher.first(text) == (min(expected) if expected else None)